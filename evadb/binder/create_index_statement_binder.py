@@ -14,7 +14,12 @@
 # limitations under the License.
 from evadb.binder.binder_utils import BinderError, create_row_num_tv_expr
 from evadb.binder.statement_binder import StatementBinder
-from evadb.catalog.catalog_type import NdArrayType, VectorStoreType
+from evadb.catalog.catalog_type import (
+    ColumnType,
+    NdArrayType,
+    TableType,
+    VectorStoreType,
+)
 from evadb.expression.function_expression import FunctionExpression
 from evadb.parser.create_index_statement import CreateIndexStatement
 from evadb.third_party.databases.interface import get_database_handler
@@ -63,6 +68,31 @@ def bind_create_index(binder: StatementBinder, node: CreateIndexStatement):
         # underlying native storage engine.
         return
 
+    if node.vector_store_type == VectorStoreType.BTREE:
+        # BTREE index is built by the sql storage engine on a scalar column.
+        table_ref_obj = node.table_ref.table.table_obj
+        if table_ref_obj.table_type != TableType.STRUCTURED_DATA:
+            raise BinderError("BTREE index can only be created on structured tables.")
+        if func_project_expr is not None:
+            raise BinderError("BTREE index cannot be created on a function output.")
+        col_list = [
+            col for col in table_ref_obj.columns if col.name == node.col_list[0].name
+        ]
+        if len(col_list) != 1:
+            raise BinderError(
+                f"Index is created on non-existent column {node.col_list[0].name}"
+            )
+        if col_list[0].type not in [
+            ColumnType.BOOLEAN,
+            ColumnType.INTEGER,
+            ColumnType.FLOAT,
+            ColumnType.TEXT,
+        ]:
+            raise BinderError(
+                f"BTREE index cannot be created on {col_list[0].type} column."
+            )
+        return
+
     # Index can be only created on single column.
     assert (
         len(node.col_list) == 1
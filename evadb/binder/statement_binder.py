@@ -28,11 +28,12 @@ from evadb.binder.binder_utils import (
 )
 from evadb.binder.statement_binder_context import StatementBinderContext
 from evadb.catalog.catalog_type import ColumnType, TableType
-from evadb.catalog.catalog_utils import is_document_table
+from evadb.catalog.catalog_utils import is_document_table, is_video_table
 from evadb.catalog.sql_config import RESTRICTED_COL_NAMES
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
 from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.parser.analyze_statement import AnalyzeTableStatement
 from evadb.parser.create_function_statement import CreateFunctionStatement
 from evadb.parser.create_index_statement import CreateIndexStatement
 from evadb.parser.create_statement import ColumnDefinition, CreateTableStatement
@@ -240,6 +241,16 @@ class StatementBinder:
             node.old_table_ref.table.table_obj.table_type != TableType.STRUCTURED_DATA
         ), "Rename not yet supported on structured data"
 
+    @bind.register(AnalyzeTableStatement)
+    def _bind_analyze_table_statement(self, node: AnalyzeTableStatement):
+        self.bind(node.table_ref)
+        table_obj = node.table_ref.table.table_obj
+        if table_obj.table_type != TableType.STRUCTURED_DATA:
+            raise BinderError(
+                f"ANALYZE is only supported on structured tables, {table_obj.name} "
+                f"is of type {table_obj.table_type}"
+            )
+
     @bind.register(TableRef)
     def _bind_tableref(self, node: TableRef):
         if node.is_table_atom():
@@ -248,6 +259,13 @@ class StatementBinder:
                 node.alias.alias_name, node.table.database_name, node.table.table_name
             )
             bind_table_info(self._catalog(), node.table)
+            if node.frame_size is not None:
+                assert is_video_table(
+                    node.table.table_obj
+                ), "RESIZE is only supported for VIDEO tables."
+                assert all(
+                    isinstance(dim, int) and dim > 0 for dim in node.frame_size
+                ), "RESIZE width and height must be positive integers."
         elif node.is_select():
             current_context = self._binder_context
             self._binder_context = StatementBinderContext(self._catalog)
@@ -27,12 +27,16 @@ from evadb.catalog.catalog_utils import (
     construct_function_cache_catalog_entry,
     get_document_table_column_definitions,
     get_image_table_column_definitions,
+    get_media_manifest_column_definitions,
+    get_pdf_metadata_table_column_definitions,
     get_pdf_table_column_definitions,
+    get_video_metadata_table_column_definitions,
     get_video_table_column_definitions,
     xform_column_definitions_to_catalog_entries,
 )
 from evadb.catalog.models.utils import (
     ColumnCatalogEntry,
+    ColumnStatisticsCatalogEntry,
     DatabaseCatalogEntry,
     FunctionCacheCatalogEntry,
     FunctionCatalogEntry,
@@ -48,6 +52,9 @@ from evadb.catalog.models.utils import (
     truncate_catalog_tables,
 )
 from evadb.catalog.services.column_catalog_service import ColumnCatalogService
+from evadb.catalog.services.column_statistics_catalog_service import (
+    ColumnStatisticsCatalogService,
+)
 from evadb.catalog.services.configuration_catalog_service import (
     ConfigurationCatalogService,
 )
@@ -96,6 +103,9 @@ class CatalogManager(object):
         )
         self._table_catalog_service = TableCatalogService(self._sql_config.session)
         self._column_service = ColumnCatalogService(self._sql_config.session)
+        self._column_statistics_service = ColumnStatisticsCatalogService(
+            self._sql_config.session
+        )
         self._function_service = FunctionCatalogService(self._sql_config.session)
         self._function_cost_catalog_service = FunctionCostCatalogService(
             self._sql_config.session
@@ -468,6 +478,26 @@ class CatalogManager(object):
         col_entries = self._column_service.filter_entries_by_table(table_obj)
         return col_entries
 
+    "Column statistics catalog services"
+
+    def upsert_column_statistics_catalog_entries(
+        self, entries: List[ColumnStatisticsCatalogEntry]
+    ):
+        """Insert or replace the statistics collected by ANALYZE.
+
+        Arguments:
+            entries (List[ColumnStatisticsCatalogEntry]): statistics, one per column
+        """
+        self._column_statistics_service.upsert_entries(entries)
+
+    def get_column_statistics_catalog_entry(
+        self, column: ColumnCatalogEntry
+    ) -> ColumnStatisticsCatalogEntry:
+        """Returns the statistics of the column, None if ANALYZE was never run."""
+        if column is None or column.row_id is None:
+            return None
+        return self._column_statistics_service.get_entry_by_column_id(column.row_id)
+
     "function catalog services"
 
     def insert_function_catalog_entry(
@@ -753,6 +783,11 @@ class CatalogManager(object):
         assert obj is None, "Table with name {media_metadata_name} already exists"
 
         columns = [ColumnDefinition("file_url", ColumnType.TEXT, None, None)]
+        columns += get_media_manifest_column_definitions()
+        if input_table.table_type == TableType.VIDEO_DATA:
+            columns += get_video_metadata_table_column_definitions()
+        elif input_table.table_type == TableType.PDF_DATA:
+            columns += get_pdf_metadata_table_column_definitions()
         obj = self.create_and_insert_table_catalog_entry(
             TableInfo(media_metadata_name),
             columns,
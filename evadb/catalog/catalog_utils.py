@@ -81,6 +81,47 @@ def get_video_table_column_definitions() -> List[ColumnDefinition]:
     return columns
 
 
+def get_media_manifest_column_definitions() -> List[ColumnDefinition]:
+    """
+    Columns of the metadata table of every media table, besides the file_url of
+    the files. They tell LOAD which files changed since they were loaded.
+    file_size: size of the file in bytes
+    file_mtime: modification time of the file in nanoseconds
+    content_hash: checksum of the content of the file
+    """
+    columns = [
+        ColumnDefinition("file_size", ColumnType.INTEGER, None, None),
+        ColumnDefinition("file_mtime", ColumnType.INTEGER, None, None),
+        ColumnDefinition("content_hash", ColumnType.TEXT, None, None),
+    ]
+    return columns
+
+
+def get_video_metadata_table_column_definitions() -> List[ColumnDefinition]:
+    """
+    Columns of the metadata table of a video table, besides the file_url and
+    the manifest of the videos. They are computed when the videos are loaded.
+    num_frames: number of frames
+    fps: average frame rate
+    duration: duration in seconds
+    height, width: resolution of the frames
+    keyframes: ids of the key frames
+    timestamps: start and end time of every frame
+    """
+    columns = [
+        ColumnDefinition("num_frames", ColumnType.INTEGER, None, None),
+        ColumnDefinition("fps", ColumnType.FLOAT, None, None),
+        ColumnDefinition("duration", ColumnType.FLOAT, None, None),
+        ColumnDefinition("height", ColumnType.INTEGER, None, None),
+        ColumnDefinition("width", ColumnType.INTEGER, None, None),
+        ColumnDefinition("keyframes", ColumnType.NDARRAY, NdArrayType.INT64, (None,)),
+        ColumnDefinition(
+            "timestamps", ColumnType.NDARRAY, NdArrayType.FLOAT32, (None, 2)
+        ),
+    ]
+    return columns
+
+
 def get_image_table_column_definitions() -> List[ColumnDefinition]:
     """
     name: image path
@@ -152,6 +193,16 @@ def get_pdf_table_column_definitions() -> List[ColumnDefinition]:
     return columns
 
 
+def get_pdf_metadata_table_column_definitions() -> List[ColumnDefinition]:
+    """
+    Columns of the metadata table of a pdf table, besides the file_url and the
+    manifest of the pdfs. They are computed when the pdfs are loaded.
+    num_pages: number of pages
+    """
+    columns = [ColumnDefinition("num_pages", ColumnType.INTEGER, None, None)]
+    return columns
+
+
 def get_table_primary_columns(
     table_catalog_obj: TableCatalogEntry,
 ) -> List[ColumnDefinition]:
@@ -67,6 +67,11 @@ class ColumnCatalog(BaseModel):
         "IndexCatalog", back_populates="_feat_column", cascade="all, delete"
     )
 
+    # Statistics of the column collected by ANALYZE.
+    _statistics = relationship(
+        "ColumnStatisticsCatalog", back_populates="_column", cascade="all, delete"
+    )
+
     def __init__(
         self,
         name: str,
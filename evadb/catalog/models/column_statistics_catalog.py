@@ -0,0 +1,69 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+
+from evadb.catalog.models.base_model import BaseModel
+from evadb.catalog.models.utils import ColumnStatisticsCatalogEntry, TextPickleType
+
+
+class ColumnStatisticsCatalog(BaseModel):
+    """The `ColumnStatisticsCatalog` stores the statistics collected by ANALYZE for every column of a table. The optimizer uses them to estimate cardinalities.
+    `_row_id:` an autogenerated unique identifier.
+    `_column_id:` the `_row_id` of the `ColumnCatalog` entry the statistics belong to.
+    `_num_rows:` number of rows in the table when the statistics were collected.
+    `_null_fraction:` fraction of the rows that are NULL in this column.
+    `_num_distinct:` estimated number of distinct non-NULL values (None if the column type does not support it).
+    `_histogram_bounds:` bucket boundaries of an equi-depth histogram over the non-NULL values.
+    """
+
+    __tablename__ = "column_statistics_catalog"
+
+    _column_id = Column(
+        "column_id",
+        Integer,
+        ForeignKey("column_catalog._row_id", ondelete="CASCADE"),
+        unique=True,
+    )
+    _num_rows = Column("num_rows", Integer)
+    _null_fraction = Column("null_fraction", Float)
+    _num_distinct = Column("num_distinct", Float, nullable=True)
+    _histogram_bounds = Column("histogram_bounds", TextPickleType())
+
+    _column = relationship("ColumnCatalog", back_populates="_statistics")
+
+    def __init__(
+        self,
+        column_id: int,
+        num_rows: int,
+        null_fraction: float,
+        num_distinct: float = None,
+        histogram_bounds: list = None,
+    ):
+        self._column_id = column_id
+        self._num_rows = num_rows
+        self._null_fraction = null_fraction
+        self._num_distinct = num_distinct
+        self._histogram_bounds = histogram_bounds or []
+
+    def as_dataclass(self) -> "ColumnStatisticsCatalogEntry":
+        return ColumnStatisticsCatalogEntry(
+            column_id=self._column_id,
+            num_rows=self._num_rows,
+            null_fraction=self._null_fraction,
+            num_distinct=self._num_distinct,
+            histogram_bounds=self._histogram_bounds or [],
+            row_id=self._row_id,
+        )
@@ -180,6 +180,27 @@ class FunctionIOCatalogEntry:
         return {"name": self.name, "data_type": data_type}
 
 
+@dataclass(unsafe_hash=True)
+class ColumnStatisticsCatalogEntry:
+    """Dataclass representing an entry in the `ColumnStatisticsCatalog`."""
+
+    column_id: int
+    num_rows: int
+    null_fraction: float = 0.0
+    num_distinct: float = None
+    histogram_bounds: List = field(compare=False, default_factory=list)
+    row_id: int = None
+
+    def display_format(self):
+        return {
+            "column_id": self.column_id,
+            "num_rows": self.num_rows,
+            "null_fraction": self.null_fraction,
+            "num_distinct": self.num_distinct,
+            "histogram_bounds": self.histogram_bounds,
+        }
+
+
 @dataclass(unsafe_hash=True)
 class FunctionCostCatalogEntry:
     """Dataclass representing an entry in the `FunctionCostCatalog`."""
@@ -0,0 +1,83 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import select
+
+from evadb.catalog.models.column_statistics_catalog import (
+    ColumnStatisticsCatalog,
+    ColumnStatisticsCatalogEntry,
+)
+from evadb.catalog.services.base_service import BaseService
+from evadb.utils.errors import CatalogError
+
+
+class ColumnStatisticsCatalogService(BaseService):
+    def __init__(self, db_session: Session):
+        super().__init__(ColumnStatisticsCatalog, db_session)
+
+    def upsert_entries(self, entries: List[ColumnStatisticsCatalogEntry]):
+        """Insert or replace the statistics of the given columns
+
+        Arguments:
+            entries (List[ColumnStatisticsCatalogEntry]): statistics to persist, one
+                per column
+        """
+        try:
+            for entry in entries:
+                stats_obj = self.session.execute(
+                    select(self.model).filter(self.model._column_id == entry.column_id)
+                ).scalar_one_or_none()
+                if stats_obj:
+                    stats_obj._num_rows = entry.num_rows
+                    stats_obj._null_fraction = entry.null_fraction
+                    stats_obj._num_distinct = entry.num_distinct
+                    stats_obj._histogram_bounds = entry.histogram_bounds
+                else:
+                    stats_obj = self.model(
+                        entry.column_id,
+                        entry.num_rows,
+                        entry.null_fraction,
+                        entry.num_distinct,
+                        entry.histogram_bounds,
+                    )
+                    self.session.add(stats_obj)
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise CatalogError(
+                f"Error while upserting entries to ColumnStatisticsCatalog: {str(e)}"
+            )
+
+    def get_entry_by_column_id(self, column_id: int) -> ColumnStatisticsCatalogEntry:
+        """return the statistics of the column with the provided id.
+           None if ANALYZE has not been run on the column's table.
+
+        Arguments:
+            column_id (int): `_row_id` of the column
+        """
+        try:
+            stats_obj = self.session.execute(
+                select(self.model).filter(self.model._column_id == column_id)
+            ).scalar_one_or_none()
+            if stats_obj:
+                return stats_obj.as_dataclass()
+            return None
+        except Exception as e:
+            raise CatalogError(
+                f"Error while getting statistics of column {column_id} from "
+                f"ColumnStatisticsCatalog: {str(e)}"
+            )
@@ -27,6 +27,7 @@ ROW_NUM_MAGIC = 0xFFFFFFFF
 
 CATALOG_TABLES = [
     "column_catalog",
+    "column_statistics_catalog",
     "table_catalog",
     "database_catalog",
     "configuration_catalog",
@@ -20,4 +20,5 @@ UNDEFINED_GROUP_ID = -1
 CACHEABLE_FUNCTIONS = ["Yolo", "FaceDetector", "OCRExtractor", "HFObjectDetector"]
 IFRAMES = "IFRAMES"
 AUDIORATE = "AUDIORATE"
+DIFF = "DIFF"
 DEFAULT_FUNCTION_EXPRESSION_COST = 100
@@ -27,6 +27,20 @@ BASE_EVADB_CONFIG = {
     "application": "evadb",
     "mode": "release",
     "batch_mem_size": 30000000,
+    "batch_size": None,  # maximum number of rows in a batch read from storage
+    "structured_storage_engine": "sqlite",  # storage layout of new tables: sqlite or arrow
+    "bulk_write_commit_rows": 1000000,  # rows written per transaction by LOAD CSV and CREATE TABLE AS
+    "video_decode_workers": 1,  # processes decoding the videos of a table in parallel
+    "video_decode_preserve_order": True,  # return the videos of a table in load order
+    "image_decode_workers": 4,  # threads decoding the images of a table in parallel
+    "document_chunk_workers": 4,  # processes chunking the documents of a table in parallel
+    "pdf_extract_workers": 4,  # processes extracting the pages of the pdfs of a table in parallel
+    "storage_prefetch_depth": 0,  # batches decoded ahead of the query in a background thread, 0 to disable
+    "frame_cache_size": 0,  # bytes of decoded video frames cached in memory, 0 to disable
+    "frame_cache_disk_size": 0,  # bytes of decoded video frames cached in cache_dir
+    "audio_window_seconds": 0,  # seconds of audio per batch, 0 to read whole tracks
+    "audio_window_overlap_seconds": 0,  # overlap between consecutive audio windows
+    "resize_frames_to_function_input": False,  # decode frames at function input size
     "gpu_batch_size": 1,  # batch size used for gpu_operations
     "gpu_ids": [0],
     "host": "0.0.0.0",
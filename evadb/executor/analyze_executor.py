@@ -0,0 +1,82 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.models.utils import ColumnStatisticsCatalogEntry
+from evadb.database import EvaDBDatabase
+from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.models.storage.batch import Batch
+from evadb.plan_nodes.analyze_plan import AnalyzePlan
+from evadb.storage.storage_engine import StorageEngine
+from evadb.utils.statistics_utils import ColumnStatisticsCollector
+
+# distinct values are only estimated for the columns that can be hashed
+DISTINCT_COLUMN_TYPES = [
+    ColumnType.BOOLEAN,
+    ColumnType.INTEGER,
+    ColumnType.FLOAT,
+    ColumnType.TEXT,
+]
+HISTOGRAM_COLUMN_TYPES = [ColumnType.INTEGER, ColumnType.FLOAT]
+
+
+class AnalyzeExecutor(AbstractExecutor):
+    def __init__(self, db: EvaDBDatabase, node: AnalyzePlan):
+        super().__init__(db, node)
+
+    def exec(self, *args, **kwargs):
+        """analyze table executor
+
+        Scans the table once and stores the row count, null fraction, distinct
+        value estimate and an equi-depth histogram of every column in the catalog.
+        """
+        table_obj = self.node.table_ref.table.table_obj
+        collectors = {
+            column.name: ColumnStatisticsCollector(
+                track_distinct=column.type in DISTINCT_COLUMN_TYPES,
+                track_histogram=column.type in HISTOGRAM_COLUMN_TYPES,
+            )
+            for column in table_obj.columns
+        }
+
+        storage_engine = StorageEngine.factory(self.db, table_obj)
+        for batch in storage_engine.read(table_obj, self.node.batch_mem_size):
+            for name, collector in collectors.items():
+                if name in batch.frames:
+                    collector.update(batch.frames[name])
+
+        entries = []
+        for column in table_obj.columns:
+            collector = collectors[column.name]
+            entries.append(
+                ColumnStatisticsCatalogEntry(
+                    column_id=column.row_id,
+                    num_rows=collector.num_rows,
+                    null_fraction=collector.null_fraction,
+                    num_distinct=collector.num_distinct,
+                    histogram_bounds=collector.histogram_bounds(),
+                )
+            )
+        self.catalog().upsert_column_statistics_catalog_entries(entries)
+
+        yield Batch(
+            pd.DataFrame(
+                [
+                    f"Table {table_obj.name} successfully analyzed: "
+                    f"{collectors[table_obj.columns[0].name].num_rows} rows"
+                ]
+            )
+        )
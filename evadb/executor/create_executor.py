@@ -71,12 +71,13 @@ class CreateExecutor(AbstractExecutor):
                 )
                 child = self.children[0]
 
-                rows = 0
+                def _batches():
+                    for batch in child.exec():
+                        batch.drop_column_alias()
+                        yield batch
+
                 # Populate the table
-                for batch in child.exec():
-                    batch.drop_column_alias()
-                    storage_engine.write(catalog_entry, batch)
-                    rows += len(batch)
+                rows = storage_engine.bulk_write(catalog_entry, _batches())
 
                 msg = (
                     f"The table {name} has been successfully created with {rows} rows."
@@ -24,6 +24,8 @@ from evadb.executor.executor_utils import ExecutorError, handle_vector_store_par
 from evadb.expression.function_expression import FunctionExpression
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.create_index_plan import CreateIndexPlan
+from evadb.storage.sqlite_storage_engine import SQLStorageEngine
+from evadb.storage.storage_engine import StorageEngine
 from evadb.third_party.databases.interface import get_database_handler
 from evadb.third_party.vector_stores.types import FeaturePayload
 from evadb.third_party.vector_stores.utils import VectorStoreFactory
@@ -46,6 +48,8 @@ class CreateIndexExecutor(AbstractExecutor):
         # Vector type specific creation.
         if self.vector_store_type == VectorStoreType.PGVECTOR:
             self._create_native_index()
+        elif self.vector_store_type == VectorStoreType.BTREE:
+            self._create_scalar_index()
         else:
             self._create_evadb_index()
 
@@ -73,6 +77,45 @@ class CreateIndexExecutor(AbstractExecutor):
                     f"Native engine create index encounters error: {resp.error}"
                 )
 
+    # Create BTREE index through the sql storage engine, which keeps it up
+    # to date on every write.
+    def _create_scalar_index(self):
+        table_catalog_entry = self.table_ref.table.table_obj
+        feat_col_catalog_entry = [
+            col
+            for col in table_catalog_entry.columns
+            if col.name == self.col_list[0].name
+        ][0]
+
+        index_catalog_entry = self.catalog().get_index_catalog_entry_by_name(self.name)
+        if index_catalog_entry is not None:
+            msg = f"Index {self.name} already exists."
+            if self.if_not_exists:
+                logger.warn(msg)
+                return
+            logger.error(msg)
+            raise ExecutorError(msg)
+
+        storage_engine = StorageEngine.factory(self.db, table_catalog_entry)
+        if not isinstance(storage_engine, SQLStorageEngine):
+            raise ExecutorError(
+                f"BTREE index is not supported on the table {table_catalog_entry.name}"
+            )
+        try:
+            storage_engine.create_index(
+                table_catalog_entry, self.name, feat_col_catalog_entry.name
+            )
+            self.catalog().insert_index_catalog_entry(
+                self.name,
+                "",
+                self.vector_store_type,
+                feat_col_catalog_entry,
+                None,
+                self.index_def,
+            )
+        except Exception as e:
+            raise ExecutorError(str(e))
+
     # On-disk saving path for EvaDB index.
     def _get_evadb_index_save_path(self) -> Path:
         index_dir = Path(self.db.catalog().get_configuration_catalog_value("index_dir"))
@@ -82,6 +125,25 @@ class CreateIndexExecutor(AbstractExecutor):
             index_dir / Path("{}_{}.index".format(self.vector_store_type, self.name))
         )
 
+    def _init_evadb_index(self, index_path: str, input_dim: int):
+        index = VectorStoreFactory.init_vector_store(
+            self.vector_store_type,
+            self.name,
+            **handle_vector_store_params(
+                self.vector_store_type, index_path, self.catalog
+            ),
+        )
+        index.create(input_dim)
+        return index
+
+    # Read the whole feature column at once if the storage engine keeps it as
+    # a matrix. Returns None otherwise.
+    def _read_embedding_matrix(self, table_catalog_entry, column_name: str):
+        storage_engine = StorageEngine.factory(self.db, table_catalog_entry)
+        if not isinstance(storage_engine, SQLStorageEngine):
+            return None
+        return storage_engine.read_embedding_matrix(table_catalog_entry, column_name)
+
     # Create EvaDB index.
     def _create_evadb_index(self):
         # Find function expression.
@@ -135,29 +197,38 @@ class CreateIndexExecutor(AbstractExecutor):
             index = None
 
         try:
-            # Add features to index.
-            for input_batch in self.children[0].exec():
-                input_batch.drop_column_alias()
-                feat = input_batch.column_as_numpy_array(feat_col_name)
-                row_num = input_batch.column_as_numpy_array(ROW_NUM_COLUMN)
-
-                for i in range(len(input_batch)):
-                    row_feat = feat[i].reshape(1, -1)
+            embeddings = None
+            if function_expression is None:
+                embeddings = self._read_embedding_matrix(
+                    feat_tb_catalog_entry, feat_col_name
+                )
 
-                    # Create new index if not exists.
+            if embeddings is not None:
+                # The column is stored as a matrix, add it to the index at once.
+                row_ids, matrix = embeddings
+                if len(row_ids) > 0:
+                    matrix = matrix.reshape(len(row_ids), -1)
                     if index is None:
-                        input_dim = row_feat.shape[1]
-                        index = VectorStoreFactory.init_vector_store(
-                            self.vector_store_type,
-                            self.name,
-                            **handle_vector_store_params(
-                                self.vector_store_type, index_path, self.catalog
-                            ),
-                        )
-                        index.create(input_dim)
-
-                    # Row ID for mapping back to the row.
-                    index.add([FeaturePayload(row_num[i], row_feat)])
+                        index = self._init_evadb_index(index_path, matrix.shape[1])
+                    index.add_matrix(row_ids, matrix)
+            else:
+                # Add features to index.
+                for input_batch in self.children[0].exec():
+                    input_batch.drop_column_alias()
+                    feat = input_batch.column_as_numpy_array(feat_col_name)
+                    row_num = input_batch.column_as_numpy_array(ROW_NUM_COLUMN)
+
+                    for i in range(len(input_batch)):
+                        row_feat = feat[i].reshape(1, -1)
+
+                        # Create new index if not exists.
+                        if index is None:
+                            index = self._init_evadb_index(
+                                index_path, row_feat.shape[1]
+                            )
+
+                        # Row ID for mapping back to the row.
+                        index.add([FeaturePayload(row_num[i], row_feat)])
 
             # Persist index.
             index.persist()
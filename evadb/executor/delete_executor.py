@@ -28,6 +28,7 @@ from evadb.expression.logical_expression import LogicalExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.project_plan import ProjectPlan
+from evadb.storage.arrow_storage_engine import ArrowStorageEngine
 from evadb.storage.storage_engine import StorageEngine
 
 
@@ -98,15 +99,19 @@ class DeleteExecutor(AbstractExecutor):
             table_catalog.table_type == TableType.STRUCTURED_DATA
         ), "DELETE only implemented for structured data"
 
-        table_to_delete_from = storage_engine._try_loading_table_via_reflection(
-            table_catalog.name
-        )
+        if isinstance(storage_engine, ArrowStorageEngine):
+            # columnar tables evaluate the predicate directly on the data files
+            storage_engine.delete(table_catalog, self.predicate)
+        else:
+            table_to_delete_from = storage_engine._try_loading_table_via_reflection(
+                table_catalog.name
+            )
 
-        sqlalchemy_filter_clause = self.predicate_node_to_filter_clause(
-            table_to_delete_from, predicate_node=self.predicate
-        )
-        # verify where clause and convert to sqlalchemy supported filter
-        # https://stackoverflow.com/questions/34026210/where-filter-from-table-object-using-a-dictionary-or-kwargs
+            sqlalchemy_filter_clause = self.predicate_node_to_filter_clause(
+                table_to_delete_from, predicate_node=self.predicate
+            )
+            # verify where clause and convert to sqlalchemy supported filter
+            # https://stackoverflow.com/questions/34026210/where-filter-from-table-object-using-a-dictionary-or-kwargs
 
-        storage_engine.delete(table_catalog, sqlalchemy_filter_clause)
+            storage_engine.delete(table_catalog, sqlalchemy_filter_clause)
         yield Batch(pd.DataFrame(["Deleted rows"]))
@@ -16,6 +16,7 @@
 
 import pandas as pd
 
+from evadb.catalog.catalog_type import VectorStoreType
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.executor.executor_utils import ExecutorError, handle_vector_store_params
@@ -117,6 +118,22 @@ class DropObjectExecutor(AbstractExecutor):
                 return Batch(pd.DataFrame([err_msg]))
             else:
                 raise RuntimeError(err_msg)
+        elif index_obj.type == VectorStoreType.BTREE:
+            table_obj = self.catalog().get_table_catalog_entry(
+                index_obj.feat_column.table_name
+            )
+            if table_obj is not None:
+                storage_engine = StorageEngine.factory(self.db, table_obj)
+                storage_engine.drop_index(table_obj, index_name)
+
+            self.catalog().drop_index_catalog_entry(index_name)
+
+            return Batch(
+                pd.DataFrame(
+                    {f"Index {index_name} successfully dropped"},
+                    index=[0],
+                )
+            )
         else:
             index = VectorStoreFactory.init_vector_store(
                 index_obj.type,
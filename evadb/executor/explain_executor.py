@@ -14,11 +14,14 @@
 # limitations under the License.
 import pandas as pd
 
+from evadb.catalog.catalog_type import TableType
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.abstract_plan import AbstractPlan
 from evadb.plan_nodes.explain_plan import ExplainPlan
+from evadb.plan_nodes.storage_plan import StoragePlan
+from evadb.storage.storage_engine import StorageEngine
 
 
 class ExplainExecutor(AbstractExecutor):
@@ -33,7 +36,21 @@ class ExplainExecutor(AbstractExecutor):
         yield Batch(pd.DataFrame([plan_str]))
 
     def _exec(self, node: AbstractPlan, depth: int):
-        cur_str = " " * depth * 4 + "|__ " + str(node.__class__.__name__) + "\n"
+        cur_str = " " * depth * 4 + "|__ " + str(node.__class__.__name__)
+        if isinstance(node, StoragePlan) and node.index is not None:
+            cur_str += f" (index scan using {node.index.name})"
+        elif (
+            isinstance(node, StoragePlan)
+            and node.table.table_type == TableType.STRUCTURED_DATA
+            and node.predicate is not None
+        ):
+            # report the chunks the scan skips using the zone maps
+            storage_engine = StorageEngine.factory(self.db, node.table)
+            num_pruned, num_chunks = storage_engine.zone_map_pruning(
+                node.table, node.predicate
+            )
+            cur_str += f" (zone maps skip {num_pruned} of {num_chunks} chunks)"
+        cur_str += "\n"
         for child in node.children:
             cur_str += self._exec(child, depth + 1)
         return cur_str
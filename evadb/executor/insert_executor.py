@@ -14,7 +14,7 @@
 # limitations under the License.
 import pandas as pd
 
-from evadb.catalog.catalog_type import TableType
+from evadb.catalog.catalog_type import TableType, VectorStoreType
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.models.storage.batch import Batch
@@ -55,6 +55,9 @@ class InsertExecutor(AbstractExecutor):
 
         # Index update if there is an index built on the table.
         for index in self.db.catalog().get_all_index_catalog_entries():
+            # BTREE indexes are kept up to date by the storage engine.
+            if index.type == VectorStoreType.BTREE:
+                continue
             is_index_on_current_table = False
             for column in table_catalog_entry.columns:
                 if column == index.feat_column:
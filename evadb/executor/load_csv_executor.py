@@ -70,10 +70,7 @@ class LoadCSVExecutor(AbstractExecutor):
 
         storage_engine = StorageEngine.factory(self.db, table_obj)
         # write with storage engine in batches
-        num_loaded_frames = 0
-        for batch in csv_reader.read():
-            storage_engine.write(table_obj, batch)
-            num_loaded_frames += len(batch)
+        num_loaded_frames = storage_engine.bulk_write(table_obj, csv_reader.read())
 
         # yield result
         df_yield_result = Batch(
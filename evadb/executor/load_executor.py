@@ -42,6 +42,8 @@ class LoadDataExecutor(AbstractExecutor):
         ]:
             executor = LoadMultimediaExecutor(self.db, self.node)
         elif self.node.file_options["file_format"] == FileFormatType.CSV:
+            if self.node.file_options.get("replace"):
+                raise ExecutorError("LOAD CSV does not support REPLACE")
             executor = LoadCSVExecutor(self.db, self.node)
 
         # for each batch, exec the executor
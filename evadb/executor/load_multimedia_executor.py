@@ -12,9 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import multiprocessing as mp
 from multiprocessing import Pool
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 import pandas as pd
 
@@ -25,6 +27,11 @@ from evadb.executor.executor_utils import ExecutorError, iter_path_regex, valida
 from evadb.models.storage.batch import Batch
 from evadb.parser.types import FileFormatType
 from evadb.plan_nodes.load_data_plan import LoadDataPlan
+from evadb.readers.decord_reader import read_video_metadata
+from evadb.storage.abstract_media_storage_engine import (
+    FileManifestEntry,
+    get_file_manifest_entry,
+)
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
 from evadb.storage.storage_engine import StorageEngine
 from evadb.utils.errors import DatasetFileNotFoundError
@@ -33,6 +40,15 @@ from evadb.utils.logging_manager import logger
 from evadb.utils.s3_utils import download_from_s3
 
 
+def _inspect_media(
+    media_type: FileFormatType, file_path: str
+) -> Tuple[bool, FileManifestEntry]:
+    """Validates the file and computes its manifest entry if it is valid"""
+    if not validate_media(Path(file_path), media_type):
+        return False, None
+    return True, get_file_manifest_entry(file_path)
+
+
 class LoadMultimediaExecutor(AbstractExecutor):
     def __init__(self, db: EvaDBDatabase, node: LoadDataPlan):
         super().__init__(db, node)
@@ -47,9 +63,9 @@ class LoadMultimediaExecutor(AbstractExecutor):
     def exec(self, *args, **kwargs):
         storage_engine = None
         table_obj = None
+        do_create = False
         try:
-            video_files = []
-            valid_files = []
+            media_files = []
 
             # If it is a s3 path, download the file to local
             if self.node.file_path.as_posix().startswith("s3:/"):
@@ -58,74 +74,108 @@ class LoadMultimediaExecutor(AbstractExecutor):
                 )
                 dst_path = s3_dir / self.node.table_info.table_name
                 dst_path.mkdir(parents=True, exist_ok=True)
-                video_files = download_from_s3(self.node.file_path, dst_path)
+                media_files = download_from_s3(self.node.file_path, dst_path)
             else:
                 # Local Storage
-                video_files = list(iter_path_regex(self.node.file_path))
+                media_files = list(iter_path_regex(self.node.file_path))
+            # the files are loaded, and then read, in the order of their paths
+            # rather than in the arbitrary order of the file system
+            media_files = sorted(str(path) for path in media_files)
+
+            table_info = self.node.table_info
+            database_name = table_info.database_name
+            table_name = table_info.table_name
+            table_obj = self.catalog().get_table_catalog_entry(
+                table_name, database_name
+            )
+            # only the files that are not in the manifest of the table yet, or
+            # that changed since they were loaded, are validated and loaded
+            manifest = {}
+            if table_obj:
+                msg = f"Adding to an existing table {table_name}."
+                logger.info(msg)
+                storage_engine = StorageEngine.factory(self.db, table_obj)
+                manifest = storage_engine.read_manifest(table_obj)
+            pending_files, unchanged_files = self._get_pending_files(
+                media_files, manifest
+            )
 
             # Use parallel validation if there are many files. Otherwise, use single-thread
             # validation version.
-            valid_files, invalid_files = [], []
-            if len(video_files) < mp.cpu_count() * 2:
-                valid_bitmap = [self._is_media_valid(path) for path in video_files]
+            inspect_media = functools.partial(_inspect_media, self.media_type)
+            if len(pending_files) < mp.cpu_count() * 2:
+                inspected = [inspect_media(path) for path in pending_files]
             else:
                 # TODO: move this to configuration file later.
-                pool = Pool(mp.cpu_count())
-                valid_bitmap = pool.map(self._is_media_valid, video_files)
+                with Pool(mp.cpu_count()) as pool:
+                    inspected = pool.map(inspect_media, pending_files)
 
             # Raise error if any file is invalid.
-            if False in valid_bitmap:
-                invalid_files = [
-                    str(path)
-                    for path, is_valid in zip(video_files, valid_bitmap)
-                    if not is_valid
-                ]
-
+            invalid_files = [
+                path
+                for path, (is_valid, _) in zip(pending_files, inspected)
+                if not is_valid
+            ]
+            if invalid_files:
                 invalid_files_str = "\n".join(invalid_files)
                 err_msg = f"no valid file found at -- '{invalid_files_str}'."
                 logger.error(err_msg)
 
-            # Get valid files.
-            valid_files = [
-                str(path)
-                for path, is_valid in zip(video_files, valid_bitmap)
-                if is_valid
-            ]
-
-            if not valid_files:
+            # Get valid files, split into the new ones and the changed ones.
+            entries = {}
+            changed_files = []
+            for path, (is_valid, entry) in zip(pending_files, inspected):
+                if not is_valid:
+                    continue
+                loaded_entry = manifest.get(path)
+                if loaded_entry is None:
+                    entries[path] = entry
+                elif loaded_entry.content_hash == entry.content_hash:
+                    # only touched since it was loaded
+                    unchanged_files.append(path)
+                else:
+                    entries[path] = entry
+                    changed_files.append(path)
+
+            if not entries and not unchanged_files:
                 raise DatasetFileNotFoundError(
                     f"no file found at -- '{str(self.node.file_path)}'."
                 )
-
-            # Create catalog entry
-            table_info = self.node.table_info
-            database_name = table_info.database_name
-            table_name = table_info.table_name
-            # Sanity check to make sure there is no existing table with same name
-            do_create = False
-            table_obj = self.catalog().get_table_catalog_entry(
-                table_name, database_name
-            )
-            if table_obj:
-                msg = f"Adding to an existing table {table_name}."
-                logger.info(msg)
-            # Create the catalog entry
-            else:
-                table_obj = (
-                    self.catalog().create_and_insert_multimedia_table_catalog_entry(
-                        table_name, self.media_type
-                    )
+            if changed_files and not self.node.file_options.get("replace"):
+                changed_files_str = "\n".join(changed_files)
+                raise ExecutorError(
+                    f"files changed since they were loaded into {table_name}, use "
+                    f"LOAD {self.media_type.name} ... REPLACE INTO to replace them:"
+                    f"\n{changed_files_str}"
                 )
-                do_create = True
 
-            storage_engine = StorageEngine.factory(self.db, table_obj)
-            if do_create:
-                storage_engine.create(table_obj)
+            if entries:
+                # Create the catalog entry
+                if not table_obj:
+                    table_obj = (
+                        self.catalog().create_and_insert_multimedia_table_catalog_entry(
+                            table_name, self.media_type
+                        )
+                    )
+                    do_create = True
+                    storage_engine = StorageEngine.factory(self.db, table_obj)
+                    storage_engine.create(table_obj)
+
+                if changed_files:
+                    # the changed files are registered again below, along with
+                    # their new manifest and metadata
+                    storage_engine.delete(
+                        table_obj, Batch(pd.DataFrame({"file_path": changed_files}))
+                    )
 
-            storage_engine.write(
-                table_obj,
-                Batch(pd.DataFrame({"file_path": valid_files})),
-            )
+                valid_files = list(entries.keys())
+                if self.media_type == FileFormatType.VIDEO:
+                    rows = self._get_video_rows(valid_files)
+                else:
+                    rows = [{"file_path": file_path} for file_path in valid_files]
+                for row in rows:
+                    row.update(entries[row["file_path"]].to_row())
+                storage_engine.write(table_obj, Batch(pd.DataFrame(rows)))
 
         except Exception as e:
             # If we fail to obtain the storage engine or table object,
@@ -135,13 +185,36 @@ class LoadMultimediaExecutor(AbstractExecutor):
             err_msg = f"Load {self.media_type.name} failed: {str(e)}"
             raise ExecutorError(err_msg)
         else:
-            yield Batch(
-                pd.DataFrame(
-                    [
-                        f"Number of loaded {self.media_type.name}: {str(len(valid_files))}"
-                    ]
-                )
-            )
+            msg = f"Number of loaded {self.media_type.name}: {str(len(entries))}"
+            if unchanged_files:
+                msg += f", skipped unchanged: {len(unchanged_files)}"
+            yield Batch(pd.DataFrame([msg]))
+
+    def _get_pending_files(
+        self, media_files: List[str], manifest: Dict[str, FileManifestEntry]
+    ) -> Tuple[List[str], List[str]]:
+        """Splits the files into the ones to validate and load, which are new or
+        whose size or modification time differ from the manifest, and the
+        unchanged ones"""
+        pending_files, unchanged_files = [], []
+        for file_path in media_files:
+            loaded_entry = manifest.get(file_path)
+            if loaded_entry is None:
+                pending_files.append(file_path)
+            elif loaded_entry.file_size is None:
+                # loaded before the table kept a manifest, the file can only be
+                # compared to the loaded one by replacing it
+                if self.node.file_options.get("replace"):
+                    pending_files.append(file_path)
+                else:
+                    unchanged_files.append(file_path)
+            elif loaded_entry.same_stat(
+                get_file_manifest_entry(file_path, with_content_hash=False)
+            ):
+                unchanged_files.append(file_path)
+            else:
+                pending_files.append(file_path)
+        return pending_files, unchanged_files
 
     def _rollback_load(
         self,
@@ -152,11 +225,15 @@ class LoadMultimediaExecutor(AbstractExecutor):
         if do_create:
             storage_engine.drop(table_obj)
 
-    def _is_media_valid(
-        self,
-        file_path: Path,
-    ):
-        file_path = Path(file_path)
-        if validate_media(file_path, self.media_type):
-            return True
-        return False
+    def _get_video_rows(self, video_files: List[str]) -> List[Dict]:
+        """Reads the metadata of the videos once, so that scans do not need to
+        open the files to learn their frame count, key frames and timestamps"""
+        if len(video_files) < mp.cpu_count() * 2:
+            metadata = [read_video_metadata(path) for path in video_files]
+        else:
+            with Pool(mp.cpu_count()) as pool:
+                metadata = pool.map(read_video_metadata, video_files)
+        return [
+            {"file_path": file_path, **video_metadata.to_row()}
+            for file_path, video_metadata in zip(video_files, metadata)
+        ]
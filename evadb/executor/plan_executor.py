@@ -16,6 +16,7 @@ from typing import Iterator, Union
 
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.analyze_executor import AnalyzeExecutor
 from evadb.executor.apply_and_merge_executor import ApplyAndMergeExecutor
 from evadb.executor.create_database_executor import CreateDatabaseExecutor
 from evadb.executor.create_executor import CreateExecutor
@@ -112,6 +113,8 @@ class PlanExecutor:
             executor_node = CreateExecutor(db=self._db, node=plan)
         elif plan_opr_type == PlanOprType.RENAME:
             executor_node = RenameExecutor(db=self._db, node=plan)
+        elif plan_opr_type == PlanOprType.ANALYZE:
+            executor_node = AnalyzeExecutor(db=self._db, node=plan)
         elif plan_opr_type == PlanOprType.DROP_OBJECT:
             executor_node = DropObjectExecutor(db=self._db, node=plan)
         elif plan_opr_type == PlanOprType.INSERT:
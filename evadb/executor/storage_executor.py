@@ -22,6 +22,7 @@ from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.storage_plan import StoragePlan
 from evadb.storage.storage_engine import StorageEngine
 from evadb.utils.logging_manager import logger
+from evadb.utils.prefetch import prefetch
 
 
 class StorageExecutor(AbstractExecutor):
@@ -33,7 +34,7 @@ class StorageExecutor(AbstractExecutor):
             storage_engine = StorageEngine.factory(self.db, self.node.table)
 
             if self.node.table.table_type == TableType.VIDEO_DATA:
-                return storage_engine.read(
+                batches = storage_engine.read(
                     self.node.table,
                     self.node.batch_mem_size,
                     predicate=self.node.predicate,
@@ -41,17 +42,55 @@ class StorageExecutor(AbstractExecutor):
                     sampling_type=self.node.sampling_type,
                     read_audio=self.node.table_ref.get_audio,
                     read_video=self.node.table_ref.get_video,
+                    batch_size=self.node.batch_size,
+                    columns=self.node.columns,
+                    frame_size=self.node.frame_size,
                 )
+                return self._prefetch(batches)
             elif self.node.table.table_type == TableType.IMAGE_DATA:
-                return storage_engine.read(self.node.table)
+                return self._prefetch(
+                    storage_engine.read(
+                        self.node.table,
+                        self.node.batch_mem_size,
+                        batch_size=self.node.batch_size,
+                    )
+                )
             elif self.node.table.table_type == TableType.DOCUMENT_DATA:
-                return storage_engine.read(self.node.table, self.node.chunk_params)
+                return self._prefetch(
+                    storage_engine.read(
+                        self.node.table,
+                        self.node.chunk_params,
+                        self.node.batch_mem_size,
+                        batch_size=self.node.batch_size,
+                    )
+                )
             elif self.node.table.table_type == TableType.STRUCTURED_DATA:
-                return storage_engine.read(self.node.table, self.node.batch_mem_size)
+                # indexes are only created on the tables stored in sql
+                index_kwargs = {}
+                if self.node.index is not None:
+                    index_kwargs["index"] = self.node.index
+                return storage_engine.read(
+                    self.node.table,
+                    self.node.batch_mem_size,
+                    columns=self.node.columns,
+                    predicate=self.node.predicate,
+                    batch_size=self.node.batch_size,
+                    **index_kwargs,
+                )
             elif self.node.table.table_type == TableType.NATIVE_DATA:
-                return storage_engine.read(self.node.table)
+                return storage_engine.read(
+                    self.node.table,
+                    self.node.batch_mem_size,
+                    batch_size=self.node.batch_size,
+                )
             elif self.node.table.table_type == TableType.PDF_DATA:
-                return storage_engine.read(self.node.table)
+                return self._prefetch(
+                    storage_engine.read(
+                        self.node.table,
+                        self.node.batch_mem_size,
+                        batch_size=self.node.batch_size,
+                    )
+                )
             else:
                 raise ExecutorError(
                     f"Unsupported TableType {self.node.table.table_type} encountered"
@@ -59,3 +98,11 @@ class StorageExecutor(AbstractExecutor):
         except Exception as e:
             logger.error(e)
             raise ExecutorError(e)
+
+    def _prefetch(self, batches: Iterator[Batch]) -> Iterator[Batch]:
+        # decode the next batches of media tables while the operators above
+        # process the current one
+        depth = self.db.catalog().get_configuration_catalog_value(
+            "storage_prefetch_depth", 0
+        )
+        return prefetch(batches, depth, name=f"Prefetch {self.node.table.name}")
@@ -296,3 +296,46 @@ def is_simple_predicate(predicate: AbstractExpression) -> bool:
     ]
 
     return _has_simple_expressions(predicate) and contains_single_column(predicate)
+
+
+def get_index_predicate(
+    predicate: AbstractExpression, column_name: str
+) -> AbstractExpression:
+    """Extracts the conjuncts of the predicate that an index on the column can
+    answer: comparisons (=, >, <, >=, <=) between the column and a constant,
+    and disjunctions of such comparisons.
+
+    Args:
+        predicate (AbstractExpression): predicate on the table columns
+        column_name (str): name of the indexed column
+
+    Returns:
+        AbstractExpression: conjunction of the extracted conjuncts, None if
+            the index cannot be used for the predicate
+    """
+
+    def _is_index_predicate(expr):
+        if expr.etype == ExpressionType.LOGICAL_OR:
+            return all(_is_index_predicate(child) for child in expr.children)
+        if expr.etype not in [
+            ExpressionType.COMPARE_EQUAL,
+            ExpressionType.COMPARE_GREATER,
+            ExpressionType.COMPARE_LESSER,
+            ExpressionType.COMPARE_GEQ,
+            ExpressionType.COMPARE_LEQ,
+        ]:
+            return False
+        left, right = expr.children
+        if isinstance(left, ConstantValueExpression):
+            left, right = right, left
+        return (
+            isinstance(left, TupleValueExpression)
+            and left.name == column_name
+            and isinstance(right, ConstantValueExpression)
+        )
+
+    if predicate is None:
+        return None
+    return conjunction_list_to_expression_tree(
+        [pred for pred in to_conjunction_list(predicate) if _is_index_predicate(pred)]
+    )
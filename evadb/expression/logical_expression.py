@@ -80,11 +80,11 @@ class LogicalExpression(AbstractExpression):
 
     def __str__(self) -> str:
         expr_str = "("
-        if self.get_child(0):
+        if self.etype == ExpressionType.LOGICAL_NOT:
+            expr_str += f"{str(self.get_symbol())} {str(self.get_child(0))}"
+        else:
             expr_str += f"{str(self.get_child(0))}"
-        if self.etype:
             expr_str += f" {str(self.get_symbol())} "
-        if self.get_child(1):
             expr_str += f"{str(self.get_child(1))}"
         expr_str += ")"
         return expr_str
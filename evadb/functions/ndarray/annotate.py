@@ -69,6 +69,9 @@ class Annotate(AbstractFunction):
             try_to_import_cv2()
             import cv2
 
+            # frames decoded from storage may be read-only views
+            if not frame.flags.writeable:
+                frame = frame.copy()
             for bbox in bboxes:
                 x1, y1, x2, y2 = np.asarray(bbox, dtype="int")
                 x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
@@ -0,0 +1,240 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from numbers import Number
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from evadb.catalog.catalog_utils import is_video_table
+from evadb.catalog.models.utils import ColumnCatalogEntry, ColumnStatisticsCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN
+from evadb.constants import DIFF, IFRAMES
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.optimizer.group_expression import GroupExpression
+from evadb.optimizer.operators import (
+    LogicalFilter,
+    LogicalGet,
+    LogicalGroupBy,
+    LogicalJoin,
+    LogicalLimit,
+    LogicalUnion,
+)
+from evadb.utils.statistics_utils import histogram_selectivity
+
+if TYPE_CHECKING:
+    from evadb.optimizer.optimizer_context import OptimizerContext
+
+# Selectivities assumed when the statistics can not tell, same as System R
+DEFAULT_EQUALITY_SELECTIVITY = 0.1
+DEFAULT_SELECTIVITY = 1 / 3
+
+RANGE_EXPRESSION_TYPES = [
+    ExpressionType.COMPARE_GREATER,
+    ExpressionType.COMPARE_LESSER,
+    ExpressionType.COMPARE_GEQ,
+    ExpressionType.COMPARE_LEQ,
+]
+
+# the operator to use when the column is on the right hand side
+FLIPPED_EXPRESSION_TYPES = {
+    ExpressionType.COMPARE_GREATER: ExpressionType.COMPARE_LESSER,
+    ExpressionType.COMPARE_LESSER: ExpressionType.COMPARE_GREATER,
+    ExpressionType.COMPARE_GEQ: ExpressionType.COMPARE_LEQ,
+    ExpressionType.COMPARE_LEQ: ExpressionType.COMPARE_GEQ,
+}
+
+
+class CardinalityEstimator:
+    """Estimates the number of rows produced by the groups of the memo using
+    the column statistics collected by ANALYZE.
+
+    The estimate of a group is None if any of the tables below it has not been
+    analyzed; the cost model then falls back to its constant costs. Video tables
+    are estimated from the frame counts stored when the videos were loaded.
+    """
+
+    def __init__(self, optimizer_context: OptimizerContext):
+        self._context = optimizer_context
+        self._statistics: Dict[int, ColumnStatisticsCatalogEntry] = {}
+        self._num_frames: Dict[Tuple[int, bool], int] = {}
+
+    def _column_statistics(
+        self, column: ColumnCatalogEntry
+    ) -> ColumnStatisticsCatalogEntry:
+        if column.row_id not in self._statistics:
+            self._statistics[column.row_id] = (
+                self._context.db.catalog().get_column_statistics_catalog_entry(column)
+            )
+        return self._statistics[column.row_id]
+
+    def _expression_statistics(
+        self, expr: AbstractExpression
+    ) -> ColumnStatisticsCatalogEntry:
+        if not isinstance(expr, TupleValueExpression):
+            return None
+        if not isinstance(expr.col_object, ColumnCatalogEntry):
+            return None
+        return self._column_statistics(expr.col_object)
+
+    def group_cardinality(self, group_id: int) -> float:
+        group = self._context.memo.get_group_by_id(group_id)
+        # logical expressions are preferred as they carry the original operators,
+        # groups created by the implementation rules only have physical ones
+        exprs = group.logical_exprs or group.physical_exprs
+        if len(exprs) == 0:
+            return None
+        return self.expr_cardinality(exprs[0])
+
+    def expr_cardinality(self, expr: GroupExpression) -> float:
+        opr = expr.opr
+        children = [self.group_cardinality(child) for child in expr.children]
+        if any(child is None for child in children):
+            return None
+
+        if isinstance(opr, LogicalGet):
+            if opr.table_obj is not None and is_video_table(opr.table_obj):
+                return self.video_cardinality(opr)
+            num_rows = self.table_cardinality(opr.table_obj)
+            if num_rows is None:
+                return None
+            return num_rows * self.selectivity(opr.predicate)
+        elif isinstance(opr, LogicalFilter):
+            return children[0] * self.selectivity(opr.predicate)
+        elif isinstance(opr, LogicalJoin):
+            if len(children) != 2:
+                return None
+            return children[0] * children[1] * self.selectivity(opr.join_predicate)
+        elif isinstance(opr, LogicalLimit):
+            return min(children[0], float(opr.limit_count.value))
+        elif isinstance(opr, LogicalGroupBy):
+            # segments of a video, at most one group per input row
+            return children[0]
+        elif isinstance(opr, LogicalUnion):
+            return sum(children)
+        elif len(children) == 1:
+            # projections, ordering and the physical operators keep the rows
+            return children[0]
+        return None
+
+    def table_cardinality(self, table_obj) -> float:
+        if table_obj is None:
+            return None
+        for column in table_obj.columns:
+            if column.name == IDENTIFIER_COLUMN:
+                stats = self._column_statistics(column)
+                return float(stats.num_rows) if stats is not None else None
+        return None
+
+    def video_cardinality(self, opr: LogicalGet) -> float:
+        """Number of frames read from a video table, counted from the metadata
+        stored when the videos were loaded"""
+        from evadb.storage.video_storage_engine import DecordStorageEngine
+
+        key = (opr.table_obj.row_id, opr.sampling_type == IFRAMES)
+        if key not in self._num_frames:
+            self._num_frames[key] = DecordStorageEngine(
+                self._context.db
+            ).get_num_frames(opr.table_obj, keyframes_only=key[1])
+        num_frames = self._num_frames[key]
+        if num_frames is None:
+            return None
+        # the number of frames kept by DIFF sampling depends on their content
+        if opr.sampling_rate and opr.sampling_type != DIFF:
+            num_frames = num_frames / opr.sampling_rate
+        return num_frames * self.selectivity(opr.predicate)
+
+    def selectivity(self, predicate: AbstractExpression) -> float:
+        """Estimates the fraction of the rows that satisfy the predicate"""
+        if predicate is None:
+            return 1.0
+
+        etype = predicate.etype
+        if etype == ExpressionType.LOGICAL_AND:
+            return self.selectivity(predicate.children[0]) * self.selectivity(
+                predicate.children[1]
+            )
+        elif etype == ExpressionType.LOGICAL_OR:
+            left = self.selectivity(predicate.children[0])
+            right = self.selectivity(predicate.children[1])
+            return left + right - left * right
+        elif etype == ExpressionType.LOGICAL_NOT:
+            return 1.0 - self.selectivity(predicate.children[0])
+        elif etype == ExpressionType.COMPARE_EQUAL:
+            return self._equality_selectivity(*predicate.children)
+        elif etype == ExpressionType.COMPARE_NEQ:
+            return 1.0 - self._equality_selectivity(*predicate.children)
+        elif etype in RANGE_EXPRESSION_TYPES:
+            return self._range_selectivity(etype, *predicate.children)
+        return DEFAULT_SELECTIVITY
+
+    def _equality_selectivity(
+        self, left: AbstractExpression, right: AbstractExpression
+    ) -> float:
+        left_stats = self._expression_statistics(left)
+        right_stats = self._expression_statistics(right)
+        if left_stats is not None and right_stats is not None:
+            # join condition; assumes the values of the smaller domain are all
+            # present in the larger one
+            num_distinct = max(
+                left_stats.num_distinct or 1.0, right_stats.num_distinct or 1.0
+            )
+            return (
+                (1.0 - left_stats.null_fraction)
+                * (1.0 - right_stats.null_fraction)
+                / max(num_distinct, 1.0)
+            )
+
+        stats = left_stats or right_stats
+        if stats is None or not stats.num_distinct:
+            return DEFAULT_EQUALITY_SELECTIVITY
+        return (1.0 - stats.null_fraction) / max(stats.num_distinct, 1.0)
+
+    def _range_selectivity(
+        self,
+        etype: ExpressionType,
+        left: AbstractExpression,
+        right: AbstractExpression,
+    ) -> float:
+        if isinstance(left, ConstantValueExpression):
+            left, right = right, left
+            etype = FLIPPED_EXPRESSION_TYPES[etype]
+
+        stats = self._expression_statistics(left)
+        if (
+            stats is None
+            or not isinstance(right, ConstantValueExpression)
+            or not isinstance(right.value, Number)
+        ):
+            return DEFAULT_SELECTIVITY
+
+        value = float(right.value)
+        if etype in [ExpressionType.COMPARE_LESSER, ExpressionType.COMPARE_LEQ]:
+            fraction = histogram_selectivity(
+                stats.histogram_bounds,
+                value,
+                inclusive=etype == ExpressionType.COMPARE_LEQ,
+            )
+        else:
+            fraction = histogram_selectivity(
+                stats.histogram_bounds,
+                value,
+                inclusive=etype == ExpressionType.COMPARE_GREATER,
+            )
+            fraction = None if fraction is None else 1.0 - fraction
+        if fraction is None:
+            return DEFAULT_SELECTIVITY
+        return fraction * (1.0 - stats.null_fraction)
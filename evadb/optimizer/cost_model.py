@@ -12,24 +12,50 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
+
 from functools import singledispatch
+from typing import TYPE_CHECKING
 
+from evadb.optimizer.cardinality_estimator import CardinalityEstimator
 from evadb.optimizer.group_expression import GroupExpression
 from evadb.plan_nodes.abstract_plan import AbstractPlan
 from evadb.plan_nodes.apply_and_merge_plan import ApplyAndMergePlan
 from evadb.plan_nodes.hash_join_build_plan import HashJoinBuildPlan
 from evadb.plan_nodes.hash_join_probe_plan import HashJoinProbePlan
 from evadb.plan_nodes.nested_loop_join_plan import NestedLoopJoinPlan
+from evadb.plan_nodes.predicate_plan import PredicatePlan
 from evadb.plan_nodes.seq_scan_plan import SeqScanPlan
 
+if TYPE_CHECKING:
+    from evadb.optimizer.optimizer_context import OptimizerContext
+
 
 class CostModel:
     """
     Basic cost model. Change it as we add more cost based rules
+
+    Once bound to an optimizer context, the scans, filters and joins are costed
+    by the number of rows they process, estimated from the statistics collected
+    by ANALYZE. Operators over tables without statistics cost 1.0.
     """
 
     def __init__(self):
-        pass
+        self._estimator = None
+
+    def bind(self, optimizer_context: OptimizerContext):
+        """Use the memo and catalog of the context to estimate cardinalities"""
+        self._estimator = CardinalityEstimator(optimizer_context)
+
+    def _child_cardinality(self, gexpr: GroupExpression, idx: int):
+        if self._estimator is None or len(gexpr.children) <= idx:
+            return None
+        return self._estimator.group_cardinality(gexpr.children[idx])
+
+    def _output_cardinality(self, gexpr: GroupExpression):
+        if self._estimator is None:
+            return None
+        return self._estimator.group_cardinality(gexpr.group_id)
 
     def calculate_cost(self, gexpr: GroupExpression):
         """
@@ -42,19 +68,38 @@ class CostModel:
 
         @cost.register(NestedLoopJoinPlan)
         def cost_nested_loop_join_build_plan(opr: NestedLoopJoinPlan):
-            return 1.0
+            left = self._child_cardinality(gexpr, 0)
+            right = self._child_cardinality(gexpr, 1)
+            if left is None or right is None:
+                return 1.0
+            return left * right
 
         @cost.register(HashJoinBuildPlan)
         def cost_hash_join_build_plan(opr: HashJoinBuildPlan):
-            return 1.0
+            build = self._child_cardinality(gexpr, 0)
+            return 1.0 if build is None else build
 
         @cost.register(HashJoinProbePlan)
         def cost_hash_join_probe_plan(opr: HashJoinProbePlan):
-            return 1.0
+            probe = self._child_cardinality(gexpr, 1)
+            output = self._output_cardinality(gexpr)
+            if probe is None or output is None:
+                return 1.0
+            return probe + output
 
         @cost.register(SeqScanPlan)
         def cost_seq_scan(opr: SeqScanPlan):
-            return 1.0
+            # scans of a table are costed by the rows they return, scans of a
+            # derived table by the rows of their child
+            rows = self._child_cardinality(gexpr, 0)
+            if len(gexpr.children) == 0:
+                rows = self._output_cardinality(gexpr)
+            return 1.0 if rows is None else rows
+
+        @cost.register(PredicatePlan)
+        def cost_predicate(opr: PredicatePlan):
+            rows = self._child_cardinality(gexpr, 0)
+            return 1.0 if rows is None else rows
 
         @cost.register(ApplyAndMergePlan)
         def cost_apply_and_merge(opr: ApplyAndMergePlan):
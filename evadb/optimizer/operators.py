@@ -15,7 +15,7 @@
 from collections import deque
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 from evadb.catalog.catalog_type import VectorStoreType
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
@@ -46,6 +46,7 @@ class OperatorType(IntEnum):
     LOGICALDELETE = auto()
     LOGICALCREATE = auto()
     LOGICALRENAME = auto()
+    LOGICALANALYZE = auto()
     LOGICAL_DROP_OBJECT = auto()
     LOGICALCREATEFUNCTION = auto()
     LOGICALLOADDATA = auto()
@@ -182,6 +183,9 @@ class LogicalGet(Operator):
         sampling_rate: int = None,
         sampling_type: str = None,
         chunk_params: dict = {},
+        columns: List[str] = None,
+        index: IndexCatalogEntry = None,
+        frame_size: Tuple[int, int] = None,
         children=None,
     ):
         self._video = video
@@ -192,6 +196,14 @@ class LogicalGet(Operator):
         self._sampling_rate = sampling_rate
         self._sampling_type = sampling_type
         self.chunk_params = chunk_params
+        # names of the table columns accessed by the query, None if all the
+        # columns are required
+        self._columns = columns
+        # index used to find the rows satisfying the predicate
+        self._index = index
+        # (width, height) the video frames are decoded at, None to decode the
+        # frames at their native size
+        self._frame_size = frame_size
         super().__init__(OperatorType.LOGICALGET, children)
 
     @property
@@ -222,6 +234,18 @@ class LogicalGet(Operator):
     def sampling_type(self):
         return self._sampling_type
 
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def frame_size(self):
+        return self._frame_size
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalGet):
@@ -236,6 +260,9 @@ class LogicalGet(Operator):
             and self.sampling_rate == other.sampling_rate
             and self.sampling_type == other.sampling_type
             and self.chunk_params == other.chunk_params
+            and self.columns == other.columns
+            and self.index == other.index
+            and self.frame_size == other.frame_size
         )
 
     def __hash__(self) -> int:
@@ -250,6 +277,9 @@ class LogicalGet(Operator):
                 self.sampling_rate,
                 self.sampling_type,
                 frozenset(self.chunk_params.items()),
+                tuple(self.columns or []),
+                self.index,
+                self.frame_size,
             )
         )
 
@@ -635,6 +665,31 @@ class LogicalRename(Operator):
         return hash((super().__hash__(), self._new_name, self._old_table_ref))
 
 
+class LogicalAnalyze(Operator):
+    """Logical node for analyze table operations
+
+    Arguments:
+        table_ref {TableRef}: [table whose column statistics are collected]
+    """
+
+    def __init__(self, table_ref: TableRef, children=None):
+        super().__init__(OperatorType.LOGICALANALYZE, children)
+        self._table_ref = table_ref
+
+    @property
+    def table_ref(self):
+        return self._table_ref
+
+    def __eq__(self, other):
+        is_subtree_equal = super().__eq__(other)
+        if not isinstance(other, LogicalAnalyze):
+            return False
+        return is_subtree_equal and self._table_ref == other._table_ref
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self._table_ref))
+
+
 class LogicalCreateFunction(Operator):
     """
     Logical node for create function operations
@@ -18,10 +18,12 @@ from typing import List, Tuple
 if typing.TYPE_CHECKING:
     from evadb.optimizer.optimizer_context import OptimizerContext
 
+from evadb.catalog.catalog_type import ColumnType
 from evadb.catalog.catalog_utils import get_table_primary_columns
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.catalog.models.function_metadata_catalog import FunctionMetadataCatalogEntry
+from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.constants import CACHEABLE_FUNCTIONS, DEFAULT_FUNCTION_EXPRESSION_COST
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
 from evadb.expression.constant_value_expression import ConstantValueExpression
@@ -191,6 +193,101 @@ def extract_pushdown_predicate_for_alias(
     )
 
 
+def _is_storage_comparable(
+    column: TupleValueExpression, constant: ConstantValueExpression
+) -> bool:
+    """Checks whether the comparison between a table column and a constant gives
+    the same result when evaluated by the storage engine"""
+    col_object = column.col_object
+    # _row_number is not stored, it is generated while reading the table
+    if not isinstance(col_object, ColumnCatalogEntry) or (
+        col_object.name == ROW_NUM_COLUMN
+    ):
+        return False
+    value = constant.value
+    if col_object.type in [ColumnType.INTEGER, ColumnType.FLOAT]:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif col_object.type == ColumnType.TEXT:
+        return isinstance(value, str)
+    elif col_object.type == ColumnType.BOOLEAN:
+        return isinstance(value, bool)
+    return False
+
+
+def _is_storage_pushdown_predicate(
+    predicate: AbstractExpression, table_alias: str
+) -> bool:
+    if predicate.etype in [ExpressionType.LOGICAL_AND, ExpressionType.LOGICAL_OR]:
+        return all(
+            _is_storage_pushdown_predicate(child, table_alias)
+            for child in predicate.children
+        )
+
+    # NEQ is not pushed down since SQL drops the rows with NULL values,
+    # whereas the in-memory evaluation keeps them
+    if predicate.etype not in [
+        ExpressionType.COMPARE_EQUAL,
+        ExpressionType.COMPARE_GREATER,
+        ExpressionType.COMPARE_LESSER,
+        ExpressionType.COMPARE_GEQ,
+        ExpressionType.COMPARE_LEQ,
+        ExpressionType.COMPARE_LIKE,
+    ]:
+        return False
+
+    left, right = predicate.children
+    if isinstance(left, ConstantValueExpression) and isinstance(
+        right, TupleValueExpression
+    ):
+        if predicate.etype == ExpressionType.COMPARE_LIKE:
+            return False
+        left, right = right, left
+    return (
+        isinstance(left, TupleValueExpression)
+        and isinstance(right, ConstantValueExpression)
+        and left.table_alias == table_alias
+        and _is_storage_comparable(left, right)
+    )
+
+
+def extract_storage_pushdown_predicate(
+    predicate: AbstractExpression, table_alias: str
+) -> Tuple[AbstractExpression, AbstractExpression]:
+    """Decompose the predicate into the predicate that can be evaluated by the
+    storage engine of a structured table and the remaining predicate.
+
+    Conjuncts made of comparisons between a column of the table and a constant,
+    combined with AND/OR, are pushed down. The LIKE operator is evaluated as a
+    regular expression search by the storage engine, which is less strict than
+    the in-memory match, so conjuncts using it are also kept in the remaining
+    predicate.
+
+    Args:
+        predicate (AbstractExpression): predicate that needs to be decomposed
+        table_alias (str): alias of the table read by the storage engine
+    Returns:
+        Tuple[AbstractExpression, AbstractExpression]: (pushdown predicate,
+        remaining predicate)
+    """
+    if predicate is None:
+        return None, None
+
+    pushdown_preds = []
+    rem_pred = []
+    for pred in to_conjunction_list(predicate):
+        if _is_storage_pushdown_predicate(pred, table_alias):
+            pushdown_preds.append(pred)
+            if any(expr.etype == ExpressionType.COMPARE_LIKE for expr in pred.walk()):
+                rem_pred.append(pred)
+        else:
+            rem_pred.append(pred)
+
+    return (
+        conjunction_list_to_expression_tree(pushdown_preds),
+        conjunction_list_to_expression_tree(rem_pred),
+    )
+
+
 def optimize_cache_key_for_tuple_value_expression(
     context: "OptimizerContext", tv_expr: TupleValueExpression
 ):
@@ -70,6 +70,7 @@ class PlanGenerator:
         optimizer_context = OptimizerContext(
             self.db, self.cost_model, self.rules_manager
         )
+        self.cost_model.bind(optimizer_context)
         memo = optimizer_context.memo
         grp_expr = optimizer_context.add_opr_to_group(opr=logical_plan)
         root_grp_id = grp_expr.group_id
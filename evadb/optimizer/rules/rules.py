@@ -16,13 +16,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from evadb.catalog.catalog_type import TableType, VectorStoreType
+from evadb.catalog.catalog_type import TableType, VectorStoreType, VideoColumnName
 from evadb.catalog.catalog_utils import is_video_table
 from evadb.catalog.models.utils import IndexCatalogEntry
 from evadb.constants import CACHEABLE_FUNCTIONS
 from evadb.executor.execution_context import Context
+from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.expression_utils import (
     conjunction_list_to_expression_tree,
+    get_index_predicate,
     to_conjunction_list,
 )
 from evadb.expression.function_expression import FunctionExpression
@@ -34,11 +36,13 @@ from evadb.optimizer.optimizer_utils import (
     extract_equi_join_keys,
     extract_pushdown_predicate,
     extract_pushdown_predicate_for_alias,
+    extract_storage_pushdown_predicate,
     get_expression_execution_cost,
 )
 from evadb.optimizer.rules.pattern import Pattern
 from evadb.optimizer.rules.rules_base import Promise, Rule, RuleType
 from evadb.parser.types import JoinType, ParserOrderBySortType
+from evadb.plan_nodes.analyze_plan import AnalyzePlan
 from evadb.plan_nodes.apply_and_merge_plan import ApplyAndMergePlan
 from evadb.plan_nodes.create_from_select_plan import CreateFromSelectPlan
 from evadb.plan_nodes.exchange_plan import ExchangePlan
@@ -54,6 +58,7 @@ if TYPE_CHECKING:
 
 from evadb.optimizer.operators import (
     Dummy,
+    LogicalAnalyze,
     LogicalApplyAndMerge,
     LogicalCreate,
     LogicalCreateFunction,
@@ -116,26 +121,53 @@ class EmbedFilterIntoGet(Rule):
 
     def check(self, before: LogicalFilter, context: OptimizerContext):
         # System supports predicate pushdown only while reading video data
+        # and structured data
         predicate = before.predicate
         lget: LogicalGet = before.children[0]
         if predicate and is_video_table(lget.table_obj):
-            # System only supports pushing basic range predicates on id
-            video_alias = lget.video.alias
-            col_alias = f"{video_alias}.id"
-            pushdown_pred, _ = extract_pushdown_predicate(predicate, col_alias)
+            pushdown_pred, _ = self._get_video_pushdown_pred(predicate, lget)
             if pushdown_pred:
                 return True
+        elif predicate and lget.table_obj.table_type == TableType.STRUCTURED_DATA:
+            return len(self._get_structured_pushdown_preds(predicate, lget)) > 0
         return False
 
+    def _get_video_pushdown_pred(self, predicate, lget: LogicalGet):
+        # System only supports pushing basic range predicates on id and on the
+        # timestamp of the video frames, which the reader maps to frame ids
+        columns = [VideoColumnName.id.name]
+        if not lget.video.get_audio:
+            columns.append(VideoColumnName.seconds.name)
+        pushdown_preds = []
+        for column in columns:
+            col_alias = f"{lget.video.alias}.{column}"
+            pushdown_pred, predicate = extract_pushdown_predicate(predicate, col_alias)
+            if pushdown_pred:
+                pushdown_preds.append(pushdown_pred)
+        return conjunction_list_to_expression_tree(pushdown_preds), predicate
+
+    def _get_structured_pushdown_preds(self, predicate, lget: LogicalGet):
+        # skip the predicates that were already pushed, which are still part of
+        # the filter if the storage engine cannot evaluate them exactly
+        pushdown_pred, _ = extract_storage_pushdown_predicate(
+            predicate, lget.alias.alias_name
+        )
+        if pushdown_pred is None:
+            return []
+        pushed_preds = to_conjunction_list(lget.predicate) if lget.predicate else []
+        return [
+            pred
+            for pred in to_conjunction_list(pushdown_pred)
+            if pred not in pushed_preds
+        ]
+
     def apply(self, before: LogicalFilter, context: OptimizerContext):
         predicate = before.predicate
         lget = before.children[0]
-        # System only supports pushing basic range predicates on id
-        video_alias = lget.video.alias
-        col_alias = f"{video_alias}.id"
-        pushdown_pred, unsupported_pred = extract_pushdown_predicate(
-            predicate, col_alias
-        )
+        if lget.table_obj.table_type == TableType.STRUCTURED_DATA:
+            yield from self._apply_structured(before, lget)
+            return
+        pushdown_pred, unsupported_pred = self._get_video_pushdown_pred(predicate, lget)
         if pushdown_pred:
             new_get_opr = LogicalGet(
                 lget.video,
@@ -145,6 +177,8 @@ class EmbedFilterIntoGet(Rule):
                 target_list=lget.target_list,
                 sampling_rate=lget.sampling_rate,
                 sampling_type=lget.sampling_type,
+                columns=lget.columns,
+                frame_size=lget.frame_size,
                 children=lget.children,
             )
             if unsupported_pred:
@@ -155,6 +189,33 @@ class EmbedFilterIntoGet(Rule):
         else:
             yield before
 
+    def _apply_structured(self, before: LogicalFilter, lget: LogicalGet):
+        pushdown_preds = self._get_structured_pushdown_preds(before.predicate, lget)
+        _, remaining_pred = extract_storage_pushdown_predicate(
+            before.predicate, lget.alias.alias_name
+        )
+        pushed_preds = to_conjunction_list(lget.predicate) if lget.predicate else []
+        new_get_opr = LogicalGet(
+            lget.video,
+            lget.table_obj,
+            alias=lget.alias,
+            predicate=conjunction_list_to_expression_tree(
+                pushed_preds + pushdown_preds
+            ),
+            target_list=lget.target_list,
+            sampling_rate=lget.sampling_rate,
+            sampling_type=lget.sampling_type,
+            chunk_params=lget.chunk_params,
+            columns=lget.columns,
+            frame_size=lget.frame_size,
+            children=lget.children,
+        )
+        if remaining_pred:
+            remaining_opr = LogicalFilter(remaining_pred)
+            remaining_opr.append_child(new_get_opr)
+            new_get_opr = remaining_opr
+        yield new_get_opr
+
 
 class EmbedSampleIntoGet(Rule):
     def __init__(self):
@@ -184,11 +245,72 @@ class EmbedSampleIntoGet(Rule):
             target_list=lget.target_list,
             sampling_rate=sample_freq,
             sampling_type=sample_type,
+            columns=lget.columns,
+            frame_size=lget.frame_size,
             children=lget.children,
         )
         yield new_get_opr
 
 
+class EmbedIndexIntoGet(Rule):
+    """Reads a structured table through a BTREE index if the predicate pushed
+    into the LogicalGet restricts the indexed column. Equality lookups are
+    preferred over range scans when several indexes apply."""
+
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALGET)
+        super().__init__(RuleType.EMBED_INDEX_INTO_GET, pattern)
+
+    def promise(self):
+        return Promise.EMBED_INDEX_INTO_GET
+
+    def check(self, before: LogicalGet, context: OptimizerContext):
+        return (
+            before.predicate is not None
+            and before.index is None
+            and before.table_obj.table_type == TableType.STRUCTURED_DATA
+        )
+
+    def apply(self, before: LogicalGet, context: OptimizerContext):
+        selected_index = None
+        for index in context.db.catalog().get_all_index_catalog_entries():
+            if (
+                index.type != VectorStoreType.BTREE
+                or index.feat_column not in before.table_obj.columns
+            ):
+                continue
+            index_predicate = get_index_predicate(
+                before.predicate, index.feat_column.name
+            )
+            if index_predicate is None:
+                continue
+            is_equality_lookup = any(
+                pred.etype == ExpressionType.COMPARE_EQUAL
+                for pred in to_conjunction_list(index_predicate)
+            )
+            if selected_index is None or is_equality_lookup:
+                selected_index = index
+            if is_equality_lookup:
+                break
+
+        if selected_index is None:
+            return
+        yield LogicalGet(
+            before.video,
+            before.table_obj,
+            alias=before.alias,
+            predicate=before.predicate,
+            target_list=before.target_list,
+            sampling_rate=before.sampling_rate,
+            sampling_type=before.sampling_type,
+            chunk_params=before.chunk_params,
+            columns=before.columns,
+            index=selected_index,
+            frame_size=before.frame_size,
+            children=before.children,
+        )
+
+
 class CacheFunctionExpressionInProject(Rule):
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALPROJECT)
@@ -759,6 +881,25 @@ class LogicalRenameToPhysical(Rule):
         yield after
 
 
+class LogicalAnalyzeToPhysical(Rule):
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALANALYZE)
+        super().__init__(RuleType.LOGICAL_ANALYZE_TO_PHYSICAL, pattern)
+
+    def promise(self):
+        return Promise.LOGICAL_ANALYZE_TO_PHYSICAL
+
+    def check(self, before: Operator, context: OptimizerContext):
+        return True
+
+    def apply(self, before: LogicalAnalyze, context: OptimizerContext):
+        batch_mem_size = context.db.catalog().get_configuration_catalog_value(
+            "batch_mem_size"
+        )
+        after = AnalyzePlan(before.table_ref, batch_mem_size=batch_mem_size)
+        yield after
+
+
 class LogicalCreateFunctionToPhysical(Rule):
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALCREATEFUNCTION)
@@ -840,11 +981,13 @@ class LogicalCreateIndexToVectorIndex(Rule):
         batch_mem_size = context.db.catalog().get_configuration_catalog_value(
             "batch_mem_size"
         )
+        batch_size = context.db.catalog().get_configuration_catalog_value("batch_size")
         child.append_child(
             StoragePlan(
                 before.table_ref.table.table_obj,
                 before.table_ref,
                 batch_mem_size=batch_mem_size,
+                batch_size=batch_size,
             )
         )
         after.append_child(child)
@@ -932,13 +1075,24 @@ class LogicalGetToSeqScan(Rule):
         return True
 
     def apply(self, before: LogicalGet, context: OptimizerContext):
-        # Configure the batch_mem_size. It decides the number of rows
-        # read in a batch from storage engine.
+        # Configure the batch_mem_size and batch_size. They decide the number
+        # of rows read in a batch from storage engine.
         # Todo: Experiment heuristics.
         after = SeqScanPlan(None, before.target_list, before.alias)
         batch_mem_size = context.db.catalog().get_configuration_catalog_value(
             "batch_mem_size"
         )
+        batch_size = context.db.catalog().get_configuration_catalog_value("batch_size")
+        # frames are only decoded at the input size derived from the functions
+        # of the query if enabled, since it changes the frames they receive
+        frame_size = before.frame_size
+        if (
+            before.video.frame_size is None
+            and not context.db.catalog().get_configuration_catalog_value(
+                "resize_frames_to_function_input", False
+            )
+        ):
+            frame_size = None
         after.append_child(
             StoragePlan(
                 before.table_obj,
@@ -948,6 +1102,10 @@ class LogicalGetToSeqScan(Rule):
                 sampling_type=before.sampling_type,
                 chunk_params=before.chunk_params,
                 batch_mem_size=batch_mem_size,
+                columns=before.columns,
+                batch_size=batch_size,
+                index=before.index,
+                frame_size=frame_size,
             )
         )
         yield after
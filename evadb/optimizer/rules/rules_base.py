@@ -40,6 +40,7 @@ class RuleType(Flag):
     # REWRITE RULES BOTTOM UP APPLY SECOND (LOGICAL -> LOGICAL)
     EMBED_FILTER_INTO_GET = auto()
     EMBED_SAMPLE_INTO_GET = auto()
+    EMBED_INDEX_INTO_GET = auto()
     PUSHDOWN_FILTER_THROUGH_JOIN = auto()
     PUSHDOWN_FILTER_THROUGH_APPLY_AND_MERGE = auto()
     COMBINE_SIMILARITY_ORDERBY_AND_LIMIT_TO_VECTOR_INDEX_SCAN = auto()
@@ -66,6 +67,7 @@ class RuleType(Flag):
     LOGICAL_CREATE_TO_PHYSICAL = auto()
     LOGICAL_CREATE_FROM_SELECT_TO_PHYSICAL = auto()
     LOGICAL_RENAME_TO_PHYSICAL = auto()
+    LOGICAL_ANALYZE_TO_PHYSICAL = auto()
     LOGICAL_DROP_OBJECT_TO_PHYSICAL = auto()
     LOGICAL_CREATE_FUNCTION_TO_PHYSICAL = auto()
     LOGICAL_CREATE_FUNCTION_FROM_SELECT_TO_PHYSICAL = auto()
@@ -105,6 +107,7 @@ class Promise(IntEnum):
     LOGICAL_INSERT_TO_PHYSICAL = auto()
     LOGICAL_DELETE_TO_PHYSICAL = auto()
     LOGICAL_RENAME_TO_PHYSICAL = auto()
+    LOGICAL_ANALYZE_TO_PHYSICAL = auto()
     LOGICAL_DROP_OBJECT_TO_PHYSICAL = auto()
     LOGICAL_LOAD_TO_PHYSICAL = auto()
     LOGICAL_CREATE_TO_PHYSICAL = auto()
@@ -141,6 +144,7 @@ class Promise(IntEnum):
     # REWRITE RULES
     EMBED_FILTER_INTO_GET = auto()
     EMBED_SAMPLE_INTO_GET = auto()
+    EMBED_INDEX_INTO_GET = auto()
     XFORM_EXTRACT_OBJECT_TO_LINEAR_FLOW = auto()
     XFORM_LATERAL_JOIN_TO_LINEAR_FLOW = auto()
     PUSHDOWN_FILTER_THROUGH_JOIN = auto()
@@ -23,7 +23,9 @@ from evadb.optimizer.rules.rules import (
     CacheFunctionExpressionInProject,
     CombineSimilarityOrderByAndLimitToVectorIndexScan,
     EmbedFilterIntoGet,
+    EmbedIndexIntoGet,
     EmbedSampleIntoGet,
+    LogicalAnalyzeToPhysical,
     LogicalApplyAndMergeToPhysical,
     LogicalApplyAndMergeToRayPhysical,
     LogicalCreateFromSelectToPhysical,
@@ -83,6 +85,7 @@ class RulesManager:
             EmbedFilterIntoGet(),
             # EmbedFilterIntoDerivedGet(),
             EmbedSampleIntoGet(),
+            EmbedIndexIntoGet(),
             PushDownFilterThroughJoin(),
             PushDownFilterThroughApplyAndMerge(),
             CombineSimilarityOrderByAndLimitToVectorIndexScan(),
@@ -93,6 +96,7 @@ class RulesManager:
             LogicalCreateToPhysical(),
             LogicalCreateFromSelectToPhysical(),
             LogicalRenameToPhysical(),
+            LogicalAnalyzeToPhysical(),
             LogicalCreateFunctionToPhysical(),
             LogicalCreateFunctionFromSelectToPhysical(),
             LogicalDropObjectToPhysical(),
@@ -12,10 +12,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Dict, List, Set, Tuple
+
 from evadb.binder.binder_utils import get_bound_func_expr_outputs_as_tuple_value_expr
+from evadb.catalog.catalog_type import VideoColumnName
+from evadb.catalog.catalog_utils import is_video_table
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.optimizer.operators import (
+    LogicalAnalyze,
     LogicalCreate,
     LogicalCreateFunction,
     LogicalCreateIndex,
@@ -43,6 +51,7 @@ from evadb.optimizer.optimizer_utils import (
     column_definition_to_function_io,
     metadata_definition_to_function_metadata,
 )
+from evadb.parser.analyze_statement import AnalyzeTableStatement
 from evadb.parser.create_function_statement import CreateFunctionStatement
 from evadb.parser.create_index_statement import CreateIndexStatement
 from evadb.parser.create_statement import CreateTableStatement
@@ -63,6 +72,122 @@ from evadb.utils.logging_manager import logger
 class StatementToPlanConverter:
     def __init__(self):
         self._plan = None
+        # columns accessed by the select statement being converted, keyed by
+        # table alias
+        self._accessed_columns = None
+        # input frame sizes declared by the functions of the select statement
+        # being converted, keyed by table alias
+        self._input_frame_sizes = None
+
+    def _get_table_ref_expressions(self, table_ref: TableRef):
+        expr_list = []
+        if not isinstance(table_ref, TableRef):
+            return expr_list
+        if table_ref.is_join():
+            if table_ref.join_node.predicate is not None:
+                expr_list.append(table_ref.join_node.predicate)
+            expr_list.extend(self._get_table_ref_expressions(table_ref.join_node.left))
+            expr_list.extend(self._get_table_ref_expressions(table_ref.join_node.right))
+        elif table_ref.is_table_valued_expr():
+            expr_list.append(table_ref.table_valued_expr.func_expr)
+        return expr_list
+
+    def _get_statement_expressions(
+        self, statement: SelectStatement
+    ) -> List[AbstractExpression]:
+        expr_list = list(statement.target_list or [])
+        if statement.where_clause is not None:
+            expr_list.append(statement.where_clause)
+        if statement.groupby_clause is not None:
+            expr_list.append(statement.groupby_clause)
+        if statement.orderby_list is not None:
+            expr_list.extend(expr for expr, _ in statement.orderby_list)
+        expr_list.extend(self._get_table_ref_expressions(statement.from_table))
+        return expr_list
+
+    def _get_accessed_columns(self, statement: SelectStatement) -> Dict[str, Set]:
+        """Returns the names of the table columns accessed by the select
+        statement, keyed by table alias. A None value denotes that all the
+        columns of the table are required. Nested select statements are
+        handled while converting them.
+        """
+        accessed_columns = {}
+        for expr in self._get_statement_expressions(statement):
+            for tv_expr in expr.find_all(TupleValueExpression):
+                alias = tv_expr.table_alias
+                if isinstance(tv_expr.col_object, ColumnCatalogEntry):
+                    if accessed_columns.get(alias, set()) is not None:
+                        accessed_columns.setdefault(alias, set()).add(
+                            tv_expr.col_object.name
+                        )
+                else:
+                    accessed_columns[alias] = None
+        return accessed_columns
+
+    def _get_table_columns(self, table_obj: TableCatalogEntry, alias: str) -> List[str]:
+        if not self._accessed_columns or alias not in self._accessed_columns:
+            return None
+        accessed_columns = self._accessed_columns[alias]
+        if accessed_columns is None:
+            return None
+        return [col.name for col in table_obj.columns if col.name in accessed_columns]
+
+    def _get_input_frame_sizes(
+        self, statement: SelectStatement
+    ) -> Dict[str, Tuple[int, int]]:
+        """Returns the (width, height) the video frames of a table alias can be
+        decoded at. A size is only returned if the frames are passed directly
+        to functions that all declare the same fixed input frame size.
+        """
+        frame_sizes = {}
+        for expr in self._get_statement_expressions(statement):
+            # data columns consumed by a function with a declared input size
+            consumed = set()
+            for func_expr in expr.find_all(FunctionExpression):
+                for idx, child in enumerate(func_expr.children):
+                    if not self._is_data_column(child):
+                        continue
+                    frame_size = self._get_function_input_frame_size(func_expr, idx)
+                    alias = child.table_alias
+                    if frame_sizes.get(alias, frame_size) != frame_size:
+                        frame_size = None
+                    frame_sizes[alias] = frame_size
+                    consumed.add(id(child))
+            # the frames are required at their native size by any other use
+            for tv_expr in expr.find_all(TupleValueExpression):
+                if self._is_data_column(tv_expr) and id(tv_expr) not in consumed:
+                    frame_sizes[tv_expr.table_alias] = None
+        return frame_sizes
+
+    def _is_data_column(self, expr: AbstractExpression) -> bool:
+        return (
+            isinstance(expr, TupleValueExpression)
+            and isinstance(expr.col_object, ColumnCatalogEntry)
+            and expr.col_object.name == VideoColumnName.data.name
+        )
+
+    def _get_function_input_frame_size(
+        self, func_expr: FunctionExpression, arg_idx: int
+    ) -> Tuple[int, int]:
+        if func_expr.function_obj is None:
+            return None
+        inputs = [arg for arg in func_expr.function_obj.args if arg.is_input]
+        if arg_idx >= len(inputs):
+            return None
+        dims = tuple(inputs[arg_idx].array_dimensions or ())
+        if len(dims) < 3:
+            return None
+        if dims[-1] == 3:
+            # channels last, (..., height, width, 3)
+            height, width = dims[-3], dims[-2]
+        elif dims[-3] == 3:
+            # channels first, (..., 3, height, width)
+            height, width = dims[-2], dims[-1]
+        else:
+            return None
+        if not all(isinstance(dim, int) and dim > 0 for dim in (width, height)):
+            return None
+        return (width, height)
 
     def visit_table_ref(self, table_ref: TableRef):
         """Bind table ref object and convert to LogicalGet, LogicalJoin,
@@ -74,11 +199,20 @@ class StatementToPlanConverter:
         if table_ref.is_table_atom():
             # Table
             catalog_entry = table_ref.table.table_obj
+            frame_size = table_ref.frame_size
+            if frame_size is None and is_video_table(catalog_entry):
+                frame_size = (self._input_frame_sizes or {}).get(
+                    table_ref.alias.alias_name
+                )
             self._plan = LogicalGet(
                 table_ref,
                 catalog_entry,
                 table_ref.alias,
                 chunk_params=table_ref.chunk_params,
+                columns=self._get_table_columns(
+                    catalog_entry, table_ref.alias.alias_name
+                ),
+                frame_size=frame_size,
             )
 
         elif table_ref.is_table_valued_expr():
@@ -129,6 +263,11 @@ class StatementToPlanConverter:
         # order of evaluation
         # from, where, group by, select, order by, limit, union
 
+        outer_accessed_columns = self._accessed_columns
+        self._accessed_columns = self._get_accessed_columns(statement)
+        outer_input_frame_sizes = self._input_frame_sizes
+        self._input_frame_sizes = self._get_input_frame_sizes(statement)
+
         # if there is a table_ref, order by clause and no group by clause, we move all # the function expressions out of projection list to table valued expression.
         # This is done to handle the
         # https://github.com/georgia-tech-db/evadb/issues/1147
@@ -198,6 +337,9 @@ class StatementToPlanConverter:
         if statement.union_link is not None:
             self._visit_union(statement.union_link, statement.union_all)
 
+        self._accessed_columns = outer_accessed_columns
+        self._input_frame_sizes = outer_input_frame_sizes
+
     def _visit_sample(self, sample_freq, sample_type):
         sample_opr = LogicalSample(sample_freq, sample_type)
         sample_opr.append_child(self._plan)
@@ -302,6 +444,13 @@ class StatementToPlanConverter:
         rename_opr = LogicalRename(statement.old_table_ref, statement.new_table_name)
         self._plan = rename_opr
 
+    def visit_analyze(self, statement: AnalyzeTableStatement):
+        """Converter for parsed analyze statement
+        Arguments:
+            statement(AnalyzeTableStatement): [Analyze statement]
+        """
+        self._plan = LogicalAnalyze(statement.table_ref)
+
     def visit_create_function(self, statement: CreateFunctionStatement):
         """Converter for parsed create function statement
 
@@ -406,6 +555,8 @@ class StatementToPlanConverter:
             self.visit_create_index(statement)
         elif isinstance(statement, DeleteTableStatement):
             self.visit_delete(statement)
+        elif isinstance(statement, AnalyzeTableStatement):
+            self.visit_analyze(statement)
         return self._plan
 
     @property
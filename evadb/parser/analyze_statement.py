@@ -0,0 +1,44 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from evadb.parser.statement import AbstractStatement
+from evadb.parser.table_ref import TableRef
+from evadb.parser.types import StatementType
+
+
+class AnalyzeTableStatement(AbstractStatement):
+    """Analyze Table Statement constructed after parsing the input query
+
+    Attributes:
+        table_ref: table whose column statistics are collected
+    """
+
+    def __init__(self, table_ref: TableRef):
+        super().__init__(StatementType.ANALYZE)
+        self._table_ref = table_ref
+
+    def __str__(self) -> str:
+        return "ANALYZE TABLE {}".format(self._table_ref.table.table_name)
+
+    @property
+    def table_ref(self):
+        return self._table_ref
+
+    def __eq__(self, other):
+        if not isinstance(other, AnalyzeTableStatement):
+            return False
+        return self.table_ref == other.table_ref
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.table_ref))
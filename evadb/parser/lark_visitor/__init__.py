@@ -16,6 +16,7 @@ from typing import List, TypeVar
 
 from lark import Tree, visitors
 
+from evadb.parser.lark_visitor._analyze_statement import Analyze
 from evadb.parser.lark_visitor._common_clauses_ids import CommonClauses
 from evadb.parser.lark_visitor._create_statements import (
     CreateDatabase,
@@ -78,6 +79,7 @@ class LarkInterpreter(
     DropObject,
     Show,
     Explain,
+    Analyze,
     Delete,
     Use,
     Set,
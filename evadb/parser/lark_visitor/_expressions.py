@@ -20,6 +20,7 @@ from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.logical_expression import LogicalExpression
+from evadb.parser.select_statement import SelectStatement
 from evadb.utils.generic_utils import string_comparison_case_insensitive
 
 
@@ -72,6 +73,40 @@ class Expressions:
         right = self.visit(tree.children[2])
         return ComparisonExpression(op, left, right)
 
+    def in_predicate(self, tree):
+        # `col IN (a, b, c)` is rewritten into a balanced disjunction of
+        # equality predicates, so that the rest of the system, including
+        # predicate push-down, only deals with comparison expressions
+        left = self.visit(tree.children[0])
+        negate = False
+        values = None
+        for child in tree.children[1:]:
+            if isinstance(child, Tree):
+                values = self.visit(child)
+                if isinstance(values, SelectStatement):
+                    raise NotImplementedError("IN with a subquery is not supported")
+                if not isinstance(values, list):
+                    values = [values]
+            elif string_comparison_case_insensitive(str(child), "NOT"):
+                negate = True
+
+        def _disjunction(values):
+            if len(values) == 1:
+                return ComparisonExpression(
+                    ExpressionType.COMPARE_EQUAL, left.copy(), values[0]
+                )
+            mid = len(values) // 2
+            return LogicalExpression(
+                ExpressionType.LOGICAL_OR,
+                _disjunction(values[:mid]),
+                _disjunction(values[mid:]),
+            )
+
+        in_expr = _disjunction(values)
+        if negate:
+            return LogicalExpression(ExpressionType.LOGICAL_NOT, in_expr, None)
+        return in_expr
+
     def nested_expression_atom(self, tree):
         # Todo Can there be >1 expression in this case
         expr = tree.children[0]
@@ -143,6 +178,12 @@ class Expressions:
         else:
             return ConstantValueExpression(sample_list[1]), ConstantValueExpression(1)
 
+    def resize_clause(self, tree):
+        resize_list = self.visit_children(tree)
+        assert len(resize_list) == 3
+        # width, height
+        return (resize_list[1], resize_list[2])
+
     def chunk_params(self, tree):
         chunk_params = self.visit_children(tree)
         assert len(chunk_params) == 2 or len(chunk_params) == 4
@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from lark.tree import Tree
+from lark import Token, Tree
 
 from evadb.parser.load_statement import LoadDataStatement
 from evadb.parser.types import FileFormatType
@@ -29,14 +29,19 @@ class Load:
         file_options["file_format"] = file_format
 
         file_path = self.visit(tree.children[2]).value
-        table = self.visit(tree.children[4])
 
         # set default for column_list as None
         column_list = None
         for child in tree.children:
             if isinstance(child, Tree):
-                if child.data == "uid_list":
+                if child.data == "table_name":
+                    table = self.visit(child)
+                elif child.data == "uid_list":
                     column_list = self.visit(child)
+            elif isinstance(child, Token):
+                # replace the files that changed since they were loaded
+                if child.type == "REPLACE":
+                    file_options["replace"] = True
 
         stmt = LoadDataStatement(table, file_path, column_list, file_options)
         return stmt
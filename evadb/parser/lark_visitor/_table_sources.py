@@ -73,6 +73,7 @@ class TableSources:
         alias = None
         table = None
         chunk_params = {}
+        frame_size = None
 
         for child in tree.children:
             if isinstance(child, Tree):
@@ -82,6 +83,8 @@ class TableSources:
                     sample_type, sample_freq = self.visit(child)
                 elif child.data == "chunk_params":
                     chunk_params = self.visit(child)
+                elif child.data == "resize_clause":
+                    frame_size = self.visit(child)
                 elif child.data == "alias_clause":
                     alias = self.visit(child)
 
@@ -91,6 +94,7 @@ class TableSources:
             sample_freq=sample_freq,
             sample_type=sample_type,
             chunk_params=chunk_params,
+            frame_size=frame_size,
         )
 
     def table_source_item(self, tree):
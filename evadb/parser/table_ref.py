@@ -14,7 +14,7 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import Union
+from typing import Tuple, Union
 
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.expression.function_expression import FunctionExpression
@@ -151,6 +151,7 @@ class TableRef:
             SelectStatement: select statement in case of nested queries,
             JoinNode: join node in case of join queries
         sample_freq: sampling frequency for the table reference
+        frame_size: (width, height) the frames of a video table are decoded at
     """
 
     def __init__(
@@ -162,6 +163,7 @@ class TableRef:
         get_audio: bool = False,
         get_video: bool = False,
         chunk_params: dict = {},
+        frame_size: Tuple[int, int] = None,
     ):
         # clean up so that we can support arbitrary new attributes
         self._ref_handle = table
@@ -173,6 +175,8 @@ class TableRef:
         # related to DOCUMENT tables
         # chunk_size, chunk_overlap
         self.chunk_params = chunk_params
+        # related to VIDEO tables
+        self.frame_size = frame_size
         # Alias generation must happen after ref handle is initialized
         self.alias = alias or self.generate_alias()
 
@@ -284,6 +288,9 @@ class TableRef:
                 )
             )
 
+        if self.frame_size is not None:
+            parts.append(f"RESIZE {self.frame_size[0]} {self.frame_size[1]}")
+
         return " ".join(parts)
 
     def __eq__(self, other):
@@ -297,6 +304,7 @@ class TableRef:
             and self.get_video == other.get_video
             and self.get_audio == other.get_audio
             and self.chunk_params == other.chunk_params
+            and self.frame_size == other.frame_size
         )
 
     def __hash__(self) -> int:
@@ -309,5 +317,6 @@ class TableRef:
                 self.get_video,
                 self.get_audio,
                 frozenset(self.chunk_params.items()),
+                self.frame_size,
             )
         )
@@ -43,6 +43,7 @@ class StatementType(EvaDBEnum):
     USE  # noqa: F821
     SET  # noqa: F821
     CREATE_JOB  # noqa: F821
+    ANALYZE  # noqa: F821
     # add other types
 
 
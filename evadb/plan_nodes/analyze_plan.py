@@ -0,0 +1,46 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from evadb.parser.table_ref import TableRef
+from evadb.plan_nodes.abstract_plan import AbstractPlan
+from evadb.plan_nodes.types import PlanOprType
+
+
+class AnalyzePlan(AbstractPlan):
+    """
+    This plan is used for storing information required for analyze table
+    operations.
+    Arguments:
+        table_ref {TableRef} -- table whose column statistics are collected
+        batch_mem_size {int} -- memory budget of the batches read while scanning
+    """
+
+    def __init__(self, table_ref: TableRef, batch_mem_size: int = 30000000):
+        super().__init__(PlanOprType.ANALYZE)
+        self._table_ref = table_ref
+        self._batch_mem_size = batch_mem_size
+
+    @property
+    def table_ref(self):
+        return self._table_ref
+
+    @property
+    def batch_mem_size(self):
+        return self._batch_mem_size
+
+    def __str__(self):
+        return "AnalyzePlan(table_ref={})".format(self._table_ref)
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.table_ref, self.batch_mem_size))
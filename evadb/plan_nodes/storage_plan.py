@@ -12,7 +12,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List, Tuple
+
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.models.utils import IndexCatalogEntry
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.parser.table_ref import TableRef
 from evadb.plan_nodes.abstract_plan import AbstractPlan
@@ -34,6 +37,13 @@ class StoragePlan(AbstractPlan):
         curr_shard (int): current curr_shard if data is sharded
         sampling_rate (int): uniform sampling rate
         sampling_type (str): special sampling type like IFRAMES
+        columns (List[str]): names of the columns to read, all the columns are
+            read if not specified
+        batch_size (int): maximum number of rows in a batch read from storage
+        index (IndexCatalogEntry): index used to find the rows satisfying the
+            predicate
+        frame_size (Tuple[int, int]): (width, height) the video frames are
+            decoded at, frames are decoded at their native size if not specified
     """
 
     def __init__(
@@ -50,6 +60,10 @@ class StoragePlan(AbstractPlan):
         batch_mem_size: int = 30000000,
         sampling_type: str = None,
         chunk_params: dict = {},
+        columns: List[str] = None,
+        batch_size: int = None,
+        index: IndexCatalogEntry = None,
+        frame_size: Tuple[int, int] = None,
     ):
         super().__init__(PlanOprType.STORAGE_PLAN)
         self._table = table
@@ -64,6 +78,10 @@ class StoragePlan(AbstractPlan):
         self._sampling_rate = sampling_rate
         self._sampling_type = sampling_type
         self.chunk_params = chunk_params
+        self._columns = columns
+        self._batch_size = batch_size
+        self._index = index
+        self._frame_size = frame_size
 
     @property
     def table(self):
@@ -109,6 +127,22 @@ class StoragePlan(AbstractPlan):
     def sampling_type(self):
         return self._sampling_type
 
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def frame_size(self):
+        return self._frame_size
+
     def __str__(self):
         return "StoragePlan(video={}, \
             table_ref={},\
@@ -120,7 +154,11 @@ class StoragePlan(AbstractPlan):
             curr_shard={}, \
             predicate={}, \
             sampling_rate={}, \
-            sampling_type={})".format(
+            sampling_type={}, \
+            columns={}, \
+            batch_size={}, \
+            index={}, \
+            frame_size={})".format(
             self._table,
             self._table_ref,
             self._batch_mem_size,
@@ -132,6 +170,10 @@ class StoragePlan(AbstractPlan):
             self._predicate,
             self._sampling_rate,
             self._sampling_type,
+            self._columns,
+            self._batch_size,
+            self._index,
+            self._frame_size,
         )
 
     def __hash__(self) -> int:
@@ -150,5 +192,9 @@ class StoragePlan(AbstractPlan):
                 self.sampling_rate,
                 self.sampling_type,
                 frozenset(self.chunk_params.items()),
+                tuple(self.columns or []),
+                self.batch_size,
+                self.index,
+                self.frame_size,
             )
         )
@@ -25,6 +25,7 @@ class PlanOprType(Enum):
     DELETE = auto()
     CREATE = auto()
     RENAME = auto()
+    ANALYZE = auto()
     DROP_OBJECT = auto()
     CREATE_FUNCTION = auto()
     LOAD_DATA = auto()
@@ -20,7 +20,7 @@ import pandas as pd
 
 from evadb.models.storage.batch import Batch
 from evadb.utils.errors import DatasetFileNotFoundError
-from evadb.utils.generic_utils import get_size
+from evadb.utils.generic_utils import BatchSizer
 
 
 class AbstractReader(metaclass=ABCMeta):
@@ -31,9 +31,13 @@ class AbstractReader(metaclass=ABCMeta):
 
     Attributes:
         file_url (str): path to read data from
+        batch_mem_size (int): the maximum memory size of a batch
+        batch_size (int): the maximum number of rows in a batch
     """
 
-    def __init__(self, file_url: str, batch_mem_size: int = 30000000):
+    def __init__(
+        self, file_url: str, batch_mem_size: int = 30000000, batch_size: int = None
+    ):
         # Check if the file still exists, if not raise an exception
         if not Path(file_url).exists():
             raise DatasetFileNotFoundError()
@@ -42,6 +46,7 @@ class AbstractReader(metaclass=ABCMeta):
             file_url = str(file_url)
         self.file_url = file_url
         self.batch_mem_size = batch_mem_size
+        self.batch_size = batch_size
 
     def read(self) -> Iterator[Batch]:
         """
@@ -50,13 +55,10 @@ class AbstractReader(metaclass=ABCMeta):
         """
 
         data_batch = []
-        row_size = None
+        batch_sizer = BatchSizer(self.batch_mem_size, self.batch_size)
         for data in self._read():
-            if row_size is None:
-                row_size = 0
-                row_size = get_size(data)
             data_batch.append(data)
-            if len(data_batch) * row_size >= self.batch_mem_size:
+            if batch_sizer.add(data):
                 yield Batch(pd.DataFrame(data_batch))
                 data_batch = []
         if data_batch:
@@ -12,15 +12,67 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+import csv
+from typing import Dict, Iterator, List
 
 import numpy as np
 import pandas as pd
 
+from evadb.catalog.catalog_type import ColumnType
 from evadb.catalog.sql_config import IDENTIFIER_COLUMN
+from evadb.models.storage.batch import Batch
 from evadb.readers.abstract_reader import AbstractReader
+from evadb.utils.generic_utils import is_pyarrow_available
 from evadb.utils.logging_manager import logger
 
+# rows per chunk read by pandas when pyarrow is not available
+PANDAS_CHUNK_SIZE = 512
+
+# upper bound of the bytes of csv text parsed per block by pyarrow
+MAX_BLOCK_SIZE = 2**30
+
+
+def _split_ndarray_values(values: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Splits the flat values of an ndarray column into the arrays of its
+    rows, which are views of `values`, and returns them as an object column"""
+    if len(lengths) and (lengths == lengths[0]).all():
+        arrays = values.reshape(len(lengths), lengths[0])
+    else:
+        arrays = np.split(values, np.cumsum(lengths)[:-1])
+    # filled one row at a time, numpy would otherwise make a 2d array of rows
+    # with the same length
+    column = np.empty(len(lengths), dtype=object)
+    for i in range(len(lengths)):
+        column[i] = arrays[i]
+    return column
+
+
+def _parse_ndarray_column_with_pyarrow(column) -> np.ndarray:
+    """Converts an arrow column of strings of comma separated values into
+    float32 arrays, parsing all the values of the column at once"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    lists = pc.split_pattern(column, ",")
+    values = pc.cast(pc.utf8_trim_whitespace(lists.flatten()), pa.float32())
+    offsets = lists.offsets.to_numpy()
+    arrays = _split_ndarray_values(
+        values.to_numpy(zero_copy_only=False), np.diff(offsets)
+    )
+    if column.null_count:
+        arrays[column.is_null().to_numpy(zero_copy_only=False)] = None
+    return arrays
+
+
+def _parse_ndarray_column_with_pandas(column: pd.Series) -> np.ndarray:
+    """Converts a column of strings of comma separated values into float32
+    arrays, parsing all the values of the column at once"""
+    values = np.array(",".join(column).split(","), dtype=np.float32)
+    lengths = column.str.count(",").to_numpy() + 1
+    return _split_ndarray_values(values, lengths)
+
 
 class CSVReader(AbstractReader):
     def __init__(self, *args, column_list, **kwargs):
@@ -34,37 +86,101 @@ class CSVReader(AbstractReader):
         self._column_list = column_list
         super().__init__(*args, **kwargs)
 
-    def _read(self) -> Iterator[Dict]:
-        # TODO: What is a good location to put this code?
-        def convert_csv_string_to_ndarray(row_string):
-            """
-            Convert a string of comma separated values to a numpy
-            float array
-            """
-            return np.array([np.float32(val) for val in row_string.split(",")])
-
+    def read(self) -> Iterator[Batch]:
+        """Yields the rows of the file in batches built a column at a time,
+        parsed by pyarrow with multiple threads if it is installed"""
         logger.info("Reading CSV frames")
+        if is_pyarrow_available():
+            frames = self._read_frames_with_pyarrow()
+        else:
+            frames = self._read_frames_with_pandas()
+        for frame in frames:
+            if not self.batch_size:
+                yield Batch(frame)
+                continue
+            for start in range(0, len(frame), self.batch_size):
+                yield Batch(frame.iloc[start : start + self.batch_size])
+
+    def _read(self) -> Iterator[Dict]:
+        for batch in self.read():
+            for _, row in batch.frames.iterrows():
+                yield row
 
+    def _get_column_names(self) -> List[str]:
         # TODO: Need to add strong sanity checks on the columns.
 
-        # Read the csv in chunks, and only keep the columns we need.
+        # Only keep the columns we need, in the order of the file.
         # Ignore _row_id that we don't need to take care of.
-        col_list_names = [
+        col_list_names = {
             col.name for col in self._column_list if col.name != IDENTIFIER_COLUMN
-        ]
+        }
+        with open(self.file_url, newline="") as f:
+            header = next(csv.reader(f), [])
+        return [name for name in header if name in col_list_names]
+
+    def _get_column_type(self, name: str) -> ColumnType:
+        for col in self._column_list:
+            if col.name == name and col.col_object is not None:
+                return col.col_object.type
+        return None
+
+    def _read_frames_with_pyarrow(self) -> Iterator[pd.DataFrame]:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
 
-        col_map = {col.name: col for col in self._column_list}
-        for chunk in pd.read_csv(self.file_url, chunksize=512, usecols=col_list_names):
+        col_list_names = self._get_column_names()
+        # the types of the columns are pinned from the catalog, arrow would
+        # otherwise infer them from the first block only, e.g. read a float
+        # column as integers, and parse text columns holding dates
+        arrow_types = {
+            ColumnType.TEXT: pa.string(),
+            ColumnType.NDARRAY: pa.string(),
+            ColumnType.INTEGER: pa.int64(),
+            ColumnType.FLOAT: pa.float64(),
+            ColumnType.BOOLEAN: pa.bool_(),
+        }
+        column_types = {}
+        for name in col_list_names:
+            arrow_type = arrow_types.get(self._get_column_type(name))
+            if arrow_type is not None:
+                column_types[name] = arrow_type
+        reader = pa_csv.open_csv(
+            self.file_url,
+            read_options=pa_csv.ReadOptions(
+                use_threads=True,
+                block_size=min(self.batch_mem_size, MAX_BLOCK_SIZE),
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=col_list_names,
+                column_types=column_types,
+                strings_can_be_null=True,
+            ),
+        )
+        for record_batch in reader:
+            columns = {}
+            for name, column in zip(record_batch.schema.names, record_batch.columns):
+                if (
+                    pa.types.is_string(column.type)
+                    and self._get_column_type(name) == ColumnType.NDARRAY
+                ):
+                    # convert the strings to numpy arrays
+                    columns[name] = _parse_ndarray_column_with_pyarrow(column)
+                else:
+                    columns[name] = column.to_pandas()
+            yield pd.DataFrame(columns)
+
+    def _read_frames_with_pandas(self) -> Iterator[pd.DataFrame]:
+        col_list_names = self._get_column_names()
+        chunksize = self.batch_size or PANDAS_CHUNK_SIZE
+        for chunk in pd.read_csv(
+            self.file_url, chunksize=chunksize, usecols=col_list_names
+        ):
             # apply the required conversions
             for col in chunk.columns:
-                # TODO: Is there a better way to do this?
                 if (
                     isinstance(chunk[col].iloc[0], str)
-                    and col_map[col].col_object.type.name == "NDARRAY"
+                    and self._get_column_type(col) == ColumnType.NDARRAY
                 ):
-                    # convert the string to a numpy array
-                    chunk[col] = chunk[col].apply(convert_csv_string_to_ndarray)
-
-            # yield the chunk
-            for chunk_index, chunk_row in chunk.iterrows():
-                yield chunk_row
+                    # convert the strings to numpy arrays
+                    chunk[col] = _parse_ndarray_column_with_pandas(chunk[col])
+            yield chunk
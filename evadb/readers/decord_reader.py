@@ -12,19 +12,153 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+import operator
+import os
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
 
 import numpy as np
+import pandas as pd
 
 from evadb.catalog.catalog_type import VideoColumnName
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
-from evadb.constants import AUDIORATE, IFRAMES
-from evadb.expression.abstract_expression import AbstractExpression
-from evadb.expression.expression_utils import extract_range_list_from_predicate
+from evadb.constants import AUDIORATE, DIFF, IFRAMES
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.expression_utils import (
+    conjunction_list_to_expression_tree,
+    extract_range_list_from_predicate,
+    to_conjunction_list,
+)
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
 from evadb.readers.abstract_reader import AbstractReader
-from evadb.utils.generic_utils import try_to_import_decord
+from evadb.utils.frame_cache import FrameCache
+from evadb.utils.generic_utils import (
+    get_row_size,
+    try_to_import_cv2,
+    try_to_import_decord,
+)
 from evadb.utils.logging_manager import logger
 
+# (width, height) of the frames compared by DIFF sampling
+DIFF_FRAME_SIZE = (64, 64)
+# number of frames decoded at a time by DIFF sampling
+DIFF_BATCH_SIZE = 256
+# column of the batches of DIFF sampling holding the id of the last frame every
+# returned frame stands in for
+DIFF_LAST_ID_COLUMN = "last_id"
+
+
+@dataclass
+class VideoMetadata:
+    """Properties of a video computed once when the video is loaded, so that
+    scans do not need to open the file to learn them.
+
+    Attributes:
+        num_frames (int): number of frames of the video
+        fps (float): average frame rate
+        duration (float): duration of the video in seconds
+        height (int): height of the frames
+        width (int): width of the frames
+        keyframes (np.ndarray): ids of the key frames
+        timestamps (np.ndarray): (num_frames, 2) array of the start and end
+            time of every frame in seconds
+    """
+
+    num_frames: int
+    fps: float
+    duration: float
+    height: int
+    width: int
+    keyframes: np.ndarray
+    timestamps: np.ndarray
+
+    @classmethod
+    def columns(cls) -> List[str]:
+        return list(cls.__dataclass_fields__.keys())
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "VideoMetadata":
+        """Returns the metadata stored in a row of the metadata table of a
+        video table, None if the video was loaded without metadata"""
+        for name in cls.columns():
+            value = row.get(name)
+            if value is None or (np.isscalar(value) and pd.isna(value)):
+                return None
+        return cls(**{name: row[name] for name in cls.columns()})
+
+    def to_row(self) -> Dict:
+        return {name: getattr(self, name) for name in self.columns()}
+
+
+def read_video_metadata(file_url: str) -> VideoMetadata:
+    try_to_import_decord()
+    import decord
+
+    reader = decord.VideoReader(str(file_url))
+    num_frames = len(reader)
+    height, width = reader[0].shape[:2] if num_frames else (0, 0)
+    timestamps = np.asarray(
+        reader.get_frame_timestamp(list(range(num_frames)))
+    ).reshape(num_frames, 2)
+    return VideoMetadata(
+        num_frames=num_frames,
+        fps=float(reader.get_avg_fps()),
+        duration=float(timestamps[-1, 1]) if num_frames else 0.0,
+        height=int(height),
+        width=int(width),
+        keyframes=np.asarray(reader.get_key_indices(), dtype=np.int64),
+        timestamps=timestamps,
+    )
+
+
+_COMPARISONS = {
+    ExpressionType.COMPARE_EQUAL: operator.eq,
+    ExpressionType.COMPARE_NEQ: operator.ne,
+    ExpressionType.COMPARE_GREATER: operator.gt,
+    ExpressionType.COMPARE_GEQ: operator.ge,
+    ExpressionType.COMPARE_LESSER: operator.lt,
+    ExpressionType.COMPARE_LEQ: operator.le,
+}
+
+# comparisons with the constant on the left, e.g. 5 < seconds
+_FLIPPED_COMPARISONS = {
+    ExpressionType.COMPARE_GREATER: ExpressionType.COMPARE_LESSER,
+    ExpressionType.COMPARE_LESSER: ExpressionType.COMPARE_GREATER,
+    ExpressionType.COMPARE_GEQ: ExpressionType.COMPARE_LEQ,
+    ExpressionType.COMPARE_LEQ: ExpressionType.COMPARE_GEQ,
+}
+
+
+def _evaluate_predicate(
+    predicate: AbstractExpression, values: np.ndarray
+) -> np.ndarray:
+    """Evaluates a simple predicate on a single column, see
+    `is_simple_predicate`, on all the values of the column at once.
+
+    Returns:
+        np.ndarray: boolean mask of the values satisfying the predicate
+    """
+    if predicate.etype == ExpressionType.LOGICAL_NOT:
+        return ~_evaluate_predicate(predicate.children[0], values)
+    if predicate.etype in [ExpressionType.LOGICAL_AND, ExpressionType.LOGICAL_OR]:
+        left = _evaluate_predicate(predicate.children[0], values)
+        right = _evaluate_predicate(predicate.children[1], values)
+        if predicate.etype == ExpressionType.LOGICAL_AND:
+            return left & right
+        return left | right
+
+    left, right = predicate.children
+    etype = predicate.etype
+    if isinstance(left, ConstantValueExpression):
+        left, right = right, left
+        etype = _FLIPPED_COMPARISONS.get(etype, etype)
+    if etype not in _COMPARISONS or not isinstance(right, ConstantValueExpression):
+        raise RuntimeError(f"Contains unsupported expression {predicate}")
+    return _COMPARISONS[etype](values, right.value)
+
 
 class DecordReader(AbstractReader):
     def __init__(
@@ -35,6 +169,11 @@ class DecordReader(AbstractReader):
         sampling_type: str = None,
         read_audio: bool = False,
         read_video: bool = True,
+        frame_cache: FrameCache = None,
+        metadata: VideoMetadata = None,
+        frame_size: Tuple[int, int] = None,
+        audio_window: float = None,
+        audio_window_overlap: float = None,
         **kwargs,
     ):
         """Read frames from the disk
@@ -45,32 +184,109 @@ class DecordReader(AbstractReader):
             can be converted to ranges. Defaults to None.
             sampling_rate (int, optional): Set if the caller wants one frame
             every `sampling_rate` number of frames. For example, if `sampling_rate = 10`, it returns every 10th frame. If both `predicate` and `sampling_rate` are specified, `sampling_rate` is given precedence.
-            sampling_type (str, optional): Set as IFRAMES if caller want to sample on top on iframes only. e.g if the IFRAME frame numbers are [10,20,30,40,50] then 'SAMPLE IFRAMES 2' will return [10,30,50]
+            sampling_type (str, optional): Set as IFRAMES if caller want to sample on top on iframes only. e.g if the IFRAME frame numbers are [10,20,30,40,50] then 'SAMPLE IFRAMES 2' will return [10,30,50]. Set as DIFF to only return the frames that changed since the last returned frame, `sampling_rate` is then the threshold on the mean absolute difference of the grayscale frames (0-255), e.g. 'SAMPLE DIFF 10'
             read_audio (bool, optional): Whether to read audio stream from the video. Defaults to False
-            read_video (bool, optional): Whether to read video stream from the video. Defaults to True
+            read_video (bool, optional): Whether to read video stream from the video. If not set, the frames are not decoded: only their ids and timestamps are read and the data column is empty. Defaults to True
+            frame_cache (FrameCache, optional): cache consulted before decoding video frames, and filled with the frames decoded. Defaults to None
+            metadata (VideoMetadata, optional): metadata of the video stored when it was loaded. The frame count, the key frames and the timestamps are read from it instead of the file, which is only opened to decode frames. Defaults to None
+            frame_size (Tuple[int, int], optional): (width, height) the video frames are decoded at. Resizing while decoding is much cheaper than decoding full size frames and resizing them afterwards. Defaults to None, which decodes the frames at their native size
+            audio_window (float, optional): If set, the audio track is streamed in windows of `audio_window` seconds, one window per batch and row, instead of being returned as a single batch of audio frames. The id of a row is the index of its window and seconds is the start time of the window. Defaults to None
+            audio_window_overlap (float, optional): seconds shared by consecutive audio windows. Defaults to None
         """
         self._predicate = predicate
         self._sampling_rate = sampling_rate or 1
         self._sampling_type = sampling_type
         self._read_audio = read_audio
         self._read_video = read_video
+        self._frame_cache = frame_cache
+        self._video_key = None
+        # the metadata describes the video stream, not the audio one
+        self._metadata = None if read_audio else metadata
+        self._frame_size = None if read_audio else frame_size
+        self._audio_window = audio_window if read_audio else None
+        self._audio_window_overlap = audio_window_overlap or 0
+        self._audio_sample_rate = None
         self._reader = None
+        self._resize_frames = False
+        self._diff_reader = None
+        self._diff_last_ids = {}
         self._get_frame = None
         super().__init__(*args, **kwargs)
         self.initialize_reader()
 
+    def read(self) -> Iterator[Batch]:
+        """
+        Video frames are fetched a batch at a time with a single `get_batch`
+        call, which lets decord decode runs of frames sequentially instead of
+        seeking for every frame. Audio is read frame by frame.
+        """
+        if self._read_audio:
+            if self._audio_window:
+                yield from self._read_audio_windows()
+            else:
+                yield from super().read()
+            return
+
+        frame_ids = self._get_frame_ids()
+        first_frame_id = next(frame_ids, None)
+        if first_frame_id is None:
+            return
+        first_frame = None
+        if self._read_video and self._get_frame_shape() is None:
+            # the size of the frames is only known once one of them is
+            # decoded, it is then reused in the first batch
+            first_frame = self._get_frames([first_frame_id])[0]
+        rows_per_batch = self._get_rows_per_batch(first_frame_id, first_frame)
+        batch_frame_ids = [first_frame_id] + list(islice(frame_ids, rows_per_batch - 1))
+        while batch_frame_ids:
+            yield self._get_video_batch(batch_frame_ids, first_frame)
+            first_frame = None
+            batch_frame_ids = list(islice(frame_ids, rows_per_batch))
+
+    def _read_audio_windows(self) -> Iterator[Batch]:
+        """Streams the audio track in fixed length windows, so that a long
+        recording is never held in a single batch"""
+        window = max(1, int(self._audio_window * self._audio_sample_rate))
+        step = window - int(self._audio_window_overlap * self._audio_sample_rate)
+        assert step > 0, "Audio window overlap must be shorter than the window"
+        num_samples = self._reader.shape[1]
+        # the last window is the first one reaching the end of the track
+        num_windows = -(-max(num_samples - window, 0) // step) + 1
+        for begin, end in self._get_range_list(num_windows):
+            for window_id in range(max(begin, 0), min(end, num_windows - 1) + 1):
+                start = window_id * step
+                samples = self._reader[start : start + window].asnumpy()[0]
+                yield Batch(
+                    pd.DataFrame(
+                        {
+                            VideoColumnName.id.name: [window_id],
+                            ROW_NUM_COLUMN: [window_id],
+                            VideoColumnName.data.name: [np.empty(0)],
+                            VideoColumnName.seconds.name: [
+                                round(start / self._audio_sample_rate, 2)
+                            ],
+                            VideoColumnName.audio.name: [samples],
+                        }
+                    )
+                )
+
     def _read(self) -> Iterator[Dict]:
-        num_frames = int(len(self._reader))
-        if self._predicate:
-            range_list = extract_range_list_from_predicate(
-                self._predicate, 0, num_frames - 1
-            )
+        for frame_id in self._get_frame_ids():
+            yield self._get_frame(frame_id)
+
+    def _get_frame_ids(self) -> Iterator[int]:
+        if self._metadata is not None:
+            num_frames = self._metadata.num_frames
         else:
-            range_list = [(0, num_frames - 1)]
+            num_frames = int(len(self._reader))
+        range_list = self._get_range_list(num_frames)
         logger.debug("Reading frames")
 
         if self._sampling_type == IFRAMES:
-            iframes = self._reader.get_key_indices()
+            if self._metadata is not None:
+                iframes = self._metadata.keyframes
+            else:
+                iframes = self._reader.get_key_indices()
             idx = 0
             for begin, end in range_list:
                 while idx < len(iframes) and iframes[idx] < begin:
@@ -79,21 +295,246 @@ class DecordReader(AbstractReader):
                 while idx < len(iframes) and iframes[idx] <= end:
                     frame_id = iframes[idx]
                     idx += self._sampling_rate
-                    yield self._get_frame(frame_id)
+                    yield frame_id
+
+        elif self._sampling_type == DIFF:
+            yield from self._get_changed_frame_ids(
+                frame_id
+                for begin, end in range_list
+                for frame_id in range(begin, end + 1)
+            )
 
         elif self._sampling_rate == 1 or self._read_audio:
             for begin, end in range_list:
-                frame_id = begin
-                while frame_id <= end:
-                    yield self._get_frame(frame_id)
-                    frame_id += 1
+                yield from range(begin, end + 1)
         else:
             for begin, end in range_list:
                 # align begin with sampling rate
                 if begin % self._sampling_rate:
                     begin += self._sampling_rate - (begin % self._sampling_rate)
-                for frame_id in range(begin, end + 1, self._sampling_rate):
-                    yield self._get_frame(frame_id)
+                yield from range(begin, end + 1, self._sampling_rate)
+
+    def _get_changed_frame_ids(self, frame_ids: Iterator[int]) -> Iterator[int]:
+        """Yields the frames that differ from the previously yielded frame by
+        more than the sampling threshold. The frames are compared on small
+        grayscale copies decoded for this purpose, so the skipped frames are
+        never decoded at full size. A skipped frame is represented by the last
+        frame yielded before it, a frame is only yielded once the next changed
+        frame is found so that the id of the last frame it represents is
+        recorded for `_get_video_batch`."""
+        if self._diff_reader is None:
+            import decord
+
+            width, height = DIFF_FRAME_SIZE
+            self._diff_reader = decord.VideoReader(
+                self.file_url, width=width, height=height
+            )
+        reference = kept_frame_id = last_frame_id = None
+        while True:
+            batch_frame_ids = list(islice(frame_ids, DIFF_BATCH_SIZE))
+            if not batch_frame_ids:
+                break
+            frames = self._diff_reader.get_batch(batch_frame_ids).asnumpy()
+            frames = frames.mean(axis=-1, dtype=np.float32)
+            for frame_id, frame in zip(batch_frame_ids, frames):
+                if (
+                    reference is None
+                    or np.abs(frame - reference).mean() > self._sampling_rate
+                ):
+                    if kept_frame_id is not None:
+                        self._diff_last_ids[kept_frame_id] = last_frame_id
+                        yield kept_frame_id
+                    reference = frame
+                    kept_frame_id = frame_id
+                last_frame_id = frame_id
+        if kept_frame_id is not None:
+            self._diff_last_ids[kept_frame_id] = last_frame_id
+            yield kept_frame_id
+
+    def _get_range_list(self, num_frames: int) -> List[Tuple[int, int]]:
+        """Converts the predicate into ranges of frame ids to read. Conditions
+        on the seconds column are evaluated on the frame index of the video, so
+        the frames outside of the requested time span are never decoded. The
+        decoder seeks to the key frame preceding the start of every range."""
+        if not self._predicate:
+            return [(0, num_frames - 1)]
+
+        id_preds, seconds_preds = [], []
+        for pred in to_conjunction_list(self._predicate):
+            column = next(pred.find_all(TupleValueExpression)).name
+            if column == VideoColumnName.seconds.name:
+                seconds_preds.append(pred)
+            else:
+                id_preds.append(pred)
+        range_list = [(0, num_frames - 1)]
+        if id_preds:
+            range_list = extract_range_list_from_predicate(
+                conjunction_list_to_expression_tree(id_preds), 0, num_frames - 1
+            )
+        if not seconds_preds:
+            return range_list
+
+        # the seconds column holds the start time of the frames rounded to
+        # hundredths of a second
+        seconds = np.round(self._get_timestamps(list(range(num_frames)))[:, 0], 2)
+        mask = np.zeros(num_frames, dtype=bool)
+        for begin, end in range_list:
+            mask[max(begin, 0) : end + 1] = True
+        for pred in seconds_preds:
+            mask &= _evaluate_predicate(pred, seconds)
+        frame_ids = np.flatnonzero(mask)
+        if len(frame_ids) == 0:
+            return []
+        # split the selected frame ids into runs of consecutive ids
+        breaks = np.flatnonzero(np.diff(frame_ids) > 1)
+        begins = frame_ids[np.concatenate(([0], breaks + 1))]
+        ends = frame_ids[np.concatenate((breaks, [len(frame_ids) - 1]))]
+        return list(zip(begins.tolist(), ends.tolist()))
+
+    def _get_frame_shape(self) -> Tuple[int, int, int]:
+        """Shape of the decoded frames, None if it is only known by decoding a
+        frame"""
+        if self._frame_size is not None:
+            width, height = self._frame_size
+        elif self._metadata is not None:
+            width, height = self._metadata.width, self._metadata.height
+        else:
+            return None
+        # decord decodes the frames as uint8 RGB images
+        return (height, width, 3)
+
+    def _get_rows_per_batch(self, frame_id: int, frame: np.ndarray = None) -> int:
+        """Number of frames in a batch, sized from the memory of one decoded
+        frame. Matches the row based batching of `AbstractReader.read`, which
+        closes a batch once its rows reach `batch_mem_size`."""
+        row_size = get_row_size(self.__get_frame_metadata(frame_id))
+        if self._read_video:
+            if frame is not None:
+                row_size += frame.nbytes
+            else:
+                row_size += int(np.prod(self._get_frame_shape()))
+        rows_per_batch = max(1, -(-self.batch_mem_size // row_size))
+        if self.batch_size:
+            rows_per_batch = min(rows_per_batch, self.batch_size)
+        return rows_per_batch
+
+    def _get_video_batch(
+        self, frame_ids: List[int], first_frame: np.ndarray = None
+    ) -> Batch:
+        if self._read_video:
+            # one (num_frames, height, width, channels) array for the whole
+            # batch, every row of the data column is a view of it
+            if first_frame is None:
+                frames = list(self._get_frames(frame_ids))
+            else:
+                frames = [first_frame]
+                if len(frame_ids) > 1:
+                    frames.extend(self._get_frames(frame_ids[1:]))
+        else:
+            # the timestamps come from the frame index of the video, nothing
+            # is decoded
+            frames = [np.empty(0)] * len(frame_ids)
+        timestamps = self._get_timestamps(frame_ids)
+        frame_ids = np.asarray(frame_ids, dtype=np.int64)
+        columns = {
+            VideoColumnName.id.name: frame_ids,
+            ROW_NUM_COLUMN: frame_ids,
+            VideoColumnName.data.name: frames,
+            VideoColumnName.seconds.name: np.round(timestamps[:, 0], 2),
+        }
+        if self._sampling_type == DIFF:
+            # the skipped frames between a returned frame and the next one map
+            # back to the returned frame
+            columns[DIFF_LAST_ID_COLUMN] = np.asarray(
+                [self._diff_last_ids.pop(int(frame_id)) for frame_id in frame_ids],
+                dtype=np.int64,
+            )
+        return Batch(pd.DataFrame(columns))
+
+    def _get_frames(self, frame_ids: List[int]) -> np.ndarray:
+        """Decodes the frames, or looks them up in the frame cache first if
+        there is one"""
+        if self._frame_cache is None:
+            return self._decode_frames(frame_ids)
+
+        keys = [self._get_cache_key(frame_id) for frame_id in frame_ids]
+        frames = [self._frame_cache.get(key) for key in keys]
+        missing = [i for i, frame in enumerate(frames) if frame is None]
+        if not missing:
+            return np.stack(frames)
+        decoded = self._decode_frames([frame_ids[i] for i in missing])
+        for i, frame in zip(missing, decoded):
+            self._frame_cache.put(keys[i], frame)
+            frames[i] = frame
+        if len(missing) == len(frames):
+            return decoded
+        return np.stack(frames)
+
+    def _decode_frames(self, frame_ids: List[int]) -> np.ndarray:
+        """Decodes the frames at the frame size of the reader. decord fails to
+        scale some videos to some sizes, the frames are then decoded at their
+        native size and resized afterwards."""
+        import decord
+
+        if self._resize_frames:
+            return self._resize(self._get_video_reader().get_batch(frame_ids))
+        try:
+            return self._get_video_reader().get_batch(frame_ids).asnumpy()
+        except decord._ffi.base.DECORDError as error_msg:
+            if self._frame_size is None:
+                raise
+            logger.warn(
+                f"Failed to decode {self.file_url} at frame size "
+                f"{self._frame_size}, resizing native size frames instead: "
+                f"{error_msg}"
+            )
+            self._resize_frames = True
+            self._reader = decord.VideoReader(self.file_url)
+            return self._resize(self._reader.get_batch(frame_ids))
+
+    def _resize(self, frames) -> np.ndarray:
+        try_to_import_cv2()
+        import cv2
+
+        width, height = self._frame_size
+        frames = frames.asnumpy()
+        resized = np.empty((len(frames), height, width, 3), dtype=frames.dtype)
+        for i, frame in enumerate(frames):
+            cv2.resize(frame, (width, height), dst=resized[i])
+        return resized
+
+    def _get_timestamps(self, frame_ids: List[int]) -> np.ndarray:
+        if self._metadata is not None:
+            return self._metadata.timestamps[np.asarray(frame_ids, dtype=np.int64)]
+        return self._reader.get_frame_timestamp(frame_ids)
+
+    def _get_video_reader(self):
+        # with stored metadata, the file is only opened to decode frames
+        if self._reader is None:
+            self._reader = self._open_video_reader()
+        return self._reader
+
+    def _open_video_reader(self):
+        import decord
+
+        if self._frame_size is None:
+            return decord.VideoReader(self.file_url)
+        width, height = self._frame_size
+        return decord.VideoReader(self.file_url, width=width, height=height)
+
+    def _get_cache_key(self, frame_id: int) -> Tuple:
+        # the modification time and the size of the file invalidate the frames
+        # of a video that was replaced, the frames decoded at different sizes
+        # are cached separately
+        if self._video_key is None:
+            stat = os.stat(self.file_url)
+            self._video_key = (
+                os.path.realpath(self.file_url),
+                stat.st_mtime_ns,
+                stat.st_size,
+            )
+        frame_size = tuple(self._frame_size) if self._frame_size else None
+        return (self._video_key, int(frame_id), frame_size)
 
     def initialize_reader(self):
         try_to_import_decord()
@@ -103,13 +544,20 @@ class DecordReader(AbstractReader):
             assert (
                 self._sampling_type != IFRAMES
             ), "Cannot use IFRAMES with audio streams"
+            assert self._sampling_type != DIFF, "Cannot use DIFF with audio streams"
             sample_rate = 16000
             if self._sampling_type == AUDIORATE and self._sampling_rate != 1:
                 sample_rate = self._sampling_rate
+            self._audio_sample_rate = sample_rate
             try:
-                self._reader = decord.AVReader(
-                    self.file_url, mono=True, sample_rate=sample_rate
-                )
+                if self._audio_window:
+                    self._reader = decord.AudioReader(
+                        self.file_url, mono=True, sample_rate=sample_rate
+                    )
+                else:
+                    self._reader = decord.AVReader(
+                        self.file_url, mono=True, sample_rate=sample_rate
+                    )
                 self._get_frame = self.__get_audio_frame
             except decord._ffi.base.DECORDError as error_msg:
                 assert "Can't find audio stream" not in str(error_msg), error_msg
@@ -117,13 +565,13 @@ class DecordReader(AbstractReader):
             assert (
                 self._sampling_type != AUDIORATE
             ), "Cannot use AUDIORATE with video streams"
-            self._reader = decord.VideoReader(self.file_url)
+            if self._metadata is None:
+                self._reader = self._open_video_reader()
             self._get_frame = self.__get_video_frame
 
     def __get_video_frame(self, frame_id):
-        frame_video = self._reader[frame_id]
-        frame_video = frame_video.asnumpy()
-        timestamp = self._reader.get_frame_timestamp(frame_id)[0]
+        frame_video = self._get_frames([frame_id])[0]
+        timestamp = self._get_timestamps([frame_id])[0][0]
 
         return {
             VideoColumnName.id.name: frame_id,
@@ -132,6 +580,16 @@ class DecordReader(AbstractReader):
             VideoColumnName.seconds.name: round(timestamp, 2),
         }
 
+    def __get_frame_metadata(self, frame_id):
+        timestamp = self._get_timestamps([frame_id])[0][0]
+
+        return {
+            VideoColumnName.id.name: frame_id,
+            ROW_NUM_COLUMN: frame_id,
+            VideoColumnName.data.name: np.empty(0),
+            VideoColumnName.seconds.name: round(timestamp, 2),
+        }
+
     def __get_audio_frame(self, frame_id):
         frame_audio, _ = self._reader[frame_id]
         frame_audio = frame_audio.asnumpy()[0]
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from pathlib import Path
-from typing import Dict, Iterator
+from typing import Dict, Iterator, List, Tuple
 
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.configuration.constants import (
@@ -21,44 +21,58 @@ from evadb.configuration.constants import (
     DEFAULT_DOCUMENT_CHUNK_SIZE,
 )
 from evadb.readers.abstract_reader import AbstractReader
-from evadb.readers.document.registry import (
-    _lazy_import_loader,
-    _lazy_import_text_splitter,
-)
+from evadb.readers.document.registry import _lazy_import_loader
+from evadb.readers.document.text_splitter import TextSplitter
+
+
+def get_chunk_params(chunk_params: dict) -> Tuple[int, int]:
+    """Returns the (chunk_size, chunk_overlap) of the chunk parameters of a
+    query, using the defaults for the ones not specified"""
+    # https://github.com/hwchase17/langchain/blob/5b6bbf4ab2a33ed0d33ff5d3cb3979a7edc15682/langchain/text_splitter.py#L570
+    # by default we use chunk_size 4000 and overlap 200
+    chunk_params = chunk_params or {}
+    return (
+        chunk_params.get("chunk_size", DEFAULT_DOCUMENT_CHUNK_SIZE),
+        chunk_params.get("chunk_overlap", DEFAULT_DOCUMENT_CHUNK_OVERLAP),
+    )
+
+
+def load_document(file_url: str) -> List[str]:
+    """Returns the texts of the document, text files are read directly and the
+    other formats are parsed with the langchain loaders"""
+    ext = Path(file_url).suffix
+    if ext == ".txt":
+        return [Path(file_url).read_text(encoding="utf8")]
+    loader_mapping = _lazy_import_loader()
+    assert ext in loader_mapping, f"File Format {ext} not supported"
+    loader_class, loader_args = loader_mapping[ext]
+    loader = loader_class(file_url, **loader_args)
+    return [data.page_content for data in loader.load()]
+
+
+def chunk_document(
+    file_url: str, chunk_size: int, chunk_overlap: int
+) -> List[Tuple[int, str]]:
+    """Returns the (chunk_id, text) of the chunks of the document, the chunk ids
+    start from 0 for every text of the document"""
+    splitter = TextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    return [
+        (chunk_id, chunk)
+        for text in load_document(file_url)
+        for chunk_id, chunk in enumerate(splitter.split_text(text))
+    ]
 
 
 class DocumentReader(AbstractReader):
     def __init__(self, *args, chunk_params, **kwargs):
         super().__init__(*args, **kwargs)
-        self._LOADER_MAPPING = _lazy_import_loader()
-        self._splitter_class = _lazy_import_text_splitter()
-
-        # https://github.com/hwchase17/langchain/blob/5b6bbf4ab2a33ed0d33ff5d3cb3979a7edc15682/langchain/text_splitter.py#L570
-        # by default we use chunk_size 4000 and overlap 200
-        self._chunk_size = chunk_params.get("chunk_size", DEFAULT_DOCUMENT_CHUNK_SIZE)
-        self._chunk_overlap = chunk_params.get(
-            "chunk_overlap", DEFAULT_DOCUMENT_CHUNK_OVERLAP
-        )
+        self._chunk_size, self._chunk_overlap = get_chunk_params(chunk_params)
 
     def _read(self) -> Iterator[Dict]:
-        ext = Path(self.file_url).suffix
-        assert ext in self._LOADER_MAPPING, f"File Format {ext} not supported"
-        loader_class, loader_args = self._LOADER_MAPPING[ext]
-        loader = loader_class(self.file_url, **loader_args)
-
-        # todo: implement out own splitter
-        langchain_text_splitter = self._splitter_class(
-            chunk_size=self._chunk_size, chunk_overlap=self._chunk_overlap
-        )
-
-        row_num = 0
-        for data in loader.load():
-            for chunk_id, row in enumerate(
-                langchain_text_splitter.split_documents([data])
-            ):
-                yield {
-                    "chunk_id": chunk_id,
-                    "data": row.page_content,
-                    ROW_NUM_COLUMN: row_num,
-                }
-                row_num += 1
+        chunks = chunk_document(self.file_url, self._chunk_size, self._chunk_overlap)
+        for row_num, (chunk_id, chunk) in enumerate(chunks):
+            yield {
+                "chunk_id": chunk_id,
+                "data": chunk,
+                ROW_NUM_COLUMN: row_num,
+            }
@@ -62,10 +62,3 @@ def _lazy_import_loader():
         # Add more mappings for other file extensions and loaders as needed
     }
     return LOADER_MAPPING
-
-
-def _lazy_import_text_splitter():
-    try_to_import_langchain()
-    from langchain.text_splitter import RecursiveCharacterTextSplitter
-
-    return RecursiveCharacterTextSplitter
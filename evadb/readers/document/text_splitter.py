@@ -0,0 +1,121 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import re
+from typing import List
+
+from evadb.utils.logging_manager import logger
+
+DEFAULT_SEPARATORS = ["\n\n", "\n", " ", ""]
+
+
+class TextSplitter:
+    """Splits text into chunks of at most `chunk_size` characters, consecutive
+    chunks sharing up to `chunk_overlap` characters. The text is split on the
+    first separator it contains, and the pieces still longer than a chunk are
+    split again on the next separators. The chunks are the same as the ones of
+    langchain's RecursiveCharacterTextSplitter, which the document tables used
+    before.
+
+    Args:
+        chunk_size (int): maximum number of characters of a chunk
+        chunk_overlap (int): maximum number of characters shared by
+            consecutive chunks
+        separators (List[str], optional): separators to split on, from the
+            coarsest to the finest
+    """
+
+    def __init__(
+        self, chunk_size: int, chunk_overlap: int, separators: List[str] = None
+    ):
+        assert (
+            chunk_overlap <= chunk_size
+        ), f"Chunk overlap {chunk_overlap} is larger than chunk size {chunk_size}"
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._separators = separators or DEFAULT_SEPARATORS
+
+    def split_text(self, text: str) -> List[str]:
+        return self._split_text(text, self._separators)
+
+    def _split_text(self, text: str, separators: List[str]) -> List[str]:
+        # split on the first separator found in the text
+        separator = separators[-1]
+        next_separators = []
+        for i, candidate in enumerate(separators):
+            if candidate == "":
+                separator = candidate
+                break
+            if candidate in text:
+                separator = candidate
+                next_separators = separators[i + 1 :]
+                break
+
+        chunks = []
+        short_splits = []
+        for split in _split_keeping_separator(text, separator):
+            if len(split) < self._chunk_size:
+                short_splits.append(split)
+                continue
+            if short_splits:
+                chunks.extend(self._merge_splits(short_splits))
+                short_splits = []
+            if next_separators:
+                chunks.extend(self._split_text(split, next_separators))
+            else:
+                chunks.append(split)
+        if short_splits:
+            chunks.extend(self._merge_splits(short_splits))
+        return chunks
+
+    def _merge_splits(self, splits: List[str]) -> List[str]:
+        """Merges consecutive splits into chunks of at most chunk_size
+        characters, starting every chunk with the last chunk_overlap
+        characters of the previous one"""
+        chunks = []
+        current = []
+        total = 0
+        for split in splits:
+            if current and total + len(split) > self._chunk_size:
+                if total > self._chunk_size:
+                    logger.warning(
+                        f"Created a chunk of size {total}, "
+                        f"which is longer than the specified {self._chunk_size}"
+                    )
+                _append_chunk(chunks, current)
+                # keep the tail of the chunk as the overlap of the next one
+                while total > self._chunk_overlap or (
+                    total > 0 and total + len(split) > self._chunk_size
+                ):
+                    total -= len(current.pop(0))
+            current.append(split)
+            total += len(split)
+        _append_chunk(chunks, current)
+        return chunks
+
+
+def _split_keeping_separator(text: str, separator: str) -> List[str]:
+    """Splits the text before every occurrence of the separator, each split
+    but the first one starts with the separator"""
+    if not separator:
+        return list(text)
+    parts = re.split(f"({re.escape(separator)})", text)
+    splits = [parts[0]] + [parts[i] + parts[i + 1] for i in range(1, len(parts) - 1, 2)]
+    return [split for split in splits if split]
+
+
+def _append_chunk(chunks: List[str], splits: List[str]):
+    chunk = "".join(splits).strip()
+    if chunk:
+        chunks.append(chunk)
@@ -12,21 +12,32 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from pathlib import Path
 from typing import Dict, Iterator
 
+import numpy as np
+
 from evadb.readers.abstract_reader import AbstractReader
+from evadb.utils.errors import DatasetFileNotFoundError
 from evadb.utils.generic_utils import try_to_import_cv2
 
 
+def read_image(file_url: str) -> np.ndarray:
+    """Decodes an image file into an RGB array. OpenCV releases the GIL while
+    decoding, so images can be decoded by a pool of threads."""
+    try_to_import_cv2()
+    import cv2
+
+    if not Path(file_url).exists():
+        raise DatasetFileNotFoundError()
+    im_bgr = cv2.imread(str(file_url))
+    assert im_bgr is not None, f"Failed to read image file {file_url}"
+    return cv2.cvtColor(im_bgr, cv2.COLOR_BGR2RGB)
+
+
 class CVImageReader(AbstractReader):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
     def _read(self) -> Iterator[Dict]:
-        try_to_import_cv2()
-        import cv2
-
-        im_bgr = cv2.imread(str(self.file_url))
-        im_rgb = cv2.cvtColor(im_bgr, cv2.COLOR_BGR2RGB)
-        assert im_rgb is not None, f"Failed to read image file {self.file_url}"
-        yield {"data": im_rgb}
+        yield {"data": read_image(self.file_url)}
@@ -12,13 +12,61 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+from typing import Dict, Iterator, List, Tuple
 
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.readers.abstract_reader import AbstractReader
 from evadb.utils.generic_utils import try_to_import_fitz
 
 
+def get_num_pages(file_url: str) -> int:
+    try_to_import_fitz()
+    import fitz
+
+    with fitz.open(file_url) as doc:
+        return doc.page_count
+
+
+def extract_pages(
+    file_url: str, start_page: int, end_page: int
+) -> List[List[Tuple[int, str]]]:
+    """Extracts the text paragraphs of the pages [start_page, end_page) of the
+    PDF, numbered from 0.
+
+    Returns:
+        List[List[Tuple[int, str]]]: the (paragraph_no, text) of the text
+            blocks of every page, numbered from 0 among all the blocks of the
+            page
+    """
+    try_to_import_fitz()
+    import fitz
+
+    pages = []
+    with fitz.open(file_url) as doc:
+        for page_no in range(start_page, min(end_page, doc.page_count)):
+            blocks = doc[page_no].get_text("dict")["blocks"]
+            pages.append(
+                [
+                    (paragraph_no, _get_block_text(block))
+                    for paragraph_no, block in enumerate(blocks)
+                    # this block contains text
+                    if block["type"] == 0
+                ]
+            )
+    return pages
+
+
+def _get_block_text(block: Dict) -> str:
+    # concatenate the spans of the lines of the block, removing the whitespace
+    # only spans
+    return "".join(
+        span["text"]
+        for line in block["lines"]
+        for span in line["spans"]
+        if span["text"].strip()
+    )
+
+
 class PDFReader(AbstractReader):
     def __init__(self, *args, **kwargs):
         """
@@ -31,31 +79,17 @@ class PDFReader(AbstractReader):
         try_to_import_fitz()
 
     def _read(self) -> Iterator[Dict]:
-        import fitz
-
-        doc = fitz.open(self.file_url)
-
         # PAGE ID, PARAGRAPH ID, STRING
         row_num = 0
-        for page_no, page in enumerate(doc):
-            blocks = page.get_text("dict")["blocks"]
-            # iterate through the text blocks
-            for paragraph_no, b in enumerate(blocks):
-                # this block contains text
-                if b["type"] == 0:
-                    # text found in block
-                    block_string = ""
-                    # iterate through the text lines
-                    for lines in b["lines"]:
-                        # iterate through the text spans
-                        for span in lines["spans"]:
-                            # removing whitespaces:
-                            if span["text"].strip():
-                                block_string += span["text"]
-                    yield {
-                        ROW_NUM_COLUMN: row_num,
-                        "page": page_no + 1,
-                        "paragraph": paragraph_no + 1,
-                        "data": block_string,
-                    }
-                    row_num += 1
+        num_pages = get_num_pages(self.file_url)
+        for page_no, paragraphs in enumerate(
+            extract_pages(self.file_url, 0, num_pages)
+        ):
+            for paragraph_no, text in paragraphs:
+                yield {
+                    ROW_NUM_COLUMN: row_num,
+                    "page": page_no + 1,
+                    "paragraph": paragraph_no + 1,
+                    "data": text,
+                }
+                row_num += 1
@@ -16,6 +16,7 @@ import os
 import re
 import shutil
 from pathlib import Path
+from typing import Dict, List, NamedTuple
 
 import pandas as pd
 
@@ -25,9 +26,35 @@ from evadb.models.storage.batch import Batch
 from evadb.parser.table_ref import TableInfo
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
 from evadb.storage.sqlite_storage_engine import SQLStorageEngine
+from evadb.utils.generic_utils import get_file_checksum
 from evadb.utils.logging_manager import logger
 
 
+class FileManifestEntry(NamedTuple):
+    """Size, modification time and content hash of a file of a media table,
+    as recorded when it was loaded. The fields are None for the files loaded
+    before the tables kept a manifest."""
+
+    file_size: int
+    file_mtime: int
+    content_hash: str
+
+    def same_stat(self, other: "FileManifestEntry") -> bool:
+        """Whether the file looks unchanged without hashing its content"""
+        return (self.file_size, self.file_mtime) == (other.file_size, other.file_mtime)
+
+    def to_row(self) -> Dict:
+        return self._asdict()
+
+
+def get_file_manifest_entry(
+    file_path: str, with_content_hash: bool = True
+) -> FileManifestEntry:
+    stat = os.stat(file_path)
+    content_hash = get_file_checksum(file_path) if with_content_hash else None
+    return FileManifestEntry(stat.st_size, stat.st_mtime_ns, content_hash)
+
+
 class AbstractMediaStorageEngine(AbstractStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
@@ -43,6 +70,25 @@ class AbstractMediaStorageEngine(AbstractStorageEngine):
             )
         )
 
+    def read_manifest(self, table: TableCatalogEntry) -> Dict[str, FileManifestEntry]:
+        """Returns the manifest entry of every file of the table, by the path
+        the file was loaded from"""
+        manifest = {}
+        for media_files in self._rdb_handler.read(self._get_metadata_table(table)):
+            for _, row in media_files.iterrows():
+                values = [row.get(name) for name in FileManifestEntry._fields]
+                manifest[row["file_url"]] = FileManifestEntry(
+                    *(None if pd.isna(value) else value for value in values)
+                )
+        return manifest
+
+    def _get_content_hashes(self, rows: Batch) -> List[str]:
+        """Returns the content hashes of the files of the rows, computed by
+        LOAD along with the manifest, or from the files otherwise"""
+        if "content_hash" in rows.frames:
+            return list(rows.frames["content_hash"])
+        return [get_file_checksum(file_path) for file_path in rows.file_paths()]
+
     def _xform_file_url_to_file_name(self, file_url: Path) -> str:
         # Convert media_path to file name. This is done to support duplicate media_names with
         # different complete paths. Without conversion, we cannot copy files with same name but
@@ -126,11 +172,12 @@ class AbstractMediaStorageEngine(AbstractStorageEngine):
                 src_path = Path.cwd() / media_file
                 os.symlink(src_path, dst_path)
                 copied_files.append(dst_path)
+            # the other columns of the rows are metadata of the files computed
+            # while loading them
+            metadata = rows.frames.drop(columns=["file_path"])
+            metadata.insert(0, "file_url", list(rows.file_paths()))
             # assuming sql write is an atomic operation
-            self._rdb_handler.write(
-                self._get_metadata_table(table),
-                Batch(pd.DataFrame({"file_url": list(rows.file_paths())})),
-            )
+            self._rdb_handler.write(self._get_metadata_table(table), Batch(metadata))
 
         except Exception as e:
             # delete the copied_files
@@ -52,6 +52,23 @@ class AbstractStorageEngine(metaclass=ABCMeta):
             rows : rows data to be written
         """
 
+    def bulk_write(self, table: TableCatalogEntry, batches: Iterator[Batch]) -> int:
+        """Inserts a stream of batches into the table. Engines that can amortize
+        the cost of a write across batches override this method.
+
+        Attributes:
+            table: storage unit to be written
+            batches: iterator of the batches to be written
+
+        Returns:
+            int: number of rows written
+        """
+        num_rows = 0
+        for batch in batches:
+            self.write(table, batch)
+            num_rows += len(batch)
+        return num_rows
+
     @abstractmethod
     def read(
         self,
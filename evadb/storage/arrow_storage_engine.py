@@ -0,0 +1,423 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.database import EvaDBDatabase
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.parser.table_ref import TableInfo
+from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.storage.zone_map import ColumnZoneMap, predicate_may_match
+from evadb.utils.generic_utils import NdArraySerializer, try_to_import_pyarrow
+from evadb.utils.logging_manager import logger
+
+# Number of rows in a parquet row group. Row groups are the unit of IO and of
+# the min/max statistics kept by parquet.
+ROW_GROUP_SIZE = 64 * 1024
+DATA_FILE_SUFFIX = ".parquet"
+
+
+def _column_type_to_arrow_type(column: ColumnCatalogEntry):
+    import pyarrow as pa
+
+    if column.type == ColumnType.INTEGER:
+        return pa.int64()
+    elif column.type == ColumnType.FLOAT:
+        return pa.float64()
+    elif column.type == ColumnType.TEXT:
+        return pa.string()
+    elif column.type == ColumnType.BOOLEAN:
+        return pa.bool_()
+    elif column.type == ColumnType.NDARRAY:
+        return pa.binary()
+    else:
+        msg = "Invalid column type: " + str(column.type)
+        logger.error(msg)
+        raise NotImplementedError(msg)
+
+
+def predicate_to_arrow_expression(predicate: AbstractExpression):
+    """Converts a predicate on table columns into a `pyarrow.compute.Expression`.
+
+    Only comparisons between columns and constants combined with AND/OR are
+    supported. LIKE is translated into a regular expression search.
+
+    Arguments:
+        predicate (AbstractExpression): predicate to convert
+
+    Returns:
+        pyarrow.compute.Expression: the equivalent arrow expression
+    """
+    import pyarrow.compute as pc
+
+    if isinstance(predicate, TupleValueExpression):
+        return pc.field(predicate.name)
+    if isinstance(predicate, ConstantValueExpression):
+        return pc.scalar(predicate.value)
+
+    if predicate.etype == ExpressionType.COMPARE_LIKE:
+        return pc.match_substring_regex(
+            predicate_to_arrow_expression(predicate.get_child(0)),
+            predicate.get_child(1).value,
+        )
+
+    left = predicate_to_arrow_expression(predicate.get_child(0))
+    right = predicate_to_arrow_expression(predicate.get_child(1))
+    if predicate.etype == ExpressionType.LOGICAL_AND:
+        return left & right
+    elif predicate.etype == ExpressionType.LOGICAL_OR:
+        return left | right
+    elif predicate.etype == ExpressionType.COMPARE_EQUAL:
+        return left == right
+    elif predicate.etype == ExpressionType.COMPARE_GREATER:
+        return left > right
+    elif predicate.etype == ExpressionType.COMPARE_LESSER:
+        return left < right
+    elif predicate.etype == ExpressionType.COMPARE_GEQ:
+        return left >= right
+    elif predicate.etype == ExpressionType.COMPARE_LEQ:
+        return left <= right
+    elif predicate.etype == ExpressionType.COMPARE_NEQ:
+        return left != right
+
+    raise NotImplementedError(f"Predicate type {predicate.etype} not supported")
+
+
+class ArrowStorageEngine(AbstractStorageEngine):
+    """Columnar storage engine for structured tables.
+
+    A table is a directory (`table.file_url`) of parquet files. Every call to
+    `write` appends a new file that is split into row groups of
+    `ROW_GROUP_SIZE` rows. Files are named after the first `_row_id` they hold,
+    so listing the directory returns them in insertion order. NDARRAY cells
+    are stored as binary values.
+    """
+
+    def __init__(self, db: EvaDBDatabase):
+        super().__init__(db)
+        try_to_import_pyarrow()
+        self._serializer = NdArraySerializer
+
+    @staticmethod
+    def exists(table: TableCatalogEntry) -> bool:
+        """Checks whether the table has been created by this storage engine"""
+        return table.file_url is not None and Path(table.file_url).is_dir()
+
+    def _get_table_dir(self, table: TableCatalogEntry) -> Path:
+        if not self.exists(table):
+            err_msg = f"No table found with name {table.name}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+        return Path(table.file_url)
+
+    def _list_data_files(self, table_dir: Path) -> List[Path]:
+        return sorted(table_dir.glob(f"*{DATA_FILE_SUFFIX}"))
+
+    def _next_row_id(self, table_dir: Path) -> int:
+        import pyarrow.parquet as pq
+
+        data_files = self._list_data_files(table_dir)
+        if not data_files:
+            return 1
+        row_ids = pq.read_table(data_files[-1], columns=[IDENTIFIER_COLUMN])
+        return int(row_ids.column(IDENTIFIER_COLUMN).to_numpy().max()) + 1
+
+    def _write_data_file(self, arrow_table, file_path: Path):
+        import pyarrow.parquet as pq
+
+        # write to a temporary file first so that readers never observe a
+        # partially written parquet file
+        tmp_path = file_path.with_suffix(".tmp")
+        pq.write_table(arrow_table, tmp_path, row_group_size=ROW_GROUP_SIZE)
+        os.replace(tmp_path, file_path)
+
+    def _batch_to_arrow(
+        self, rows: Batch, columns: List[ColumnCatalogEntry], start_row_id: int
+    ):
+        import pyarrow as pa
+
+        num_rows = len(rows)
+        arrays = [pa.array(range(start_row_id, start_row_id + num_rows), pa.int64())]
+        fields = [pa.field(IDENTIFIER_COLUMN, pa.int64(), nullable=False)]
+        for column in columns:
+            arrow_type = _column_type_to_arrow_type(column)
+            if column.name not in rows.frames:
+                values = pa.nulls(num_rows, arrow_type)
+            elif column.type == ColumnType.NDARRAY:
+                values = pa.array(
+                    [
+                        self._serializer.serialize(value) if value is not None else None
+                        for value in rows.frames[column.name]
+                    ],
+                    arrow_type,
+                )
+            else:
+                values = pa.array(
+                    rows.frames[column.name], arrow_type, from_pandas=True
+                )
+            arrays.append(values)
+            fields.append(pa.field(column.name, arrow_type))
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+    def _arrow_to_batch(self, record_batch, columns: List[ColumnCatalogEntry]):
+        df = record_batch.to_pandas()
+        for column in columns:
+            if column.type == ColumnType.NDARRAY:
+                df[column.name] = [
+                    self._serializer.deserialize(value) if value is not None else None
+                    for value in df[column.name]
+                ]
+        df[ROW_NUM_COLUMN] = df[IDENTIFIER_COLUMN]
+        return Batch(df)
+
+    def _get_row_group_zone_maps(self, row_group) -> Dict[str, ColumnZoneMap]:
+        """Builds the zone maps of a row group from the min/max statistics kept
+        by parquet"""
+        zone_maps = {}
+        for idx in range(row_group.num_columns):
+            column = row_group.column(idx)
+            statistics = column.statistics
+            if statistics is None or not statistics.has_null_count:
+                continue
+            if statistics.has_min_max:
+                zone_maps[column.path_in_schema] = ColumnZoneMap(
+                    statistics.min, statistics.max, statistics.null_count
+                )
+            elif statistics.null_count == row_group.num_rows:
+                zone_maps[column.path_in_schema] = ColumnZoneMap(
+                    null_count=statistics.null_count
+                )
+        return zone_maps
+
+    def _get_matching_row_groups(
+        self, metadata, predicate: AbstractExpression
+    ) -> List[int]:
+        """Returns the row groups that may hold rows satisfying the predicate"""
+        row_groups = list(range(metadata.num_row_groups))
+        if predicate is None:
+            return row_groups
+        return [
+            idx
+            for idx in row_groups
+            if predicate_may_match(
+                predicate,
+                self._get_row_group_zone_maps(metadata.row_group(idx)),
+                metadata.row_group(idx).num_rows,
+            )
+        ]
+
+    def zone_map_pruning(
+        self, table: TableCatalogEntry, predicate: AbstractExpression
+    ) -> Tuple[int, int]:
+        """Returns the number of row groups of the table skipped by a scan with
+        the predicate, and the total number of row groups"""
+        import pyarrow.parquet as pq
+
+        num_pruned = 0
+        num_row_groups = 0
+        for data_file in self._list_data_files(self._get_table_dir(table)):
+            metadata = pq.ParquetFile(data_file).metadata
+            row_groups = self._get_matching_row_groups(metadata, predicate)
+            num_pruned += metadata.num_row_groups - len(row_groups)
+            num_row_groups += metadata.num_row_groups
+        return num_pruned, num_row_groups
+
+    def create(self, table: TableCatalogEntry, **kwargs):
+        """
+        Create the directory holding the parquet files of the table.
+        """
+        table_dir = Path(table.file_url)
+        if table_dir.exists():
+            logger.warning(f"Table {table.name} already exists")
+            return
+        table_dir.mkdir(parents=True)
+
+    def drop(self, table: TableCatalogEntry):
+        try:
+            shutil.rmtree(self._get_table_dir(table))
+        except Exception as e:
+            err_msg = f"Failed to drop the table {table.name} with Exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def write(self, table: TableCatalogEntry, rows: Batch):
+        """
+        Append rows to the table as a new parquet file.
+
+        Arguments:
+            table: table metadata object to write into
+            rows : batch to be persisted in the storage.
+        """
+        try:
+            table_dir = self._get_table_dir(table)
+            if rows.empty():
+                return
+
+            # _row_id is assigned by the storage engine
+            table_columns = [
+                col
+                for col in table.columns
+                if (col.name != IDENTIFIER_COLUMN and col.name != ROW_NUM_COLUMN)
+            ]
+            start_row_id = self._next_row_id(table_dir)
+            arrow_table = self._batch_to_arrow(rows, table_columns, start_row_id)
+            self._write_data_file(
+                arrow_table, table_dir / f"{start_row_id:020d}{DATA_FILE_SUFFIX}"
+            )
+        except Exception as e:
+            err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def read(
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        columns: List[str] = None,
+        predicate: AbstractExpression = None,
+        batch_size: int = None,
+    ) -> Iterator[Batch]:
+        """
+        Reads the table one row group at a time and returns a batch iterator.
+
+        Argument:
+            table: table metadata object of the table to read
+            batch_mem_size (int): memory size of the batch read from storage
+            columns (List[str]): names of the columns to read. All the columns
+                are read if not specified.
+            predicate (AbstractExpression): predicate on the table columns.
+                Only the rows satisfying it are returned, and NDARRAY cells of
+                the other rows are never deserialized. Row groups whose
+                statistics prove it false are not read.
+            batch_size (int): maximum number of rows in a batch
+        Return:
+            Iterator of Batch read.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        try:
+            table_dir = self._get_table_dir(table)
+            filter_expr = None
+            if predicate is not None:
+                filter_expr = predicate_to_arrow_expression(predicate)
+                # the columns referenced by the predicate are needed to
+                # evaluate it
+                columns = columns and list(columns) + [
+                    tve.name for tve in predicate.find_all(TupleValueExpression)
+                ]
+            read_columns = [
+                col
+                for col in table.columns
+                if col.name != ROW_NUM_COLUMN
+                and (
+                    columns is None
+                    or col.name in columns
+                    or col.name == IDENTIFIER_COLUMN
+                )
+            ]
+            column_names = [col.name for col in read_columns]
+            for data_file in self._list_data_files(table_dir):
+                parquet_file = pq.ParquetFile(data_file)
+                metadata = parquet_file.metadata
+                if metadata.num_rows == 0:
+                    continue
+                # skip the row groups whose statistics prove the predicate false
+                row_groups = self._get_matching_row_groups(metadata, predicate)
+                if not row_groups:
+                    continue
+                # estimate the in-memory row size using the uncompressed size of
+                # the columns being read
+                total_bytes = sum(
+                    row_group.column(idx).total_uncompressed_size
+                    for row_group in (
+                        metadata.row_group(rg_idx)
+                        for rg_idx in range(metadata.num_row_groups)
+                    )
+                    for idx in range(row_group.num_columns)
+                    if row_group.column(idx).path_in_schema in column_names
+                )
+                row_size = max(1, total_bytes // metadata.num_rows)
+                rows_per_batch = max(1, batch_mem_size // row_size)
+                if batch_size:
+                    rows_per_batch = min(rows_per_batch, batch_size)
+                for record_batch in parquet_file.iter_batches(
+                    batch_size=rows_per_batch,
+                    row_groups=row_groups,
+                    columns=column_names,
+                ):
+                    if filter_expr is not None:
+                        record_batch = pa.Table.from_batches([record_batch]).filter(
+                            filter_expr
+                        )
+                        if record_batch.num_rows == 0:
+                            continue
+                    yield self._arrow_to_batch(record_batch, read_columns)
+        except Exception as e:
+            err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def delete(self, table: TableCatalogEntry, predicate: AbstractExpression):
+        """Delete tuples from the table where rows satisfy the predicate.
+        Data files containing matching rows are rewritten.
+
+        Argument:
+            table: table metadata object of the table
+            predicate: predicate used to find the tuples to remove.
+        """
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        try:
+            table_dir = self._get_table_dir(table)
+            filter_expr = predicate_to_arrow_expression(predicate)
+            for data_file in self._list_data_files(table_dir):
+                arrow_table = pq.read_table(data_file)
+                deleted_row_ids = arrow_table.filter(filter_expr).column(
+                    IDENTIFIER_COLUMN
+                )
+                if len(deleted_row_ids) == 0:
+                    continue
+                remaining_rows = arrow_table.filter(
+                    pc.invert(
+                        pc.is_in(
+                            arrow_table.column(IDENTIFIER_COLUMN),
+                            value_set=deleted_row_ids.combine_chunks(),
+                        )
+                    )
+                )
+                if remaining_rows.num_rows == 0:
+                    data_file.unlink()
+                else:
+                    self._write_data_file(remaining_rows, data_file)
+        except Exception as e:
+            err_msg = (
+                f"Failed to delete from the table {table.name} with exception {str(e)}"
+            )
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def rename(self, old_table: TableCatalogEntry, new_name: TableInfo):
+        raise Exception("Rename not supported for structured data table")
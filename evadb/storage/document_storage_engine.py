@@ -12,34 +12,178 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
+import multiprocessing as mp
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, List, NamedTuple
+
+import pandas as pd
 
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import ROW_NUM_COLUMN, ROW_NUM_MAGIC
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN, ROW_NUM_MAGIC
 from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
-from evadb.readers.document.document_reader import DocumentReader
+from evadb.readers.document.document_reader import chunk_document, get_chunk_params
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
+from evadb.utils.generic_utils import BatchSizer, get_file_checksum
+from evadb.utils.kv_cache import DiskKVCache
+from evadb.utils.logging_manager import logger
+
+# directory of the chunk store in the directory of the table
+CHUNK_STORE_DIR = ".chunks"
+
+# bytes of chunks kept per table, the least recently stored ones are chunked
+# again from the files if the store grows beyond it
+CHUNK_STORE_SIZE = 2**34
+
+
+class DocumentFile(NamedTuple):
+    """A document of a document table, as stored in its metadata table"""
+
+    row_id: int
+    name: str
+    path: str
+    content_hash: str
 
 
 class DocumentStorageEngine(AbstractMediaStorageEngine):
+    """Stores the documents as links to the loaded files, along with their
+    chunks. The chunks are computed when the documents are loaded with the
+    default chunk parameters, and the first time a query uses other chunk
+    parameters. They are stored by content hash and chunk parameters, so that
+    scans do not parse and split the files again."""
+
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
 
-    def read(self, table: TableCatalogEntry, chunk_params: dict) -> Iterator[Batch]:
+    def write(self, table: TableCatalogEntry, rows: Batch):
+        file_paths = list(rows.file_paths())
+        content_hashes = self._get_content_hashes(rows)
+        chunk_size, chunk_overlap = get_chunk_params({})
+        documents = [
+            DocumentFile(None, file_path, file_path, content_hash)
+            for file_path, content_hash in zip(file_paths, content_hashes)
+        ]
+        self._chunk_documents(table, documents, chunk_size, chunk_overlap)
+
+        metadata = rows.frames.copy()
+        metadata["content_hash"] = content_hashes
+        return super().write(table, Batch(metadata))
+
+    def read(
+        self,
+        table: TableCatalogEntry,
+        chunk_params: dict = None,
+        batch_mem_size: int = 30000000,
+        batch_size: int = None,
+        num_workers: int = None,
+    ) -> Iterator[Batch]:
+        """
+        Reads the chunks of the documents of the table in load order, the
+        chunks of several documents per batch.
+
+        Arguments:
+            chunk_params (dict): chunk_size and chunk_overlap of the chunks,
+                the defaults are used for the ones not specified
+            batch_mem_size (int): maximum memory size of a batch
+            batch_size (int): maximum number of chunks in a batch
+            num_workers (int): number of processes chunking the documents
+                missing from the chunk store, read from the
+                document_chunk_workers configuration if not specified
+        """
+        chunk_size, chunk_overlap = get_chunk_params(chunk_params)
+        documents = self._get_documents(table)
+        chunk_store = self._chunk_documents(
+            table, documents, chunk_size, chunk_overlap, num_workers
+        )
+
+        batch_sizer = BatchSizer(batch_mem_size, batch_size)
+        rows = []
+        for document in documents:
+            chunks = chunk_store.get(
+                _get_chunk_key(document.content_hash, chunk_size, chunk_overlap)
+            )
+            if chunks is None:
+                # evicted from the store since it was chunked
+                chunks = chunk_document(document.path, chunk_size, chunk_overlap)
+            for row_num, (chunk_id, chunk) in enumerate(chunks):
+                row = {
+                    table.columns[0].name: document.row_id,
+                    table.columns[1].name: str(document.name),
+                    "chunk_id": chunk_id,
+                    "data": chunk,
+                    ROW_NUM_COLUMN: document.row_id * ROW_NUM_MAGIC + row_num,
+                }
+                rows.append(row)
+                if batch_sizer.add(row):
+                    yield Batch(pd.DataFrame(rows))
+                    rows = []
+        if rows:
+            yield Batch(pd.DataFrame(rows))
+
+    def _get_documents(self, table: TableCatalogEntry) -> List[DocumentFile]:
+        """Returns the documents of the table along with their content hash,
+        which is computed from the file for the documents loaded without it"""
+        documents = []
         for doc_files in self._rdb_handler.read(self._get_metadata_table(table), 12):
-            for _, (row_id, file_name, _) in doc_files.iterrows():
+            for _, row in doc_files.iterrows():
+                file_name = row["file_url"]
                 system_file_name = self._xform_file_url_to_file_name(file_name)
-                doc_file = Path(table.file_url) / system_file_name
-                # setting batch_mem_size = 1, we need fix it
-                reader = DocumentReader(
-                    str(doc_file), batch_mem_size=1, chunk_params=chunk_params
-                )
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(file_name)
-                    batch.frames[ROW_NUM_COLUMN] = (
-                        row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
+                doc_file = str(Path(table.file_url) / system_file_name)
+                content_hash = row.get("content_hash")
+                if pd.isna(content_hash):
+                    content_hash = get_file_checksum(doc_file)
+                documents.append(
+                    DocumentFile(
+                        row[IDENTIFIER_COLUMN], file_name, doc_file, content_hash
                     )
-                    yield batch
+                )
+        return documents
+
+    def _chunk_documents(
+        self,
+        table: TableCatalogEntry,
+        documents: List[DocumentFile],
+        chunk_size: int,
+        chunk_overlap: int,
+        num_workers: int = None,
+    ) -> DiskKVCache:
+        """Chunks the documents missing from the chunk store of the table, in
+        a process pool if there are several of them, and returns the store"""
+        chunk_store = DiskKVCache(
+            str(Path(table.file_url) / CHUNK_STORE_DIR),
+            max_cache_size=CHUNK_STORE_SIZE,
+        )
+        missing = {}
+        for document in documents:
+            key = _get_chunk_key(document.content_hash, chunk_size, chunk_overlap)
+            if key not in chunk_store and key not in missing:
+                missing[key] = document.path
+        if not missing:
+            return chunk_store
+
+        if num_workers is None:
+            num_workers = self.db.catalog().get_configuration_catalog_value(
+                "document_chunk_workers", 1
+            )
+        num_workers = min(num_workers, len(missing))
+        logger.info(
+            f"Chunking {len(missing)} documents of {table.name} with chunk_size "
+            f"{chunk_size} and chunk_overlap {chunk_overlap}"
+        )
+        chunk = functools.partial(
+            chunk_document, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        )
+        if num_workers <= 1:
+            for key, doc_file in missing.items():
+                chunk_store.set(key, chunk(doc_file))
+        else:
+            with mp.Pool(num_workers) as pool:
+                chunks = pool.imap(chunk, missing.values())
+                for key, document_chunks in zip(missing.keys(), chunks):
+                    chunk_store.set(key, document_chunks)
+        return chunk_store
+
+
+def _get_chunk_key(content_hash: str, chunk_size: int, chunk_overlap: int) -> tuple:
+    return (content_hash, chunk_size, chunk_overlap)
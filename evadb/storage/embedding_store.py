@@ -0,0 +1,155 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+
+# element types of the NDARRAY columns that can be stored in a matrix
+EMBEDDING_ARRAY_TYPES = [
+    NdArrayType.INT8,
+    NdArrayType.UINT8,
+    NdArrayType.INT16,
+    NdArrayType.INT32,
+    NdArrayType.INT64,
+    NdArrayType.BOOL,
+    NdArrayType.FLOAT32,
+    NdArrayType.FLOAT64,
+]
+EMBEDDING_FILE_SUFFIX = ".npy"
+# number of rows the matrix file is created with, it then doubles when full
+MIN_CAPACITY = 1024
+
+
+def supports_embedding_layout(column: ColumnCatalogEntry) -> bool:
+    """Checks whether the column holds arrays of a fixed numeric type"""
+    return (
+        column.type == ColumnType.NDARRAY and column.array_type in EMBEDDING_ARRAY_TYPES
+    )
+
+
+class EmbeddingColumnStore:
+    """Stores the values of a fixed-shape NDARRAY column as the rows of a
+    single matrix in a `.npy` file, which is memory-mapped when read.
+
+    The value of the row with `_row_id` i is stored in row i - 1 of the matrix,
+    so rows are addressed without any lookup. The slots of deleted rows are left
+    in place and reused if the `_row_id` is handed out again. The file is
+    created with some spare capacity and grows by doubling, so appending a
+    batch only rewrites the file when it is full.
+
+    Arguments:
+        path (Path): path of the `.npy` file
+        dtype: numpy type of the array elements
+    """
+
+    def __init__(self, path: Path, dtype):
+        self._path = Path(path)
+        self._dtype = np.dtype(dtype)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def exists(self) -> bool:
+        return self._path.exists()
+
+    def _open(self, mode: str) -> np.memmap:
+        return np.load(self._path, mmap_mode=mode)
+
+    def row_shape(self):
+        """Shape of the stored arrays, None if nothing has been stored yet"""
+        if not self.exists():
+            return None
+        return self._open("r").shape[1:]
+
+    def can_store(self, values: List) -> bool:
+        """Checks whether all the values are arrays of the stored shape, or of
+        a single shape if the store is empty, whose elements can be cast to the
+        stored type without changing their value"""
+        row_shape = self.row_shape()
+        for value in values:
+            if not isinstance(value, np.ndarray) or value.dtype.hasobject:
+                return False
+            if not self._can_cast(value):
+                return False
+            if row_shape is None:
+                row_shape = value.shape
+            if value.shape != row_shape:
+                return False
+        return True
+
+    def _can_cast(self, value: np.ndarray) -> bool:
+        if np.can_cast(value.dtype, self._dtype, casting="safe"):
+            return True
+        # floats are rounded to the precision of the declared float type
+        if value.dtype.kind == "f" and self._dtype.kind == "f":
+            return True
+        # e.g. floats holding whole numbers in an integer column, anything
+        # else would be truncated or overflow
+        with np.errstate(invalid="ignore", over="ignore"):
+            return np.array_equal(value.astype(self._dtype), value)
+
+    def write(self, row_ids: np.ndarray, values: List[np.ndarray]):
+        """Writes the values into the slots of their `_row_id`"""
+        if len(row_ids) == 0:
+            return
+        offsets = np.asarray(row_ids, dtype=np.int64) - 1
+        rows = np.stack(values).astype(self._dtype, copy=False)
+        required_capacity = int(offsets.max()) + 1
+
+        if not self.exists():
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            matrix = self._create(max(required_capacity, MIN_CAPACITY), rows.shape[1:])
+        else:
+            matrix = self._open("r+")
+            if matrix.shape[0] < required_capacity:
+                matrix = self._grow(matrix, required_capacity)
+
+        matrix[offsets] = rows
+        matrix.flush()
+        del matrix
+
+    def _create(self, capacity: int, row_shape, path: Path = None) -> np.memmap:
+        return np.lib.format.open_memmap(
+            path or self._path,
+            mode="w+",
+            dtype=self._dtype,
+            shape=(capacity,) + tuple(row_shape),
+        )
+
+    def _grow(self, matrix: np.memmap, required_capacity: int) -> np.memmap:
+        capacity = max(required_capacity, 2 * matrix.shape[0])
+        tmp_path = self._path.with_suffix(".tmp")
+        new_matrix = self._create(capacity, matrix.shape[1:], tmp_path)
+        new_matrix[: matrix.shape[0]] = matrix
+        new_matrix.flush()
+        del matrix
+        # readers holding the old mapping keep seeing the old file
+        os.replace(tmp_path, self._path)
+        return new_matrix
+
+    def matrix(self) -> np.ndarray:
+        """Returns a read-only memory-mapped view of the stored matrix. Indexing
+        it with `_row_id - 1` returns the value of a row without copying it."""
+        return np.asarray(self._open("r"))
+
+    def drop(self):
+        if self.exists():
+            self._path.unlink()
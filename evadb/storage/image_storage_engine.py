@@ -12,30 +12,93 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator
 
+import pandas as pd
+
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import ROW_NUM_COLUMN
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
 from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
-from evadb.readers.image.opencv_image_reader import CVImageReader
+from evadb.readers.image.opencv_image_reader import read_image
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
+from evadb.utils.generic_utils import BatchSizer
+
+# images decoded ahead of the batch being assembled, per worker thread
+DECODE_QUEUE_IMAGES_PER_WORKER = 4
 
 
 class ImageStorageEngine(AbstractMediaStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
 
-    def read(self, table: TableCatalogEntry) -> Iterator[Batch]:
+    def read(
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        batch_size: int = None,
+        num_workers: int = None,
+    ) -> Iterator[Batch]:
+        """
+        Reads the images of the table in load order, several images per batch.
+
+        Arguments:
+            batch_mem_size (int): maximum memory size of a batch
+            batch_size (int): maximum number of images in a batch
+            num_workers (int): number of threads decoding images at the same
+                time, read from the image_decode_workers configuration if not
+                specified
+        """
+        if num_workers is None:
+            num_workers = self.db.catalog().get_configuration_catalog_value(
+                "image_decode_workers", 1
+            )
+        num_workers = max(1, num_workers)
+        batch_sizer = BatchSizer(batch_mem_size, batch_size)
+        rows = []
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            for row in self._decode_images(table, pool, num_workers):
+                rows.append(row)
+                if batch_sizer.add(row):
+                    yield Batch(pd.DataFrame(rows))
+                    rows = []
+        if rows:
+            yield Batch(pd.DataFrame(rows))
+
+    def _decode_images(
+        self, table: TableCatalogEntry, pool: ThreadPoolExecutor, num_workers: int
+    ) -> Iterator[dict]:
+        """Decodes the images of the table in the thread pool, keeping a
+        bounded number of images in flight, and returns them in load order"""
+        pending = deque()
+        try:
+            for row_id, file_name, image_file in self._get_images(table):
+                image = pool.submit(read_image, image_file)
+                pending.append((row_id, file_name, image))
+                if len(pending) >= num_workers * DECODE_QUEUE_IMAGES_PER_WORKER:
+                    yield self._get_image_row(table, *pending.popleft())
+            while pending:
+                yield self._get_image_row(table, *pending.popleft())
+        finally:
+            # do not decode the remaining images if the scan is stopped early
+            for _, _, image in pending:
+                image.cancel()
+
+    def _get_images(self, table: TableCatalogEntry) -> Iterator[tuple]:
         for image_files in self._rdb_handler.read(self._get_metadata_table(table)):
-            for _, (row_id, file_name, _) in image_files.iterrows():
+            for _, row in image_files.iterrows():
+                file_name = row["file_url"]
                 system_file_name = self._xform_file_url_to_file_name(file_name)
                 image_file = Path(table.file_url) / system_file_name
-                # setting batch_mem_size = 1, we need fix it
-                reader = CVImageReader(str(image_file), batch_mem_size=1)
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(file_name)
-                    batch.frames[ROW_NUM_COLUMN] = batch.frames[table.columns[0].name]
-                    yield batch
+                yield row[IDENTIFIER_COLUMN], file_name, str(image_file)
+
+    def _get_image_row(self, table: TableCatalogEntry, row_id, file_name, image):
+        return {
+            "data": image.result(),
+            table.columns[0].name: row_id,
+            table.columns[1].name: str(file_name),
+            ROW_NUM_COLUMN: row_id,
+        }
@@ -28,7 +28,7 @@ from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
 from evadb.third_party.databases.interface import get_database_handler
-from evadb.utils.generic_utils import PickleSerializer, rebatch
+from evadb.utils.generic_utils import NdArraySerializer, rebatch
 from evadb.utils.logging_manager import logger
 
 
@@ -76,7 +76,7 @@ def _dict_to_sql_row(dict_row: dict, columns: List[ColumnCatalogEntry]):
     # Serialize numpy data
     for col in columns:
         if col.type == ColumnType.NDARRAY:
-            dict_row[col.name] = PickleSerializer.serialize(dict_row[col.name])
+            dict_row[col.name] = NdArraySerializer.serialize(dict_row[col.name])
         elif isinstance(dict_row[col.name], (np.generic,)):
             # Sqlalchemy does not consume numpy generic data types
             # convert numpy datatype to python generic datatype using tolist()
@@ -93,7 +93,7 @@ def _deserialize_sql_row(sql_row: tuple, columns: List[ColumnCatalogEntry]):
     for idx, col in enumerate(columns):
         # hack, we skip deserializing if sql_row[col.name] is not of type bytes
         if col.type == ColumnType.NDARRAY and isinstance(sql_row[col.name], bytes):
-            dict_row[col.name] = PickleSerializer.deserialize(sql_row[idx])
+            dict_row[col.name] = NdArraySerializer.deserialize(sql_row[idx])
         else:
             dict_row[col.name] = sql_row[idx]
     return dict_row
@@ -159,7 +159,10 @@ class NativeStorageEngine(AbstractStorageEngine):
             raise Exception(err_msg)
 
     def read(
-        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        batch_size: int = None,
     ) -> Iterator[Batch]:
         try:
             db_catalog_entry = self._get_database_catalog_entry(table.database_name)
@@ -190,7 +193,7 @@ class NativeStorageEngine(AbstractStorageEngine):
                         _deserialize_sql_row(row, ordered_columns) for row in result
                     )
 
-                for df in rebatch(result, batch_mem_size):
+                for df in rebatch(result, batch_mem_size, batch_size):
                     yield Batch(pd.DataFrame(df))
 
         except Exception as e:
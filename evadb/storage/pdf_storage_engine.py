@@ -12,32 +12,206 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import multiprocessing as mp
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, List, NamedTuple, Tuple
+
+import pandas as pd
 
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import ROW_NUM_COLUMN, ROW_NUM_MAGIC
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN, ROW_NUM_MAGIC
 from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
-from evadb.readers.pdf_reader import PDFReader
+from evadb.readers.pdf_reader import extract_pages, get_num_pages
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
+from evadb.utils.generic_utils import BatchSizer, get_file_checksum
+from evadb.utils.kv_cache import DiskKVCache
+from evadb.utils.logging_manager import logger
+
+# directory of the page store in the directory of the table
+PAGE_STORE_DIR = ".pages"
+
+# bytes of extracted pages kept per table, the least recently stored ones are
+# extracted again from the files if the store grows beyond it
+PAGE_STORE_SIZE = 2**34
+
+# consecutive pages of a pdf extracted by a worker at a time, so that large
+# pdfs are spread across the workers without opening them for every page
+PAGES_PER_TASK = 8
+
+
+class PDFFile(NamedTuple):
+    """A pdf of a pdf table, as stored in its metadata table"""
+
+    row_id: int
+    name: str
+    path: str
+    content_hash: str
+    num_pages: int
+
+
+def _extract_page_range(task: Tuple[str, int, int]) -> List:
+    return extract_pages(*task)
 
 
 class PDFStorageEngine(AbstractMediaStorageEngine):
+    """Stores the pdfs as links to the loaded files, along with the paragraphs
+    of their pages. The pages are extracted when the pdfs are loaded and stored
+    by content hash and page number, so that scans do not parse the files
+    again."""
+
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
 
-    def read(self, table: TableCatalogEntry) -> Iterator[Batch]:
-        for image_files in self._rdb_handler.read(self._get_metadata_table(table), 12):
-            for _, (row_id, file_name, _) in image_files.iterrows():
+    def write(self, table: TableCatalogEntry, rows: Batch):
+        file_paths = list(rows.file_paths())
+        content_hashes = self._get_content_hashes(rows)
+        pdfs = [
+            PDFFile(None, file_path, file_path, content_hash, get_num_pages(file_path))
+            for file_path, content_hash in zip(file_paths, content_hashes)
+        ]
+        self._extract_pages(table, pdfs)
+
+        metadata = rows.frames.copy()
+        metadata["content_hash"] = [pdf.content_hash for pdf in pdfs]
+        metadata["num_pages"] = [pdf.num_pages for pdf in pdfs]
+        return super().write(table, Batch(metadata))
+
+    def read(
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        batch_size: int = None,
+        num_workers: int = None,
+    ) -> Iterator[Batch]:
+        """
+        Reads the paragraphs of the pdfs of the table in load order, the
+        paragraphs of several pages and pdfs per batch.
+
+        Arguments:
+            batch_mem_size (int): maximum memory size of a batch
+            batch_size (int): maximum number of paragraphs in a batch
+            num_workers (int): number of processes extracting the pages
+                missing from the page store, read from the pdf_extract_workers
+                configuration if not specified
+        """
+        pdfs = self._get_pdfs(table)
+        page_store = self._extract_pages(table, pdfs, num_workers)
+
+        batch_sizer = BatchSizer(batch_mem_size, batch_size)
+        rows = []
+        for pdf in pdfs:
+            row_num = 0
+            for page_no in range(pdf.num_pages):
+                paragraphs = page_store.get((pdf.content_hash, page_no))
+                if paragraphs is None:
+                    # evicted from the store since it was extracted
+                    paragraphs = extract_pages(pdf.path, page_no, page_no + 1)[0]
+                for paragraph_no, text in paragraphs:
+                    row = {
+                        table.columns[0].name: pdf.row_id,
+                        table.columns[1].name: str(pdf.name),
+                        "page": page_no + 1,
+                        "paragraph": paragraph_no + 1,
+                        "data": text,
+                        ROW_NUM_COLUMN: pdf.row_id * ROW_NUM_MAGIC + row_num,
+                    }
+                    row_num += 1
+                    rows.append(row)
+                    if batch_sizer.add(row):
+                        yield Batch(pd.DataFrame(rows))
+                        rows = []
+        if rows:
+            yield Batch(pd.DataFrame(rows))
+
+    def _get_pdfs(self, table: TableCatalogEntry) -> List[PDFFile]:
+        """Returns the pdfs of the table along with their content hash and
+        number of pages, which are computed from the file for the pdfs loaded
+        without them"""
+        pdfs = []
+        for pdf_files in self._rdb_handler.read(self._get_metadata_table(table), 12):
+            for _, row in pdf_files.iterrows():
+                file_name = row["file_url"]
                 system_file_name = self._xform_file_url_to_file_name(file_name)
-                image_file = Path(table.file_url) / system_file_name
-                # setting batch_mem_size = 1, we need fix it
-                reader = PDFReader(str(image_file), batch_mem_size=1)
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(file_name)
-                    batch.frames[ROW_NUM_COLUMN] = (
-                        row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
+                pdf_file = str(Path(table.file_url) / system_file_name)
+                content_hash = row.get("content_hash")
+                if pd.isna(content_hash):
+                    content_hash = get_file_checksum(pdf_file)
+                num_pages = row.get("num_pages")
+                if pd.isna(num_pages):
+                    num_pages = get_num_pages(pdf_file)
+                pdfs.append(
+                    PDFFile(
+                        row[IDENTIFIER_COLUMN],
+                        file_name,
+                        pdf_file,
+                        content_hash,
+                        int(num_pages),
                     )
-                    yield batch
+                )
+        return pdfs
+
+    def _extract_pages(
+        self,
+        table: TableCatalogEntry,
+        pdfs: List[PDFFile],
+        num_workers: int = None,
+    ) -> DiskKVCache:
+        """Extracts the pages missing from the page store of the table, in a
+        process pool if there are several page ranges to extract, and returns
+        the store"""
+        page_store = DiskKVCache(
+            str(Path(table.file_url) / PAGE_STORE_DIR),
+            max_cache_size=PAGE_STORE_SIZE,
+        )
+        # ranges of consecutive missing pages, at most PAGES_PER_TASK long
+        tasks = []
+        task_keys = []
+        seen = set()
+        for pdf in pdfs:
+            if pdf.content_hash in seen:
+                continue
+            seen.add(pdf.content_hash)
+            for page_no in range(pdf.num_pages):
+                if (pdf.content_hash, page_no) in page_store:
+                    continue
+                if (
+                    tasks
+                    and tasks[-1][0] == pdf.path
+                    and tasks[-1][2] == page_no
+                    and tasks[-1][2] - tasks[-1][1] < PAGES_PER_TASK
+                ):
+                    tasks[-1] = (pdf.path, tasks[-1][1], page_no + 1)
+                else:
+                    tasks.append((pdf.path, page_no, page_no + 1))
+                    task_keys.append(pdf.content_hash)
+        if not tasks:
+            return page_store
+
+        if num_workers is None:
+            num_workers = self.db.catalog().get_configuration_catalog_value(
+                "pdf_extract_workers", 1
+            )
+        num_workers = min(num_workers, len(tasks))
+        logger.info(f"Extracting {len(tasks)} page ranges of the pdfs of {table.name}")
+        if num_workers <= 1:
+            pages = map(_extract_page_range, tasks)
+            self._store_pages(page_store, tasks, task_keys, pages)
+        else:
+            with mp.Pool(num_workers) as pool:
+                pages = pool.imap(_extract_page_range, tasks)
+                self._store_pages(page_store, tasks, task_keys, pages)
+        return page_store
+
+    def _store_pages(
+        self,
+        page_store: DiskKVCache,
+        tasks: List[Tuple[str, int, int]],
+        task_keys: List[str],
+        pages: Iterator[List],
+    ):
+        for (_, start_page, _), content_hash, task_pages in zip(
+            tasks, task_keys, pages
+        ):
+            for page_no, paragraphs in enumerate(task_pages, start_page):
+                page_store.set((content_hash, page_no), paragraphs)
@@ -12,30 +12,123 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator, List
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import Table, inspect
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    Table,
+    and_,
+    bindparam,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+)
 from sqlalchemy.sql.expression import ColumnElement
 
-from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.catalog_type import ColumnType, NdArrayType
 from evadb.catalog.models.base_model import BaseModel
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.models.utils import IndexCatalogEntry
 from evadb.catalog.schema_utils import SchemaUtils
 from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
 from evadb.database import EvaDBDatabase
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.expression_utils import get_index_predicate
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.models.storage.batch import Batch
 from evadb.parser.table_ref import TableInfo
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
-from evadb.utils.generic_utils import PickleSerializer, rebatch
+from evadb.storage.embedding_store import (
+    EMBEDDING_FILE_SUFFIX,
+    EmbeddingColumnStore,
+    supports_embedding_layout,
+)
+from evadb.storage.zone_map import (
+    ZONE_MAP_COLUMN_TYPES,
+    ColumnZoneMap,
+    compute_column_zone_map,
+    predicate_may_match,
+)
+from evadb.utils.generic_utils import BatchSizer, NdArraySerializer, rebatch
 from evadb.utils.logging_manager import logger
+from evadb.utils.stats import Timer
 
 # Leveraging Dynamic schema in SQLAlchemy
 # https://sparrigan.github.io/sql/sqla/2016/01/03/dynamic-tables.html
 
 
+# page cache used by sqlite while bulk loading a table
+BULK_LOAD_CACHE_KB = 256 * 1024
+# The zone maps of a table are stored in a sibling table. Every row of the
+# zone map table describes the rows of one write, identified by their range of
+# `_row_id`, with the min, max and null count of every scalar column.
+ZONE_MAP_TABLE_PREFIX = "__zone_map__"
+# sqlite shares a single namespace between tables and indexes, so the indexes
+# created by users are prefixed
+INDEX_PREFIX = "__index__"
+# rows looked up through an index are fetched with `_row_id IN (...)` queries,
+# which are kept below the default limit of 999 bound parameters of sqlite
+MAX_ROW_IDS_PER_QUERY = 900
+# fixed-shape NDARRAY columns are stored as matrices in this directory next to
+# the table, instead of one blob per row in the database
+EMBEDDING_DIR_SUFFIX = ".embeddings"
+# rows moved at once when a column leaves the matrix layout
+EMBEDDING_MIGRATION_ROWS = 10000
+
+
+def predicate_to_sqlalchemy_clause(predicate: AbstractExpression, table: Table):
+    """Converts a predicate on table columns into a sqlalchemy filter clause.
+
+    Only comparisons between columns and constants combined with AND/OR are
+    supported. LIKE is translated into a regular expression search.
+
+    Arguments:
+        predicate (AbstractExpression): predicate to convert
+        table (Table): sqlalchemy table the predicate refers to
+
+    Returns:
+        ColumnElement[bool]: the equivalent filter clause
+    """
+    if isinstance(predicate, TupleValueExpression):
+        return table.c[predicate.name]
+    if isinstance(predicate, ConstantValueExpression):
+        return predicate.value
+
+    left = predicate_to_sqlalchemy_clause(predicate.get_child(0), table)
+    right = predicate_to_sqlalchemy_clause(predicate.get_child(1), table)
+    if predicate.etype == ExpressionType.LOGICAL_AND:
+        return and_(left, right)
+    elif predicate.etype == ExpressionType.LOGICAL_OR:
+        return or_(left, right)
+    elif predicate.etype == ExpressionType.COMPARE_EQUAL:
+        return left == right
+    elif predicate.etype == ExpressionType.COMPARE_GREATER:
+        return left > right
+    elif predicate.etype == ExpressionType.COMPARE_LESSER:
+        return left < right
+    elif predicate.etype == ExpressionType.COMPARE_GEQ:
+        return left >= right
+    elif predicate.etype == ExpressionType.COMPARE_LEQ:
+        return left <= right
+    elif predicate.etype == ExpressionType.COMPARE_NEQ:
+        return left != right
+    elif predicate.etype == ExpressionType.COMPARE_LIKE:
+        return left.regexp_match(right)
+
+    raise NotImplementedError(f"Predicate type {predicate.etype} not supported")
+
+
 class SQLStorageEngine(AbstractStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         """
@@ -44,26 +137,84 @@ class SQLStorageEngine(AbstractStorageEngine):
         super().__init__(db)
         self._sql_session = db.catalog().sql_config.session
         self._sql_engine = db.catalog().sql_config.engine
-        self._serializer = PickleSerializer
-
-    def _dict_to_sql_row(self, dict_row: dict, columns: List[ColumnCatalogEntry]):
-        # Serialize numpy data
-        for col in columns:
-            if col.type == ColumnType.NDARRAY:
-                dict_row[col.name] = self._serializer.serialize(dict_row[col.name])
-            elif isinstance(dict_row[col.name], (np.generic,)):
+        self._serializer = NdArraySerializer
+
+    @staticmethod
+    def exists(db: EvaDBDatabase, table: TableCatalogEntry) -> bool:
+        """Checks whether the table has been created by this storage engine"""
+        return inspect(db.catalog().sql_config.engine).has_table(table.name)
+
+    def _batch_to_sql_rows(
+        self,
+        rows: Batch,
+        columns: List[ColumnCatalogEntry],
+        null_columns: List[str] = [],
+    ) -> List[dict]:
+        """Converts the batch into sql rows one column at a time, instead of
+        converting every cell of every row. The columns in `null_columns` are
+        stored outside of the database and written as NULL."""
+        column_types = {col.name: col.type for col in columns}
+        column_names = []
+        column_values = []
+        for name, values in rows.frames.items():
+            if name == ROW_NUM_COLUMN:
+                continue
+            column_names.append(name)
+            if name in null_columns:
+                column_values.append([None] * len(values))
+            elif column_types.get(name) == ColumnType.NDARRAY:
+                column_values.append(
+                    [self._serializer.serialize(value) for value in values]
+                )
+            elif values.dtype == object:
                 # Sqlalchemy does not consume numpy generic data types
                 # convert numpy datatype to python generic datatype using tolist()
                 # eg. np.int64 -> int
                 # https://stackoverflow.com/a/53067954
-                dict_row[col.name] = dict_row[col.name].tolist()
-        return dict_row
+                column_values.append(
+                    [
+                        value.tolist() if isinstance(value, np.generic) else value
+                        for value in values
+                    ]
+                )
+            else:
+                # tolist converts the whole numpy column to python datatypes
+                column_values.append(values.tolist())
+        return [dict(zip(column_names, record)) for record in zip(*column_values)]
+
+    @contextmanager
+    def _bulk_load_settings(self):
+        """Relaxes the durability settings of sqlite while bulk loading. Each
+        commit no longer waits for the data to reach the disk, which is safe
+        as long as the process does not crash mid-load."""
+        if self._sql_engine.dialect.name != "sqlite":
+            yield
+            return
+        synchronous = self._sql_session.execute(text("PRAGMA synchronous")).scalar()
+        cache_size = self._sql_session.execute(text("PRAGMA cache_size")).scalar()
+        self._sql_session.execute(text("PRAGMA synchronous = OFF"))
+        # negative values are in KiB
+        self._sql_session.execute(text(f"PRAGMA cache_size = -{BULK_LOAD_CACHE_KB}"))
+        try:
+            yield
+        finally:
+            self._sql_session.execute(text(f"PRAGMA synchronous = {synchronous}"))
+            self._sql_session.execute(text(f"PRAGMA cache_size = {cache_size}"))
 
-    def _deserialize_sql_row(self, sql_row: dict, columns: List[ColumnCatalogEntry]):
+    def _deserialize_sql_row(
+        self,
+        sql_row: dict,
+        columns: List[ColumnCatalogEntry],
+        embeddings: Dict[str, np.ndarray] = {},
+    ):
         # Deserialize numpy data
         dict_row = {}
         for idx, col in enumerate(columns):
-            if col.type == ColumnType.NDARRAY:
+            if col.name in embeddings:
+                # zero-copy view of the memory-mapped matrix
+                offset = sql_row[IDENTIFIER_COLUMN] - 1
+                dict_row[col.name] = embeddings[col.name][offset]
+            elif col.type == ColumnType.NDARRAY:
                 dict_row[col.name] = self._serializer.deserialize(sql_row[col.name])
             else:
                 dict_row[col.name] = sql_row[col.name]
@@ -130,12 +281,58 @@ class SQLStorageEngine(AbstractStorageEngine):
                 # therefore manually removing the table from the in-memory metadata
                 # https://github.com/sqlalchemy/sqlalchemy/issues/5112
                 BaseModel.metadata.remove(table_to_remove)
+            zone_map_table = self._get_zone_map_table(table)
+            if zone_map_table is not None:
+                zone_map_table.drop(self._sql_engine)
+                BaseModel.metadata.remove(zone_map_table)
             self._sql_session.commit()
+            embedding_dir = self._get_embedding_dir(table)
+            if embedding_dir is not None and embedding_dir.exists():
+                shutil.rmtree(embedding_dir)
         except Exception as e:
             err_msg = f"Failed to drop the table {table.name} with Exception {str(e)}"
             logger.exception(err_msg)
             raise Exception(err_msg)
 
+    def create_index(self, table: TableCatalogEntry, index_name: str, column: str):
+        """
+        Create a B-tree index on a column of the sql table. The database keeps
+        it up to date on every write.
+
+        Arguments:
+            table: table metadata object of the table to index
+            index_name (str): name of the index
+            column (str): name of the indexed column
+        """
+        try:
+            table_to_index = self._try_loading_table_via_reflection(table.name)
+            sql_index = Index(f"{INDEX_PREFIX}{index_name}", table_to_index.c[column])
+            sql_index.create(self._sql_session.connection())
+            self._sql_session.commit()
+        except Exception as e:
+            err_msg = (
+                f"Failed to create the index {index_name} on the table {table.name} "
+                f"with exception {str(e)}"
+            )
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def drop_index(self, table: TableCatalogEntry, index_name: str):
+        try:
+            table_with_index = self._try_loading_table_via_reflection(table.name)
+            for sql_index in list(table_with_index.indexes):
+                if sql_index.name == f"{INDEX_PREFIX}{index_name}":
+                    sql_index.drop(self._sql_session.connection())
+                    table_with_index.indexes.discard(sql_index)
+            self._sql_session.commit()
+        except Exception as e:
+            err_msg = (
+                f"Failed to drop the index {index_name} on the table {table.name} "
+                f"with exception {str(e)}"
+            )
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
     def write(self, table: TableCatalogEntry, rows: Batch):
         """
         Write rows into the sql table.
@@ -146,60 +343,553 @@ class SQLStorageEngine(AbstractStorageEngine):
         """
         try:
             table_to_update = self._try_loading_table_via_reflection(table.name)
-            columns = rows.frames.keys()
-            data = []
+            zone_map_table = self._get_zone_map_table(table, create=True)
+            self._write_rows(table, table_to_update, zone_map_table, rows)
+            self._sql_session.commit()
+        except Exception as e:
+            err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
 
-            # During table writes, assume row_id is automatically handled by
-            # the sqlalchemy engine. Another assumption we make here is the
-            # updated data need not to take care of row_id.
-            table_columns = [
-                col
-                for col in table.columns
-                if (col.name != IDENTIFIER_COLUMN and col.name != ROW_NUM_COLUMN)
-            ]
+    def bulk_write(
+        self,
+        table: TableCatalogEntry,
+        batches: Iterator[Batch],
+        commit_rows: int = None,
+    ) -> int:
+        """
+        Write a stream of batches into the sql table. Each batch is inserted
+        with a single executemany call, and the transaction is committed once
+        every `commit_rows` rows instead of once per batch.
 
-            # Todo: validate the data type before inserting into the table
-            for record in rows.frames.values:
-                row_data = {
-                    col: record[idx]
-                    for idx, col in enumerate(columns)
-                    if col != ROW_NUM_COLUMN
-                }
-                data.append(self._dict_to_sql_row(row_data, table_columns))
-            self._sql_session.execute(table_to_update.insert(), data)
-            self._sql_session.commit()
+        Arguments:
+            table: table metadata object to write into
+            batches: batches to be persisted in the storage.
+            commit_rows (int): number of rows written per transaction, read
+                from the bulk_write_commit_rows configuration if not specified
+
+        Returns:
+            int: number of rows written
+        """
+        if commit_rows is None:
+            commit_rows = self.db.catalog().get_configuration_catalog_value(
+                "bulk_write_commit_rows", 1000000
+            )
+        try:
+            table_to_update = self._try_loading_table_via_reflection(table.name)
+            zone_map_table = self._get_zone_map_table(table, create=True)
+            num_rows = 0
+            uncommitted_rows = 0
+            timer = Timer()
+            with timer, self._bulk_load_settings():
+                for batch in batches:
+                    num_batch_rows = self._write_rows(
+                        table, table_to_update, zone_map_table, batch
+                    )
+                    num_rows += num_batch_rows
+                    uncommitted_rows += num_batch_rows
+                    if uncommitted_rows >= commit_rows:
+                        self._sql_session.commit()
+                        uncommitted_rows = 0
+                self._sql_session.commit()
+            elapsed_time = timer.total_elapsed_time
+            rows_per_sec = num_rows / elapsed_time if elapsed_time > 0 else 0
+            logger.info(
+                f"Loaded {num_rows} rows into {table.name} in {elapsed_time:.2f} sec "
+                f"({rows_per_sec:.0f} rows/sec)"
+            )
+            return num_rows
         except Exception as e:
+            self._sql_session.rollback()
             err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
             logger.exception(err_msg)
             raise Exception(err_msg)
 
+    def _get_zone_map_table(
+        self, table: TableCatalogEntry, create: bool = False
+    ) -> Table:
+        """Returns the zone map table of the table. It is created if `create`
+        is set, otherwise None is returned if it does not exist."""
+        zone_map_table_name = f"{ZONE_MAP_TABLE_PREFIX}{table.name}"
+        if inspect(self._sql_engine).has_table(zone_map_table_name):
+            return self._try_loading_table_via_reflection(zone_map_table_name)
+        if not create:
+            return None
+
+        zone_map_columns = [
+            Column(IDENTIFIER_COLUMN, Integer, primary_key=True),
+            Column("chunk_start", Integer),
+            Column("chunk_end", Integer),
+            Column("num_rows", Integer),
+        ]
+        for col in table.columns:
+            if col.type in ZONE_MAP_COLUMN_TYPES and col.name not in [
+                IDENTIFIER_COLUMN,
+                ROW_NUM_COLUMN,
+            ]:
+                column_type = SchemaUtils.xform_to_sqlalchemy_column(col).type
+                zone_map_columns.extend(
+                    [
+                        Column(f"{col.name}__min", column_type),
+                        Column(f"{col.name}__max", column_type),
+                        Column(f"{col.name}__null_count", Integer),
+                    ]
+                )
+        if zone_map_table_name in BaseModel.metadata.tables:
+            BaseModel.metadata.remove(BaseModel.metadata.tables[zone_map_table_name])
+        zone_map_table = Table(
+            zone_map_table_name, BaseModel.metadata, *zone_map_columns
+        )
+        # created through the session so that it does not wait on the locks
+        # held by the ongoing transaction
+        zone_map_table.create(self._sql_session.connection())
+        return zone_map_table
+
+    def _get_embedding_dir(self, table: TableCatalogEntry) -> Path:
+        if table.file_url is None:
+            return None
+        return Path(f"{table.file_url}{EMBEDDING_DIR_SUFFIX}")
+
+    def _get_embedding_store(
+        self, table: TableCatalogEntry, column: ColumnCatalogEntry
+    ) -> EmbeddingColumnStore:
+        """Returns the matrix store of the column, None if the column can not be
+        stored as a matrix"""
+        embedding_dir = self._get_embedding_dir(table)
+        if embedding_dir is None or not supports_embedding_layout(column):
+            return None
+        return EmbeddingColumnStore(
+            embedding_dir / f"{column.name}{EMBEDDING_FILE_SUFFIX}",
+            NdArrayType.to_numpy_type(column.array_type),
+        )
+
+    def _get_embedding_stores(
+        self, table: TableCatalogEntry
+    ) -> Dict[str, EmbeddingColumnStore]:
+        """Returns the stores of the columns currently stored as matrices"""
+        stores = {}
+        for column in table.columns:
+            store = self._get_embedding_store(table, column)
+            if store is not None and store.exists():
+                stores[column.name] = store
+        return stores
+
+    def _move_embeddings_to_sql(
+        self, table_to_update: Table, column_name: str, store: EmbeddingColumnStore
+    ):
+        """Moves a column out of the matrix layout, back to one blob per row. It
+        happens when a value does not fit in the matrix, e.g. NULL or an array
+        of another shape."""
+        logger.info(f"Moving the column {column_name} of {table_to_update.name} to sql")
+        matrix = store.matrix()
+        row_id = table_to_update.c[IDENTIFIER_COLUMN]
+        row_ids = [row[0] for row in self._sql_session.execute(select(row_id))]
+        update = (
+            table_to_update.update()
+            .where(row_id == bindparam("b_row_id"))
+            .values({column_name: bindparam("b_value")})
+        )
+        for start in range(0, len(row_ids), EMBEDDING_MIGRATION_ROWS):
+            self._sql_session.execute(
+                update,
+                [
+                    {
+                        "b_row_id": rid,
+                        "b_value": self._serializer.serialize(
+                            np.array(matrix[rid - 1])
+                        ),
+                    }
+                    for rid in row_ids[start : start + EMBEDDING_MIGRATION_ROWS]
+                ],
+            )
+        # the blobs are committed before the matrix is removed
+        self._sql_session.commit()
+        del matrix
+        store.drop()
+
+    def _get_embedding_columns(
+        self,
+        table: TableCatalogEntry,
+        table_to_update: Table,
+        rows: Batch,
+        is_empty: bool,
+    ) -> Dict[str, EmbeddingColumnStore]:
+        """Decides which columns of the batch are written to matrices. A column
+        starts in the matrix layout if its first values all share one shape,
+        and leaves it as soon as a value does not fit."""
+        embedding_columns = {}
+        for column in table.columns:
+            store = self._get_embedding_store(table, column)
+            if store is None:
+                continue
+            if column.name in rows.frames:
+                values = list(rows.frames[column.name])
+            else:
+                values = [None] * len(rows)
+            if store.exists():
+                if store.can_store(values):
+                    embedding_columns[column.name] = store
+                else:
+                    self._move_embeddings_to_sql(table_to_update, column.name, store)
+            elif is_empty and len(values) > 0 and store.can_store(values):
+                embedding_columns[column.name] = store
+        return embedding_columns
+
+    def _write_rows(
+        self,
+        table: TableCatalogEntry,
+        table_to_update: Table,
+        zone_map_table: Table,
+        rows: Batch,
+    ) -> int:
+        """Inserts the rows and records their zone map. Returns the number of
+        rows inserted."""
+        # During table writes, assume row_id is automatically handled by
+        # the sqlalchemy engine. Another assumption we make here is the
+        # updated data need not to take care of row_id.
+        # Todo: validate the data type before inserting into the table
+        if rows.empty():
+            return 0
+        row_id = table_to_update.c[IDENTIFIER_COLUMN]
+        prev_max_row_id = (
+            self._sql_session.execute(select(func.max(row_id))).scalar() or 0
+        )
+        embedding_columns = self._get_embedding_columns(
+            table, table_to_update, rows, is_empty=prev_max_row_id == 0
+        )
+        data = self._batch_to_sql_rows(
+            rows, table.columns, null_columns=list(embedding_columns.keys())
+        )
+        if not data:
+            return 0
+        self._sql_session.execute(table_to_update.insert(), data)
+        max_row_id = self._sql_session.execute(select(func.max(row_id))).scalar()
+
+        if embedding_columns:
+            inserted_row_ids = np.fromiter(
+                (
+                    row[0]
+                    for row in self._sql_session.execute(
+                        select(row_id).where(row_id > prev_max_row_id).order_by(row_id)
+                    )
+                ),
+                dtype=np.int64,
+            )
+            for name, store in embedding_columns.items():
+                store.write(inserted_row_ids, list(rows.frames[name]))
+
+        # row ids of deleted rows can be handed out again, so zone maps
+        # reaching past the last row are stale
+        self._sql_session.execute(
+            zone_map_table.delete().where(
+                zone_map_table.c["chunk_end"] > prev_max_row_id
+            )
+        )
+        zone_map_row = {
+            "chunk_start": prev_max_row_id + 1,
+            "chunk_end": max_row_id,
+            "num_rows": len(data),
+        }
+        for column_name in zone_map_table.c.keys():
+            if not column_name.endswith("__min"):
+                continue
+            name = column_name[: -len("__min")]
+            if name in rows.frames:
+                zone_map = compute_column_zone_map(rows.frames[name])
+            else:
+                zone_map = ColumnZoneMap(null_count=len(data))
+            zone_map_row[f"{name}__min"] = zone_map.min_value
+            zone_map_row[f"{name}__max"] = zone_map.max_value
+            zone_map_row[f"{name}__null_count"] = zone_map.null_count
+        self._sql_session.execute(zone_map_table.insert(), [zone_map_row])
+        return len(data)
+
+    def _get_pruned_chunks(
+        self, table: TableCatalogEntry, predicate: AbstractExpression
+    ) -> Tuple[List[Tuple[int, int]], int]:
+        """Checks the predicate against the zone maps of the table.
+
+        Returns:
+            Tuple[List[Tuple[int, int]], int]: the `_row_id` ranges of the
+            chunks that hold no row satisfying the predicate, in `_row_id`
+            order, and the total number of chunks
+        """
+        zone_map_table = self._get_zone_map_table(table)
+        if predicate is None or zone_map_table is None:
+            return [], 0
+        column_names = [
+            column_name[: -len("__min")]
+            for column_name in zone_map_table.c.keys()
+            if column_name.endswith("__min")
+        ]
+        pruned_chunks = []
+        num_chunks = 0
+        query = select(zone_map_table).order_by(zone_map_table.c["chunk_start"])
+        for row in self._sql_session.execute(query):
+            row = row._asdict()
+            num_chunks += 1
+            zone_maps = {
+                name: ColumnZoneMap(
+                    row[f"{name}__min"],
+                    row[f"{name}__max"],
+                    row[f"{name}__null_count"],
+                )
+                for name in column_names
+            }
+            if not predicate_may_match(predicate, zone_maps, row["num_rows"]):
+                pruned_chunks.append((row["chunk_start"], row["chunk_end"]))
+        return pruned_chunks, num_chunks
+
+    def zone_map_pruning(
+        self, table: TableCatalogEntry, predicate: AbstractExpression
+    ) -> Tuple[int, int]:
+        """Returns the number of chunks of the table skipped by a scan with
+        the predicate, and the total number of chunks"""
+        pruned_chunks, num_chunks = self._get_pruned_chunks(table, predicate)
+        return len(pruned_chunks), num_chunks
+
+    def _read_rows(
+        self,
+        table_to_read: Table,
+        batch_mem_size: int,
+        columns: List[ColumnCatalogEntry],
+        predicate: AbstractExpression = None,
+        batch_size: int = None,
+        pruned_chunks: List[Tuple[int, int]] = [],
+        embeddings: Dict[str, np.ndarray] = {},
+    ) -> Iterator[dict]:
+        """Yields the deserialized rows of the table in `_row_id` order.
+
+        Rows are fetched in chunks of roughly one batch using
+        keyset pagination on `_row_id`. Every chunk is a separate short query,
+        so no cursor is left open while the caller consumes the rows and
+        writes issued through the same session in the meantime are safe.
+        Rows inserted after the read started are not returned. The `_row_id`
+        ranges in `pruned_chunks` are skipped. The columns in `embeddings` are
+        read from their matrices instead of the database.
+        """
+        row_id = table_to_read.c[IDENTIFIER_COLUMN]
+        max_row_id = self._sql_session.execute(select(func.max(row_id))).scalar()
+        if max_row_id is None:
+            return
+
+        sql_columns = [col for col in columns if col.name not in embeddings]
+        select_query = select(*[table_to_read.c[col.name] for col in sql_columns])
+        select_query = select_query.where(row_id <= max_row_id)
+        if predicate is not None:
+            select_query = select_query.where(
+                predicate_to_sqlalchemy_clause(predicate, table_to_read)
+            )
+
+        # ranges of `_row_id` to scan, each one given as (exclusive lower
+        # bound, inclusive upper bound)
+        scan_ranges = []
+        lower_row_id = None
+        for chunk_start, chunk_end in pruned_chunks:
+            scan_ranges.append((lower_row_id, chunk_start - 1))
+            lower_row_id = chunk_end
+        scan_ranges.append((lower_row_id, max_row_id))
+
+        # the first chunk holds a single row. The size of the following chunks
+        # is re-estimated from the rows read so far
+        batch_sizer = BatchSizer(batch_mem_size, batch_size)
+        chunk_size = 1
+        for last_row_id, upper_row_id in scan_ranges:
+            if last_row_id is not None and last_row_id >= upper_row_id:
+                continue
+            while True:
+                query = select_query.where(row_id <= upper_row_id)
+                if last_row_id is not None:
+                    query = query.where(row_id > last_row_id)
+                query = query.order_by(row_id).limit(chunk_size)
+                rows = [
+                    self._deserialize_sql_row(row._asdict(), columns, embeddings)
+                    for row in self._sql_session.execute(query)
+                ]
+                if not rows:
+                    break
+                for row in rows:
+                    batch_sizer.add(row)
+                chunk_size = batch_sizer.rows_per_batch()
+                last_row_id = rows[-1][IDENTIFIER_COLUMN]
+                yield from rows
+
+    def _read_rows_by_index(
+        self,
+        table_to_read: Table,
+        batch_mem_size: int,
+        columns: List[ColumnCatalogEntry],
+        index_predicate: AbstractExpression,
+        predicate: AbstractExpression = None,
+        batch_size: int = None,
+        embeddings: Dict[str, np.ndarray] = {},
+    ) -> Iterator[dict]:
+        """Yields the deserialized rows of the table satisfying the predicate in
+        `_row_id` order, using an index to find them.
+
+        The `_row_id` of the rows satisfying the `index_predicate` are first
+        read from the index alone. The rows are then fetched by `_row_id` in
+        chunks of roughly one batch, and filtered with the rest of the
+        predicate.
+        """
+        row_id = table_to_read.c[IDENTIFIER_COLUMN]
+        row_id_query = select(row_id).where(
+            predicate_to_sqlalchemy_clause(index_predicate, table_to_read)
+        )
+        row_ids = np.fromiter(
+            (row[0] for row in self._sql_session.execute(row_id_query)),
+            dtype=np.int64,
+        )
+        # the index returns the rows ordered by the indexed column
+        row_ids.sort()
+
+        sql_columns = [col for col in columns if col.name not in embeddings]
+        select_query = select(*[table_to_read.c[col.name] for col in sql_columns])
+        if predicate is not None:
+            select_query = select_query.where(
+                predicate_to_sqlalchemy_clause(predicate, table_to_read)
+            )
+
+        batch_sizer = BatchSizer(batch_mem_size, batch_size)
+        chunk_size = 1
+        start = 0
+        while start < len(row_ids):
+            chunk = row_ids[start : start + min(chunk_size, MAX_ROW_IDS_PER_QUERY)]
+            start += len(chunk)
+            query = select_query.where(row_id.in_(chunk.tolist())).order_by(row_id)
+            rows = [
+                self._deserialize_sql_row(row._asdict(), columns, embeddings)
+                for row in self._sql_session.execute(query)
+            ]
+            for row in rows:
+                batch_sizer.add(row)
+            chunk_size = batch_sizer.rows_per_batch()
+            yield from rows
+
     def read(
-        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        columns: List[str] = None,
+        predicate: AbstractExpression = None,
+        batch_size: int = None,
+        index: IndexCatalogEntry = None,
     ) -> Iterator[Batch]:
         """
         Reads the table and return a batch iterator for the
-        tuples.
+        tuples. The table is streamed from the database, so only about one
+        batch worth of rows is held in memory at a time.
 
         Argument:
             table: table metadata object of the table to read
             batch_mem_size (int): memory size of the batch read from storage
+            columns (List[str]): names of the columns to read. All the columns
+                are read if not specified.
+            predicate (AbstractExpression): predicate on the table columns
+                evaluated by the database. Only the rows satisfying it are
+                read, and the chunks whose zone maps prove it false are
+                skipped.
+            batch_size (int): maximum number of rows in a batch
+            index (IndexCatalogEntry): index on a column of the table used to
+                find the rows satisfying the predicate instead of scanning
+                the table
         Return:
             Iterator of Batch read.
         """
         try:
             table_to_read = self._try_loading_table_via_reflection(table.name)
-            result = self._sql_session.execute(table_to_read.select()).fetchall()
-            result_iter = (
-                self._deserialize_sql_row(row._asdict(), table.columns)
-                for row in result
-            )
-            for df in rebatch(result_iter, batch_mem_size):
+            read_columns = [
+                col
+                for col in table.columns
+                if col.name != ROW_NUM_COLUMN
+                and (
+                    columns is None
+                    or col.name in columns
+                    or col.name == IDENTIFIER_COLUMN
+                )
+            ]
+            read_column_names = [col.name for col in read_columns]
+            embeddings = {
+                name: store.matrix()
+                for name, store in self._get_embedding_stores(table).items()
+                if name in read_column_names
+            }
+            index_predicate = None
+            if index is not None:
+                index_predicate = get_index_predicate(predicate, index.feat_column.name)
+            if index_predicate is not None:
+                logger.debug(f"Reading {table.name} using the index {index.name}")
+                result_iter = self._read_rows_by_index(
+                    table_to_read,
+                    batch_mem_size,
+                    read_columns,
+                    index_predicate,
+                    predicate,
+                    batch_size,
+                    embeddings,
+                )
+            else:
+                pruned_chunks, num_chunks = self._get_pruned_chunks(table, predicate)
+                if pruned_chunks:
+                    logger.debug(
+                        f"Zone maps of {table.name} skip {len(pruned_chunks)} of "
+                        f"{num_chunks} chunks"
+                    )
+                result_iter = self._read_rows(
+                    table_to_read,
+                    batch_mem_size,
+                    read_columns,
+                    predicate,
+                    batch_size,
+                    pruned_chunks,
+                    embeddings,
+                )
+            for df in rebatch(result_iter, batch_mem_size, batch_size):
                 yield Batch(pd.DataFrame(df))
         except Exception as e:
             err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
             logger.exception(err_msg)
             raise Exception(err_msg)
 
+    def read_embedding_matrix(
+        self, table: TableCatalogEntry, column_name: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reads all the values of a column stored as a matrix at once.
+
+        Argument:
+            table: table metadata object of the table to read
+            column_name (str): name of the column
+        Return:
+            Tuple[np.ndarray, np.ndarray]: the `_row_id` of the rows of the
+            table and the matrix of their values, in the same order. None if
+            the column is not stored as a matrix.
+        """
+        store = self._get_embedding_stores(table).get(column_name)
+        if store is None:
+            return None
+        try:
+            table_to_read = self._try_loading_table_via_reflection(table.name)
+            row_id = table_to_read.c[IDENTIFIER_COLUMN]
+            row_ids = np.fromiter(
+                (
+                    row[0]
+                    for row in self._sql_session.execute(
+                        select(row_id).order_by(row_id)
+                    )
+                ),
+                dtype=np.int64,
+            )
+            matrix = store.matrix()
+            if len(row_ids) == 0 or row_ids[-1] == len(row_ids):
+                # no row was deleted, the rows are a prefix of the matrix
+                return row_ids, matrix[: len(row_ids)]
+            return row_ids, matrix[row_ids - 1]
+        except Exception as e:
+            err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
     def delete(
         self, table: TableCatalogEntry, sqlalchemy_filter_clause: "ColumnElement[bool]"
     ):
@@ -16,6 +16,7 @@ from evadb.catalog.catalog_type import TableType
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.database import EvaDBDatabase
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.storage.arrow_storage_engine import ArrowStorageEngine
 from evadb.storage.document_storage_engine import DocumentStorageEngine
 from evadb.storage.image_storage_engine import ImageStorageEngine
 from evadb.storage.native_storage_engine import NativeStorageEngine
@@ -39,6 +40,21 @@ class StorageEngine:
                 TableType.NATIVE_DATA: NativeStorageEngine,
             }
 
+    @classmethod
+    def _get_structured_storage_engine(
+        cls, db: EvaDBDatabase, table: TableCatalogEntry
+    ):
+        # An existing table keeps the layout it was created with. The
+        # configuration only decides the layout of new tables.
+        if ArrowStorageEngine.exists(table):
+            return ArrowStorageEngine
+        storage = db.catalog().get_configuration_catalog_value(
+            "structured_storage_engine", "sqlite"
+        )
+        if storage == "arrow" and not SQLStorageEngine.exists(db, table):
+            return ArrowStorageEngine
+        return SQLStorageEngine
+
     @classmethod
     def factory(
         cls, db: EvaDBDatabase, table: TableCatalogEntry
@@ -46,6 +62,8 @@ class StorageEngine:
         cls._lazy_initialize_storages(db)
         if table is None:
             raise ValueError("Expected TableCatalogEntry, got None")
+        if table.table_type == TableType.STRUCTURED_DATA:
+            return cls._get_structured_storage_engine(db, table)(db)
         if table.table_type in cls.storages:
             return cls.storages[table.table_type](db)
 
@@ -12,17 +12,82 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import multiprocessing as mp
 import sys
+import traceback
 from pathlib import Path
-from typing import Iterator
+from queue import Empty
+from typing import Dict, Iterator, List, NamedTuple, Tuple
 
+import pandas as pd
+
+from evadb.catalog.catalog_type import VideoColumnName
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import ROW_NUM_COLUMN, ROW_NUM_MAGIC
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN, ROW_NUM_MAGIC
 from evadb.database import EvaDBDatabase
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.models.storage.batch import Batch
-from evadb.readers.decord_reader import DecordReader
+from evadb.readers.decord_reader import DecordReader, VideoMetadata
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
+from evadb.utils.errors import VideoDecodeError
+from evadb.utils.frame_cache import FrameCache, get_frame_cache
+
+FRAME_CACHE_DIR = "frames"
+
+# number of decoded batches each worker can queue ahead of the consumer
+DECODE_QUEUE_BATCHES_PER_WORKER = 2
+
+# seconds the consumer waits for a decoded batch before checking that the
+# worker decoding it is still running
+DECODE_QUEUE_POLL_TIMEOUT = 1.0
+
+
+class VideoFile(NamedTuple):
+    """A video of a video table, as stored in its metadata table"""
+
+    row_id: int
+    name: str
+    path: str
+    metadata: VideoMetadata
+
+
+class _DecodeError:
+    """An error raised while decoding a video in a worker process. The
+    exception may not be picklable, so its type and its traceback are sent to
+    the consumer instead of the exception itself."""
+
+    def __init__(self, error: BaseException):
+        self.error_type = type(error).__name__
+        self.traceback = traceback.format_exc()
+
+
+class _FrameCacheStats:
+    """The lookups of the frame cache of a worker process, which are added to
+    the cache of the consumer so that its logged hit rate covers them"""
+
+    def __init__(self, stats: Dict):
+        self.stats = stats
+
+
+def _decode_video(video_index: int, video: VideoFile, reader_kwargs: Dict, queue):
+    """Decodes one video in a worker process. The batches are put on the queue
+    tagged with the index of the video, followed by None once the video is
+    done. An error raised while decoding is put on the queue instead."""
+    frame_cache = reader_kwargs.get("frame_cache")
+    if frame_cache is not None:
+        # the worker exits once the video is decoded, so only the disk tier of
+        # its frame cache outlives it
+        frame_cache.fill_memory = False
+        frame_cache.reset_stats()
+    try:
+        reader = DecordReader(video.path, metadata=video.metadata, **reader_kwargs)
+        for batch in reader.read():
+            queue.put((video_index, batch))
+    except Exception as e:
+        queue.put((video_index, _DecodeError(e)))
+    if frame_cache is not None:
+        queue.put((video_index, _FrameCacheStats(frame_cache.stats())))
+    queue.put((video_index, None))
 
 
 class DecordStorageEngine(AbstractMediaStorageEngine):
@@ -38,28 +103,245 @@ class DecordStorageEngine(AbstractMediaStorageEngine):
         sampling_type: str = None,
         read_audio: bool = False,
         read_video: bool = True,
+        batch_size: int = None,
+        num_workers: int = None,
+        preserve_order: bool = None,
+        columns: List[str] = None,
+        frame_size: Tuple[int, int] = None,
     ) -> Iterator[Batch]:
+        """
+        Reads the frames of all the videos of the table.
+
+        Arguments:
+            columns (List[str]): names of the columns accessed by the query,
+                all the columns if not specified. The frames are not decoded
+                if the data column is not accessed.
+            frame_size (Tuple[int, int]): (width, height) the frames are
+                decoded at, frames larger than it are downscaled while
+                decoding. The frames are decoded at their native size if not
+                specified.
+            num_workers (int): number of processes decoding videos at the same
+                time, read from the video_decode_workers configuration if not
+                specified. The videos are decoded one after another in the
+                calling thread if it is 1.
+            preserve_order (bool): if set, the videos are returned one after
+                another in the order they were loaded, otherwise the batches of
+                the videos are returned as soon as they are decoded. The frames
+                of a video are always returned in order. Read from the
+                video_decode_preserve_order configuration if not specified.
+        """
+        if num_workers is None:
+            num_workers = self.db.catalog().get_configuration_catalog_value(
+                "video_decode_workers", 1
+            )
+        if preserve_order is None:
+            preserve_order = self.db.catalog().get_configuration_catalog_value(
+                "video_decode_preserve_order", True
+            )
+        # metadata only queries are answered from the frame index of the videos
+        read_video = (
+            read_video or columns is None or VideoColumnName.data.name in columns
+        )
+        audio_window = audio_window_overlap = None
+        if read_audio:
+            audio_window = self.db.catalog().get_configuration_catalog_value(
+                "audio_window_seconds", 0
+            )
+            audio_window_overlap = self.db.catalog().get_configuration_catalog_value(
+                "audio_window_overlap_seconds", 0
+            )
+        # increase batch size when reading audio so that
+        # the audio for the file is returned in one single batch, unless it is
+        # streamed in windows
+        if read_audio and not audio_window:
+            batch_mem_size = sys.maxsize
+            batch_size = None
+        reader_kwargs = {
+            "batch_mem_size": batch_mem_size,
+            "batch_size": batch_size,
+            "predicate": predicate,
+            "sampling_rate": sampling_rate,
+            "sampling_type": sampling_type,
+            "read_audio": read_audio,
+            "read_video": read_video,
+            "frame_cache": None,
+            "frame_size": frame_size,
+            "audio_window": audio_window,
+            "audio_window_overlap": audio_window_overlap,
+        }
+        if read_video and not read_audio:
+            reader_kwargs["frame_cache"] = self._get_frame_cache()
+
+        videos = self._get_videos(table)
+        if num_workers <= 1 or len(videos) <= 1:
+            batches = self._decode_videos(videos, reader_kwargs)
+        else:
+            batches = self._decode_videos_in_parallel(
+                videos, reader_kwargs, min(num_workers, len(videos)), preserve_order
+            )
+        for video_index, batch in batches:
+            video = videos[video_index]
+            batch.frames[table.columns[0].name] = video.row_id
+            batch.frames[table.columns[1].name] = str(video.name)
+            batch.frames[ROW_NUM_COLUMN] = (
+                video.row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
+            )
+            yield batch
+        if reader_kwargs["frame_cache"] is not None:
+            reader_kwargs["frame_cache"].log_stats()
+
+    def _get_frame_cache(self) -> FrameCache:
+        """Returns the cache of decoded frames of the process, None if it is
+        disabled in the configuration"""
+        catalog = self.db.catalog()
+        memory_size = catalog.get_configuration_catalog_value("frame_cache_size", 0)
+        disk_size = catalog.get_configuration_catalog_value("frame_cache_disk_size", 0)
+        if memory_size <= 0 and disk_size <= 0:
+            return None
+        disk_path = None
+        if disk_size > 0:
+            disk_path = str(
+                Path(catalog.get_configuration_catalog_value("cache_dir"))
+                / FRAME_CACHE_DIR
+            )
+        return get_frame_cache(memory_size, disk_path, disk_size)
+
+    def _get_videos(self, table: TableCatalogEntry) -> List[VideoFile]:
+        """Returns the videos of the table along with the metadata stored when
+        they were loaded"""
+        videos = []
         for video_files in self._rdb_handler.read(self._get_metadata_table(table), 12):
-            for _, (row_id, video_file_name, _) in video_files.iterrows():
+            for _, row in video_files.iterrows():
+                video_file_name = row["file_url"]
                 system_file_name = self._xform_file_url_to_file_name(video_file_name)
                 video_file = Path(table.file_url) / system_file_name
-                # increase batch size when reading audio so that
-                # the audio for the file is returned in one single batch
-                if read_audio:
-                    batch_mem_size = sys.maxsize
-                reader = DecordReader(
-                    str(video_file),
-                    batch_mem_size=batch_mem_size,
-                    predicate=predicate,
-                    sampling_rate=sampling_rate,
-                    sampling_type=sampling_type,
-                    read_audio=read_audio,
-                    read_video=read_video,
+                videos.append(
+                    VideoFile(
+                        row[IDENTIFIER_COLUMN],
+                        video_file_name,
+                        str(video_file),
+                        VideoMetadata.from_row(row),
+                    )
                 )
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(video_file_name)
-                    batch.frames[ROW_NUM_COLUMN] = (
-                        row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
+        return videos
+
+    def get_num_frames(
+        self, table: TableCatalogEntry, keyframes_only: bool = False
+    ) -> int:
+        """Returns the number of frames, or of key frames, of all the videos of
+        the table from their stored metadata, without opening the files. None
+        if a video was loaded without metadata."""
+        column = "keyframes" if keyframes_only else "num_frames"
+        num_frames = 0
+        for video_files in self._rdb_handler.read(
+            self._get_metadata_table(table), columns=[column]
+        ):
+            if column not in video_files.columns:
+                return None
+            for value in video_files.frames[column]:
+                if keyframes_only:
+                    if value is None:
+                        return None
+                    num_frames += len(value)
+                elif pd.isna(value):
+                    return None
+                else:
+                    num_frames += int(value)
+        return num_frames
+
+    def _decode_videos(
+        self, videos: List[VideoFile], reader_kwargs: Dict
+    ) -> Iterator[Tuple[int, Batch]]:
+        for video_index, video in enumerate(videos):
+            reader = DecordReader(video.path, metadata=video.metadata, **reader_kwargs)
+            for batch in reader.read():
+                yield video_index, batch
+
+    def _decode_videos_in_parallel(
+        self,
+        videos: List[VideoFile],
+        reader_kwargs: Dict,
+        num_workers: int,
+        preserve_order: bool,
+    ) -> Iterator[Tuple[int, Batch]]:
+        """Decodes up to `num_workers` videos at the same time, one worker
+        process per video. The decoded batches go through bounded queues, so a
+        worker stops decoding when the consumer falls behind.
+
+        If `preserve_order` is set, every video gets its own queue and the
+        queues are drained in the order of the videos. Otherwise all the
+        workers share one queue.
+
+        A VideoDecodeError is raised if decoding a video fails, or if its
+        worker exits before decoding the whole video, e.g. if it crashed or
+        was killed."""
+        # the batches are sent to the consumer through the pipes of
+        # multiprocessing queues, which are handed to the workers when they
+        # start, instead of going through a manager process
+        queues = {}
+        workers = {}
+        shared_queue = None
+        if not preserve_order:
+            shared_queue = mp.Queue(num_workers * DECODE_QUEUE_BATCHES_PER_WORKER)
+        next_video = 0
+
+        def start_next_video():
+            nonlocal next_video
+            if next_video >= len(videos):
+                return
+            queue = shared_queue
+            if preserve_order:
+                queue = mp.Queue(DECODE_QUEUE_BATCHES_PER_WORKER)
+            queues[next_video] = queue
+            worker = mp.Process(
+                target=_decode_video,
+                args=(next_video, videos[next_video], reader_kwargs, queue),
+                daemon=True,
+            )
+            worker.start()
+            workers[next_video] = worker
+            next_video += 1
+
+        try:
+            for _ in range(num_workers):
+                start_next_video()
+
+            while queues:
+                if preserve_order:
+                    video_indices = [min(queues)]
+                    queue = queues[video_indices[0]]
+                else:
+                    video_indices = list(queues)
+                    queue = shared_queue
+                # a worker flushes its queue before exiting, so the batches of
+                # a worker that exited before the get are all on the queue
+                exited = [i for i in video_indices if workers[i].exitcode is not None]
+                try:
+                    video_index, item = queue.get(timeout=DECODE_QUEUE_POLL_TIMEOUT)
+                except Empty:
+                    if exited:
+                        video = videos[exited[0]]
+                        raise VideoDecodeError(
+                            f"The worker decoding {video.path} exited with code "
+                            f"{workers[exited[0]].exitcode} before decoding the "
+                            "whole video"
+                        )
+                    continue
+                if isinstance(item, _DecodeError):
+                    raise VideoDecodeError(
+                        f"{item.error_type} while decoding "
+                        f"{videos[video_index].path}:\n{item.traceback}"
                     )
-                    yield batch
+                if isinstance(item, _FrameCacheStats):
+                    reader_kwargs["frame_cache"].merge_stats(item.stats)
+                    continue
+                if item is None:
+                    del queues[video_index]
+                    start_next_video()
+                else:
+                    yield video_index, item
+        finally:
+            for worker in workers.values():
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
@@ -0,0 +1,141 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import pandas as pd
+
+from evadb.catalog.catalog_type import ColumnType
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+
+# column types for which zone maps are maintained
+ZONE_MAP_COLUMN_TYPES = [ColumnType.INTEGER, ColumnType.FLOAT, ColumnType.TEXT]
+
+# comparison with the operands swapped, used when the constant is on the left
+_FLIPPED_COMPARISON = {
+    ExpressionType.COMPARE_EQUAL: ExpressionType.COMPARE_EQUAL,
+    ExpressionType.COMPARE_GREATER: ExpressionType.COMPARE_LESSER,
+    ExpressionType.COMPARE_LESSER: ExpressionType.COMPARE_GREATER,
+    ExpressionType.COMPARE_GEQ: ExpressionType.COMPARE_LEQ,
+    ExpressionType.COMPARE_LEQ: ExpressionType.COMPARE_GEQ,
+}
+
+
+@dataclass
+class ColumnZoneMap:
+    """Statistics of a column over a chunk of rows.
+
+    `min_value` and `max_value` are None if the chunk only holds nulls or if
+    the values of the chunk cannot be ordered.
+    """
+
+    min_value: Any = None
+    max_value: Any = None
+    null_count: int = 0
+
+
+def _to_python_value(value):
+    # numpy scalars are converted to python scalars so that they can be stored
+    # and compared with the constants of the predicate
+    return value.item() if hasattr(value, "item") else value
+
+
+def compute_column_zone_map(values: pd.Series) -> ColumnZoneMap:
+    """Computes the zone map of the values of a column in a chunk"""
+    null_count = int(values.isna().sum())
+    non_null_values = values.dropna()
+    if len(non_null_values) == 0:
+        return ColumnZoneMap(null_count=null_count)
+    try:
+        return ColumnZoneMap(
+            _to_python_value(non_null_values.min()),
+            _to_python_value(non_null_values.max()),
+            null_count,
+        )
+    except TypeError:
+        return ColumnZoneMap(null_count=null_count)
+
+
+def _comparison_may_match(
+    etype: ExpressionType, zone_map: ColumnZoneMap, value: Any, num_rows: int
+) -> bool:
+    if zone_map.min_value is None or zone_map.max_value is None:
+        # a comparison with null is never true
+        return zone_map.null_count < num_rows
+    try:
+        if etype == ExpressionType.COMPARE_EQUAL:
+            return zone_map.min_value <= value <= zone_map.max_value
+        elif etype == ExpressionType.COMPARE_GREATER:
+            return zone_map.max_value > value
+        elif etype == ExpressionType.COMPARE_LESSER:
+            return zone_map.min_value < value
+        elif etype == ExpressionType.COMPARE_GEQ:
+            return zone_map.max_value >= value
+        elif etype == ExpressionType.COMPARE_LEQ:
+            return zone_map.min_value <= value
+    except TypeError:
+        pass
+    return True
+
+
+def predicate_may_match(
+    predicate: AbstractExpression, zone_maps: Dict[str, ColumnZoneMap], num_rows: int
+) -> bool:
+    """Checks whether some rows of a chunk may satisfy the predicate.
+
+    Returns False only if the zone maps of the chunk prove that no row
+    satisfies the predicate. Predicates that cannot be checked against the
+    zone maps, like LIKE or comparisons between columns, are assumed to match.
+
+    Arguments:
+        predicate (AbstractExpression): predicate on the table columns
+        zone_maps (Dict[str, ColumnZoneMap]): zone maps of the chunk, keyed by
+            column name
+        num_rows (int): number of rows in the chunk
+
+    Returns:
+        bool: False if the chunk can be skipped
+    """
+    if predicate.etype == ExpressionType.LOGICAL_AND:
+        return all(
+            predicate_may_match(child, zone_maps, num_rows)
+            for child in predicate.children
+        )
+    if predicate.etype == ExpressionType.LOGICAL_OR:
+        return any(
+            predicate_may_match(child, zone_maps, num_rows)
+            for child in predicate.children
+        )
+    if predicate.etype not in _FLIPPED_COMPARISON:
+        return True
+
+    etype = predicate.etype
+    left, right = predicate.children
+    if isinstance(left, ConstantValueExpression) and isinstance(
+        right, TupleValueExpression
+    ):
+        etype = _FLIPPED_COMPARISON[etype]
+        left, right = right, left
+    if not (
+        isinstance(left, TupleValueExpression)
+        and isinstance(right, ConstantValueExpression)
+    ):
+        return True
+    zone_map = zone_maps.get(left.name)
+    if zone_map is None:
+        return True
+    return _comparison_may_match(etype, zone_map, right.value, num_rows)
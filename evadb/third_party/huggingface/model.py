@@ -64,7 +64,8 @@ class AudioHFModel(AbstractHFFunction):
 
     def input_formatter(self, inputs: Any):
         # if audio is being passed using decord reader, we already have the audio as numpy arrays,
-        # merge into single array and return
+        # merge into single array and return. When the audio is streamed in windows, every
+        # batch holds a single window, which is transcribed as soon as it is read
         if inputs.columns.str.contains("audio").any():
             return np.concatenate(inputs.iloc[:, 0].values)
         # else expect that the user passed an array of video file paths, get audio as numpy array
@@ -63,6 +63,18 @@ class FaissVectorStore(VectorStore):
             if row.id not in self._existing_id_set:
                 self._index.add_with_ids(embedding, np.array([row.id]))
 
+    def add_matrix(self, ids: List[int], embeddings: np.ndarray):
+        assert self._index is not None, "Please create an index before adding features."
+        ids = np.asarray(ids, dtype=np.int64)
+        embeddings = np.ascontiguousarray(
+            embeddings.reshape(len(ids), -1), dtype="float32"
+        )
+        if self._existing_id_set:
+            is_new = np.array([i not in self._existing_id_set for i in ids], dtype=bool)
+            ids, embeddings = ids[is_new], embeddings[is_new]
+        if len(ids) > 0:
+            self._index.add_with_ids(embeddings, ids)
+
     def persist(self):
         assert self._index is not None, "Please create an index before calling persist."
         import faiss
@@ -93,6 +93,15 @@ class VectorStore:
         """Add embeddings to the vector store"""
         ...
 
+    def add_matrix(self, ids: List[int], embeddings) -> None:
+        """Add a matrix of embeddings to the vector store, one row per id"""
+        self.add(
+            [
+                FeaturePayload(row_id, embedding.reshape(1, -1))
+                for row_id, embedding in zip(ids, embeddings)
+            ]
+        )
+
     def persist(self) -> None:
         """Persist index to disk"""
         return None
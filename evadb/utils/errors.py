@@ -20,6 +20,10 @@ class FunctionIODefinitionError(Exception):
     pass
 
 
+class VideoDecodeError(Exception):
+    pass
+
+
 class DatasetFileNotFoundError(Exception):
     def __init__(
         self,
@@ -0,0 +1,167 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+import numpy as np
+
+from evadb.utils.kv_cache import DiskKVCache
+from evadb.utils.logging_manager import logger
+
+
+class FrameCache:
+    """Cache of decoded video frames shared by all the queries of a process.
+
+    Frames are kept in memory up to `memory_size` bytes and the least
+    recently used ones are evicted first. If `disk_path` is set, the frames
+    are also stored on disk up to `disk_size` bytes, so that frames evicted
+    from memory, or decoded by another process, do not need to be decoded
+    again.
+
+    Frames put in the cache of a short-lived worker process are lost when it
+    exits, such workers set `fill_memory` to False to only fill the disk tier.
+
+    Args:
+        memory_size (int): bytes of frames kept in memory
+        disk_path (str, optional): directory of the on-disk cache
+        disk_size (int, optional): bytes of frames kept on disk
+    """
+
+    def __init__(self, memory_size: int, disk_path: str = None, disk_size: int = 0):
+        self._memory_size = memory_size
+        self._disk_path = disk_path
+        self._disk_size = disk_size
+        self._frames = OrderedDict()
+        self._used_size = 0
+        self._disk_cache = None
+        if disk_path is not None and disk_size > 0:
+            self._disk_cache = DiskKVCache(
+                disk_path,
+                max_cache_size=disk_size,
+                eviction_policy="least-recently-used",
+            )
+        self._lock = threading.Lock()
+        self.fill_memory = True
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __reduce__(self):
+        # worker processes resolve the cache of their own process instead of
+        # receiving a copy of the cached frames
+        return get_frame_cache, (self._memory_size, self._disk_path, self._disk_size)
+
+    @property
+    def settings(self):
+        return (self._memory_size, self._disk_path, self._disk_size)
+
+    def get(self, key: Any) -> np.ndarray:
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self.memory_hits += 1
+                return frame
+        if self._disk_cache is not None:
+            frame = self._disk_cache.get(key)
+            if frame is not None:
+                frame.flags.writeable = False
+                with self._lock:
+                    self.disk_hits += 1
+                if self.fill_memory:
+                    self._put_in_memory(key, frame)
+                return frame
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: Any, frame: np.ndarray):
+        if self.fill_memory and frame.nbytes <= self._memory_size:
+            # copy the frame so that the cache does not hold on to the whole
+            # batch the frame is a view of
+            frame = np.array(frame)
+            frame.flags.writeable = False
+            self._put_in_memory(key, frame)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, frame)
+
+    def _put_in_memory(self, key: Any, frame: np.ndarray):
+        if frame.nbytes > self._memory_size:
+            return
+        with self._lock:
+            if key in self._frames:
+                self._frames.move_to_end(key)
+                return
+            self._frames[key] = frame
+            self._used_size += frame.nbytes
+            while self._used_size > self._memory_size:
+                _, evicted = self._frames.popitem(last=False)
+                self._used_size -= evicted.nbytes
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return (self.memory_hits + self.disk_hits) / lookups
+
+    def reset_stats(self):
+        with self._lock:
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def merge_stats(self, stats: Dict):
+        """Adds the lookups counted by the cache of another process, e.g. of a
+        worker decoding a video"""
+        with self._lock:
+            self.memory_hits += stats["memory_hits"]
+            self.disk_hits += stats["disk_hits"]
+            self.misses += stats["misses"]
+
+    def stats(self) -> Dict:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "memory_size": self._used_size,
+        }
+
+    def log_stats(self):
+        logger.info(
+            "Frame cache: {:d} memory hits, {:d} disk hits, {:d} misses, "
+            "hit rate {:.2%}".format(
+                self.memory_hits, self.disk_hits, self.misses, self.hit_rate
+            )
+        )
+
+
+_frame_cache = None
+_frame_cache_lock = threading.Lock()
+
+
+def get_frame_cache(
+    memory_size: int, disk_path: str = None, disk_size: int = 0
+) -> FrameCache:
+    """Returns the frame cache of the process, created again if the settings
+    changed"""
+    global _frame_cache
+    with _frame_cache_lock:
+        settings = (memory_size, disk_path, disk_size)
+        if _frame_cache is None or _frame_cache.settings != settings:
+            _frame_cache = FrameCache(memory_size, disk_path, disk_size)
+        return _frame_cache
@@ -18,6 +18,7 @@ import inspect
 import os
 import pickle
 import shutil
+import struct
 import sys
 import uuid
 from pathlib import Path
@@ -184,22 +185,98 @@ def get_size(obj, seen=None):
     return size
 
 
-def rebatch(it: Iterator, batch_mem_size: int = 30000000) -> Iterator:
+def get_row_size(obj) -> int:
+    """Returns the memory used by the data of a row, without the overhead of
+    the python objects holding it. Numpy arrays and scalars contribute their
+    `nbytes`, strings and bytes their length and numbers 8 bytes, which is
+    what they take once the row is stored in a DataFrame.
+    """
+    if hasattr(obj, "nbytes"):
+        return obj.nbytes
+    if isinstance(obj, (str, bytes, bytearray)):
+        return len(obj)
+    if isinstance(obj, (bool, int, float)) or obj is None:
+        return 8
+    if isinstance(obj, dict):
+        return sum(get_row_size(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(get_row_size(value) for value in obj)
+    return sys.getsizeof(obj)
+
+
+class BatchSizer:
+    """Decides how many rows go in a batch.
+
+    A batch is full once it holds `batch_size` rows or once the measured size
+    of its rows reaches `batch_mem_size` bytes. The average row size is
+    re-estimated from every row added, so tables with variable sized arrays or
+    text columns are batched according to the data actually read.
+
+    Args:
+        batch_mem_size (int): the maximum batch memory size
+        batch_size (int): the maximum number of rows in a batch, not bounded
+            if not specified
+    """
+
+    def __init__(self, batch_mem_size: int = 30000000, batch_size: int = None):
+        self.batch_mem_size = batch_mem_size
+        self.batch_size = batch_size
+        self._num_rows = 0
+        self._total_row_size = 0
+        self._batch_rows = 0
+        self._batch_mem_size = 0
+
+    @property
+    def row_size(self) -> int:
+        """Average size of the rows added so far"""
+        if self._num_rows == 0:
+            return 0
+        return max(1, self._total_row_size // self._num_rows)
+
+    def rows_per_batch(self) -> int:
+        """Estimated number of rows that fit in a batch"""
+        num_rows = max(1, self.batch_mem_size // max(1, self.row_size))
+        if self.batch_size:
+            num_rows = min(num_rows, self.batch_size)
+        return num_rows
+
+    def add(self, row) -> bool:
+        """Accounts for a new row in the current batch.
+
+        Returns:
+            bool: True if the batch is full after adding the row
+        """
+        row_size = get_row_size(row)
+        self._num_rows += 1
+        self._total_row_size += row_size
+        self._batch_rows += 1
+        self._batch_mem_size += row_size
+        if (self.batch_size and self._batch_rows >= self.batch_size) or (
+            self._batch_mem_size >= self.batch_mem_size
+        ):
+            self._batch_rows = 0
+            self._batch_mem_size = 0
+            return True
+        return False
+
+
+def rebatch(
+    it: Iterator, batch_mem_size: int = 30000000, batch_size: int = None
+) -> Iterator:
     """
     Utility function to rebatch the rows
     Args:
         it (Iterator): an iterator for rows, every row is a dictionary
         batch_mem_size (int): the maximum batch memory size
+        batch_size (int): the maximum number of rows in a batch
     Yields:
         data_batch (List): a list of rows, every row is a dictionary
     """
     data_batch = []
-    row_size = None
+    batch_sizer = BatchSizer(batch_mem_size, batch_size)
     for row in it:
         data_batch.append(row)
-        if row_size is None:
-            row_size = get_size(data_batch)
-        if len(data_batch) * row_size >= batch_mem_size:
+        if batch_sizer.add(row):
             yield data_batch
             data_batch = []
     if data_batch:
@@ -259,6 +336,61 @@ class PickleSerializer(object):
         return pickle.loads(data)
 
 
+class NdArraySerializer(object):
+    """Serializer for NDARRAY cells.
+
+    Numpy arrays are encoded as a fixed header followed by the raw array buffer.
+    The header holds the magic bytes, the header length, ndim, the length of the
+    dtype string, the shape (int64 per dimension) and the dtype string, padded
+    with zeros to a 16 byte boundary. Decoding wraps the buffer with
+    `np.frombuffer`, so the returned array shares memory with the serialized
+    data and is read-only.
+
+    Values that cannot be encoded this way (object arrays, structured dtypes,
+    non-array values) fall back to pickle. Data that does not start with the
+    magic bytes, e.g. blobs written with `PickleSerializer`, is unpickled.
+    """
+
+    MAGIC = b"EVND"
+    _HEADER = struct.Struct("<4sHBB")
+    _ALIGNMENT = 16
+
+    @classmethod
+    def serialize(cls, data):
+        import numpy as np
+
+        if (
+            not isinstance(data, np.ndarray)
+            or data.dtype.hasobject
+            or data.dtype.fields is not None
+        ):
+            return PickleSerializer.serialize(data)
+
+        dtype = data.dtype.str.encode("ascii")
+        shape = struct.pack(f"<{data.ndim}q", *data.shape)
+        header_len = cls._HEADER.size + len(shape) + len(dtype)
+        header_len += -header_len % cls._ALIGNMENT
+        header = cls._HEADER.pack(cls.MAGIC, header_len, data.ndim, len(dtype))
+        header = (header + shape + dtype).ljust(header_len, b"\0")
+        buffer = np.ascontiguousarray(data).reshape(-1).view(np.uint8)
+        return header + memoryview(buffer)
+
+    @classmethod
+    def deserialize(cls, data):
+        if data[:4] != cls.MAGIC:
+            return PickleSerializer.deserialize(data)
+
+        import numpy as np
+
+        _, header_len, ndim, dtype_len = cls._HEADER.unpack_from(data)
+        shape = struct.unpack_from(f"<{ndim}q", data, cls._HEADER.size)
+        dtype_offset = cls._HEADER.size + 8 * ndim
+        dtype = np.dtype(bytes(data[dtype_offset : dtype_offset + dtype_len]).decode())
+        return np.frombuffer(
+            data, dtype=dtype, count=int(np.prod(shape)), offset=header_len
+        ).reshape(shape)
+
+
 @unique
 class EvaDBEnum(AutoEnum):
     def __str__(self):
@@ -658,6 +790,25 @@ def try_to_import_fitz():
         )
 
 
+def try_to_import_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ValueError(
+            """Could not import pyarrow python package.
+                Please install it with `pip install pyarrow`."""
+        )
+
+
+def is_pyarrow_available() -> bool:
+    try:
+        try_to_import_pyarrow()
+        return True
+    except ValueError:
+        return False
+
+
 def string_comparison_case_insensitive(string_1, string_2) -> bool:
     """
     Case insensitive string comparison for two strings which gives
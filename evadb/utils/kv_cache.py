@@ -29,13 +29,22 @@ class DiskKVCache:
             This can improve concurrent writes. The default value is 3. size limit of
             individual cache shards is the `max_cache_size` divided by the number of
             shards.
+        `eviction_policy` (str, optional): the diskcache eviction policy applied once
+            the cache is full. The default value is "least-recently-stored";
+            "least-recently-used" also updates the access time of the entries read.
     """
 
-    def __init__(self, path: str, max_cache_size: int = 2**30, shards: int = 3):
+    def __init__(
+        self,
+        path: str,
+        max_cache_size: int = 2**30,
+        shards: int = 3,
+        eviction_policy: str = "least-recently-stored",
+    ):
         # For details, see: http://www.grantjenks.com/docs/diskcache/tutorial.html#settings
         default_settings = {
             "size_limit": max_cache_size,
-            "eviction_policy": "least-recently-stored",
+            "eviction_policy": eviction_policy,
             "disk_pickle_protocol": pickle.HIGHEST_PROTOCOL,
         }
         self._path = path
@@ -47,3 +56,6 @@ class DiskKVCache:
 
     def set(self, key: Any, value: Any):
         self._cache.set(key, value)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._cache
@@ -0,0 +1,169 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import queue
+import threading
+import time
+from typing import Dict, Iterable, Iterator
+
+from evadb.utils.logging_manager import logger
+
+# seconds the producer waits on a full queue before checking if the consumer
+# stopped iterating
+PREFETCH_PUT_TIMEOUT = 0.1
+
+
+class _PrefetchEnd:
+    pass
+
+
+class _PrefetchError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class PrefetchIterator:
+    """Iterates over `iterable` in a background thread that runs up to `depth`
+    items ahead of the consumer, so that producing the next items, e.g.
+    decoding the next batches of a video, overlaps with consuming the current
+    one. Decoders release the GIL, so a thread is enough for them to run in
+    parallel with the operators.
+
+    Starvation metrics tell how to size the queue: the consumer waiting often
+    means the producer is the bottleneck, the producer waiting on a full queue
+    means the consumer is.
+
+    Args:
+        iterable (Iterable): items to prefetch
+        depth (int): maximum number of items produced ahead of the consumer
+        name (str, optional): name used when logging the metrics
+    """
+
+    def __init__(self, iterable: Iterable, depth: int, name: str = "Prefetch"):
+        assert depth > 0, "Prefetch depth must be positive"
+        self._iterable = iterable
+        self._name = name
+        self._queue = queue.Queue(maxsize=depth)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self.num_items = 0
+        # times the consumer found the queue empty and the time it waited
+        self.consumer_waits = 0
+        self.consumer_wait_time = 0.0
+        # times the producer found the queue full and the time it waited
+        self.producer_waits = 0
+        self.producer_wait_time = 0.0
+
+    def __iter__(self) -> Iterator:
+        self._thread.start()
+        try:
+            while True:
+                item = self._get()
+                if isinstance(item, _PrefetchEnd):
+                    return
+                if isinstance(item, _PrefetchError):
+                    raise item.error
+                self.num_items += 1
+                yield item
+        finally:
+            self.close()
+            self.log_stats()
+
+    def close(self):
+        """Stops the producer, the items not consumed yet are dropped"""
+        self._stopped.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _produce(self):
+        try:
+            for item in self._iterable:
+                if self._stopped.is_set() or not self._put(item):
+                    return
+            self._put(_PrefetchEnd())
+        except BaseException as e:
+            self._put(_PrefetchError(e))
+        finally:
+            # release the resources held by an unfinished generator, e.g. the
+            # decoding processes of a video table
+            if hasattr(self._iterable, "close"):
+                self._iterable.close()
+
+    def _put(self, item) -> bool:
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        self.producer_waits += 1
+        start = time.perf_counter()
+        try:
+            while not self._stopped.is_set():
+                try:
+                    self._queue.put(item, timeout=PREFETCH_PUT_TIMEOUT)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            self.producer_wait_time += time.perf_counter() - start
+
+    def _get(self):
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self.consumer_waits += 1
+        start = time.perf_counter()
+        item = self._queue.get()
+        self.consumer_wait_time += time.perf_counter() - start
+        return item
+
+    @property
+    def starvation_rate(self) -> float:
+        """Fraction of the items the consumer had to wait for"""
+        if self.num_items == 0:
+            return 0.0
+        return min(1.0, self.consumer_waits / self.num_items)
+
+    def stats(self) -> Dict:
+        return {
+            "num_items": self.num_items,
+            "consumer_waits": self.consumer_waits,
+            "consumer_wait_time": self.consumer_wait_time,
+            "producer_waits": self.producer_waits,
+            "producer_wait_time": self.producer_wait_time,
+            "starvation_rate": self.starvation_rate,
+        }
+
+    def log_stats(self):
+        logger.info(
+            "{:s}: {:d} items, consumer waited {:d} times ({:0.4f} sec), "
+            "producer waited {:d} times ({:0.4f} sec)".format(
+                self._name,
+                self.num_items,
+                self.consumer_waits,
+                self.consumer_wait_time,
+                self.producer_waits,
+                self.producer_wait_time,
+            )
+        )
+
+
+def prefetch(iterable: Iterable, depth: int, name: str = "Prefetch") -> Iterator:
+    """Returns an iterator over `iterable` that prefetches up to `depth` items
+    in a background thread, or `iterable` itself if `depth` is not positive"""
+    if not depth or depth <= 0:
+        return iterable
+    return iter(PrefetchIterator(iterable, depth, name))
@@ -0,0 +1,174 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import bisect
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+# Number of values kept in the sample that the histograms are built from
+HISTOGRAM_SAMPLE_SIZE = 30000
+# The bounds are persisted as json in the catalog, so keep them compact
+HISTOGRAM_NUM_BUCKETS = 32
+
+
+class HyperLogLog:
+    """HyperLogLog sketch estimating the number of distinct values in a stream.
+
+    https://algo.inria.fr/flajolet/Publications/FlFuGaMe07.pdf
+    The relative error is around 1.04 / sqrt(2 ** precision).
+
+    Arguments:
+        precision (int): number of hash bits used to pick the register
+    """
+
+    def __init__(self, precision: int = 14):
+        assert 4 <= precision <= 16, "precision should be between 4 and 16"
+        self._precision = precision
+        self._num_registers = 1 << precision
+        self._registers = np.zeros(self._num_registers, dtype=np.uint8)
+
+    def add(self, values: pd.Series):
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(np.uint64)
+        index = (hashes >> np.uint64(64 - self._precision)).astype(np.int64)
+        # the remaining bits, left aligned; the rank is the position of the
+        # leftmost set bit among them
+        remaining = hashes << np.uint64(self._precision)
+        high = (remaining >> np.uint64(32)).astype(np.float64)
+        low = (remaining & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        with np.errstate(divide="ignore"):
+            leading_bit = np.where(
+                high > 0, np.floor(np.log2(high)) + 32, np.floor(np.log2(low))
+            )
+        max_rank = 64 - self._precision + 1
+        rank = np.where(remaining == 0, max_rank, 64 - leading_bit)
+        rank = np.minimum(rank, max_rank).astype(np.uint8)
+        np.maximum.at(self._registers, index, rank)
+
+    def count(self) -> float:
+        m = self._num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        harmonic_sum = np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        estimate = alpha * m * m / harmonic_sum
+        num_zeros = np.count_nonzero(self._registers == 0)
+        if estimate <= 2.5 * m and num_zeros > 0:
+            # small range correction (linear counting)
+            estimate = m * np.log(m / num_zeros)
+        return float(estimate)
+
+
+class ColumnStatisticsCollector:
+    """Collects the statistics of a single column over a stream of batches.
+
+    It counts the rows and NULLs, estimates the number of distinct values with a
+    HyperLogLog sketch, and keeps a uniform random sample of the values (bottom-k
+    of random keys) to build an equi-depth histogram from.
+
+    Arguments:
+        track_distinct (bool): estimate the number of distinct values
+        track_histogram (bool): build a histogram; the values must be numeric
+        sample_size (int): size of the sample the histogram is built from
+    """
+
+    def __init__(
+        self,
+        track_distinct: bool = True,
+        track_histogram: bool = False,
+        sample_size: int = HISTOGRAM_SAMPLE_SIZE,
+    ):
+        self._num_rows = 0
+        self._num_nulls = 0
+        self._hll = HyperLogLog() if track_distinct else None
+        self._track_histogram = track_histogram
+        self._sample_size = sample_size
+        self._sample = np.empty(0, dtype=np.float64)
+        self._sample_keys = np.empty(0, dtype=np.float64)
+
+    def update(self, values: pd.Series):
+        nulls = values.isna()
+        self._num_rows += len(values)
+        self._num_nulls += int(nulls.sum())
+        values = values[~nulls]
+        if len(values) == 0:
+            return
+
+        if self._hll is not None:
+            self._hll.add(values)
+
+        if self._track_histogram:
+            keys = np.random.random_sample(len(values))
+            sample = np.concatenate([self._sample, values.to_numpy(np.float64)])
+            sample_keys = np.concatenate([self._sample_keys, keys])
+            if len(sample) > self._sample_size:
+                keep = np.argpartition(sample_keys, self._sample_size)[
+                    : self._sample_size
+                ]
+                sample, sample_keys = sample[keep], sample_keys[keep]
+            self._sample, self._sample_keys = sample, sample_keys
+
+    @property
+    def num_rows(self) -> int:
+        return self._num_rows
+
+    @property
+    def null_fraction(self) -> float:
+        if self._num_rows == 0:
+            return 0.0
+        return self._num_nulls / self._num_rows
+
+    @property
+    def num_distinct(self) -> float:
+        if self._hll is None:
+            return None
+        # the sketch can not see more distinct values than non-null rows
+        return min(self._hll.count(), float(self._num_rows - self._num_nulls))
+
+    def histogram_bounds(self, num_buckets: int = HISTOGRAM_NUM_BUCKETS) -> List:
+        """Returns num_buckets + 1 bounds, each bucket holds the same number of
+        sampled values."""
+        if len(self._sample) == 0:
+            return []
+        sample = np.sort(self._sample)
+        num_buckets = min(num_buckets, len(sample))
+        positions = np.linspace(0, len(sample) - 1, num_buckets + 1)
+        return [float(sample[int(round(pos))]) for pos in positions]
+
+
+def histogram_selectivity(bounds: List, value: float, inclusive: bool) -> float:
+    """Estimates the fraction of values less than (or equal to) value
+
+    Arguments:
+        bounds (List): bounds of an equi-depth histogram
+        value (float): constant to compare against
+        inclusive (bool): estimate `<=` instead of `<`
+    """
+    if len(bounds) < 2:
+        return None
+    if value < bounds[0] or (value == bounds[0] and not inclusive):
+        return 0.0
+    if value > bounds[-1] or (value == bounds[-1] and inclusive):
+        return 1.0
+
+    num_buckets = len(bounds) - 1
+    if inclusive:
+        bucket = bisect.bisect_right(bounds, value) - 1
+    else:
+        bucket = bisect.bisect_left(bounds, value) - 1
+    bucket = min(max(bucket, 0), num_buckets - 1)
+    low, high = bounds[bucket], bounds[bucket + 1]
+    within = (value - low) / (high - low) if high > low else 1.0
+    return min(max((bucket + within) / num_buckets, 0.0), 1.0)
@@ -106,6 +106,8 @@ notebook_libs = [
     "nest-asyncio>=1.5.6",
 ]
 
+arrow_libs = ["pyarrow>=10.0.0"]  # COLUMNAR STORAGE ENGINE
+
 qdrant_libs = ["qdrant_client"]  # cannot install on 3.11 due to grcpio
 
 pinecone_libs = ["pinecone-client"]
@@ -168,6 +170,7 @@ INSTALL_REQUIRES = minimal_requirements
 
 EXTRA_REQUIRES = {
     "ray": ray_libs,
+    "arrow": arrow_libs,
     "vision": vision_libs,
     "document": document_libs,
     "function": function_libs,
@@ -184,7 +187,7 @@ EXTRA_REQUIRES = {
     "forecasting": forecasting_libs,
     "hackernews": hackernews_libs,
     # everything except ray, qdrant, ludwig and postgres. The first three fail on pyhton 3.11.
-    "dev": dev_libs + vision_libs + document_libs + function_libs + notebook_libs + forecasting_libs + sklearn_libs + imagegen_libs + xgboost_libs
+    "dev": dev_libs + arrow_libs + vision_libs + document_libs + function_libs + notebook_libs + forecasting_libs + sklearn_libs + imagegen_libs + xgboost_libs
 }
 
 setup(
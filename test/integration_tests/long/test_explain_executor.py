@@ -85,6 +85,24 @@ class ExplainExecutorTest(unittest.TestCase):
             expected_output = """|__ ProjectPlan\n    |__ LateralJoinPlan\n        |__ SeqScanPlan\n            |__ StoragePlan\n        |__ FunctionScanPlan\n"""
             self.assertEqual(batch.frames[0][0], expected_output)
 
+    def test_explain_reports_zone_map_pruning(self):
+        execute_query_fetch_all(
+            self.evadb, "CREATE TABLE IF NOT EXISTS MyTable (id INTEGER, label TEXT);"
+        )
+        for idx in range(4):
+            execute_query_fetch_all(
+                self.evadb, f"INSERT INTO MyTable (id, label) VALUES ({idx}, 'a');"
+            )
+        batch = execute_query_fetch_all(
+            self.evadb, "EXPLAIN SELECT label FROM MyTable WHERE id > 1;"
+        )
+        expected_output = (
+            "|__ ProjectPlan\n    |__ SeqScanPlan\n"
+            "        |__ StoragePlan (zone maps skip 2 of 4 chunks)\n"
+        )
+        self.assertEqual(batch.frames[0][0], expected_output)
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyTable;")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -152,7 +152,7 @@ class LoadExecutorTests(unittest.TestCase):
         )
         self.assertEqual(result, expected)
 
-    def test_should_fail_to_load_videos_with_same_path(self):
+    def test_should_skip_loaded_videos_with_same_path(self):
         path = f"{EvaDB_ROOT_DIR}/data/sample_videos/2/*.mp4"
         query = f"""LOAD VIDEO "{path}" INTO MyVideos;"""
         result = execute_query_fetch_all(self.evadb, query)
@@ -163,21 +163,28 @@ class LoadExecutorTests(unittest.TestCase):
 
         # original file should be preserved
         expected_output = execute_query_fetch_all(
-            self.evadb, "SELECT id FROM MyVideos;"
+            self.evadb, "SELECT id FROM MyVideos WHERE _row_id = 1;"
         )
 
-        # try adding duplicate files to the table
+        # only the files that are not in the table yet are loaded
         path = f"{EvaDB_ROOT_DIR}/data/sample_videos/**/*.mp4"
         query = f"""LOAD VIDEO "{path}" INTO MyVideos;"""
-        with self.assertRaises(ExecutorError):
-            execute_query_fetch_all(self.evadb, query, do_not_print_exceptions=True)
+        result = execute_query_fetch_all(self.evadb, query)
+        expected = Batch(
+            pd.DataFrame(
+                [
+                    f"Number of loaded {FileFormatType.VIDEO.name}: 3, "
+                    "skipped unchanged: 1"
+                ]
+            )
+        )
+        self.assertEqual(result, expected)
 
         # original data should be preserved
-        after_load_fail = execute_query_fetch_all(
-            self.evadb, "SELECT id FROM MyVideos;"
+        after_load = execute_query_fetch_all(
+            self.evadb, "SELECT id FROM MyVideos WHERE _row_id = 1;"
         )
-
-        self.assertEqual(expected_output, after_load_fail)
+        self.assertEqual(expected_output, after_load)
 
     def test_should_fail_to_load_missing_video(self):
         path = f"{EvaDB_ROOT_DIR}/data/sample_videos/missing.mp4"
@@ -320,7 +327,7 @@ class LoadExecutorTests(unittest.TestCase):
             str(exc_info.exception),
         )
 
-    def test_should_fail_to_load_images_with_same_path(self):
+    def test_should_skip_loaded_images_with_same_path(self):
         image_files = glob.glob(
             os.path.expanduser(self.image_files_path), recursive=True
         )
@@ -336,17 +343,62 @@ class LoadExecutorTests(unittest.TestCase):
             self.evadb, "SELECT name FROM MyImages;"
         )
 
-        # try adding duplicate files to the table
+        # loading the same file again skips it
         query = f"""LOAD IMAGE "{image_files[0]}" INTO MyImages;"""
-        with self.assertRaises(Exception):
-            execute_query_fetch_all(self.evadb, query, do_not_print_exceptions=True)
+        result = execute_query_fetch_all(self.evadb, query)
+        expected = Batch(
+            pd.DataFrame(
+                [
+                    f"Number of loaded {FileFormatType.IMAGE.name}: 0, "
+                    "skipped unchanged: 1"
+                ]
+            )
+        )
+        self.assertEqual(result, expected)
 
         # original data should be preserved
-        after_load_fail = execute_query_fetch_all(
-            self.evadb, "SELECT name FROM MyImages;"
+        after_load = execute_query_fetch_all(self.evadb, "SELECT name FROM MyImages;")
+
+        self.assertEqual(expected_output, after_load)
+
+    def test_should_replace_changed_images(self):
+        image_files = sorted(
+            glob.glob(os.path.expanduser(self.image_files_path), recursive=True)
         )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_file = os.path.join(tmp_dir, "image.jpg")
+            shutil.copy(image_files[0], image_file)
+            query = f"""LOAD IMAGE "{image_file}" INTO MyImages;"""
+            execute_query_fetch_all(self.evadb, query)
+
+            # the file changes after it was loaded
+            shutil.copy(image_files[1], image_file)
+            stat = os.stat(image_file)
+            os.utime(image_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            with self.assertRaises(ExecutorError):
+                execute_query_fetch_all(self.evadb, query, do_not_print_exceptions=True)
 
-        self.assertEqual(expected_output, after_load_fail)
+            query = f"""LOAD IMAGE "{image_file}" REPLACE INTO MyImages;"""
+            result = execute_query_fetch_all(self.evadb, query)
+            expected = Batch(
+                pd.DataFrame([f"Number of loaded {FileFormatType.IMAGE.name}: 1"])
+            )
+            self.assertEqual(result, expected)
+
+            result = execute_query_fetch_all(self.evadb, "SELECT name FROM MyImages;")
+            self.assertEqual(len(result), 1)
+
+            # unchanged files are not replaced
+            result = execute_query_fetch_all(self.evadb, query)
+            expected = Batch(
+                pd.DataFrame(
+                    [
+                        f"Number of loaded {FileFormatType.IMAGE.name}: 0, "
+                        "skipped unchanged: 1"
+                    ]
+                )
+            )
+            self.assertEqual(result, expected)
 
     def test_should_fail_to_load_corrupt_image(self):
         # should fail on an empty file
@@ -0,0 +1,101 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.util import create_sample_video, file_remove, get_evadb_for_testing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evadb.models.storage.batch import Batch
+from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.storage_engine import StorageEngine
+
+
+@pytest.mark.notparallel
+class AnalyzeExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        # reset the catalog manager before running each test
+        self.evadb.catalog().reset()
+        execute_query_fetch_all(
+            self.evadb,
+            """CREATE TABLE IF NOT EXISTS AnalyzeTable (
+                   id INTEGER,
+                   name TEXT(10),
+                   score FLOAT(5, 2)
+               );""",
+        )
+        scores = np.arange(1000, dtype=float)
+        scores[::4] = np.nan
+        table = self.evadb.catalog().get_table_catalog_entry("AnalyzeTable")
+        StorageEngine.factory(self.evadb, table).write(
+            table,
+            Batch(
+                pd.DataFrame(
+                    {
+                        "id": np.arange(1000),
+                        "name": [f"name_{i % 10}" for i in range(1000)],
+                        "score": scores,
+                    }
+                )
+            ),
+        )
+
+    def tearDown(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS AnalyzeTable;")
+
+    def _get_statistics(self, column_name):
+        table = self.evadb.catalog().get_table_catalog_entry("AnalyzeTable")
+        column = self.evadb.catalog().get_column_catalog_entry(table, column_name)
+        return self.evadb.catalog().get_column_statistics_catalog_entry(column)
+
+    def test_should_collect_column_statistics(self):
+        self.assertIsNone(self._get_statistics("id"))
+        execute_query_fetch_all(self.evadb, "ANALYZE TABLE AnalyzeTable;")
+
+        id_stats = self._get_statistics("id")
+        self.assertEqual(id_stats.num_rows, 1000)
+        self.assertEqual(id_stats.null_fraction, 0.0)
+        self.assertAlmostEqual(id_stats.num_distinct, 1000, delta=50)
+        self.assertEqual(id_stats.histogram_bounds[0], 0)
+        self.assertEqual(id_stats.histogram_bounds[-1], 999)
+
+        name_stats = self._get_statistics("name")
+        self.assertAlmostEqual(name_stats.num_distinct, 10, delta=1)
+        self.assertEqual(name_stats.histogram_bounds, [])
+
+        score_stats = self._get_statistics("score")
+        self.assertEqual(score_stats.null_fraction, 0.25)
+
+        # statistics are replaced when the table is analyzed again
+        execute_query_fetch_all(self.evadb, "DELETE FROM AnalyzeTable WHERE id < 500;")
+        execute_query_fetch_all(self.evadb, "ANALYZE TABLE AnalyzeTable;")
+        self.assertEqual(self._get_statistics("id").num_rows, 500)
+
+        batch = execute_query_fetch_all(
+            self.evadb, "SELECT id FROM AnalyzeTable WHERE id >= 990;"
+        )
+        self.assertEqual(len(batch), 10)
+
+    def test_should_fail_to_analyze_video_table(self):
+        video_file_path = create_sample_video()
+        execute_query_fetch_all(
+            self.evadb, f"LOAD VIDEO '{video_file_path}' INTO MyVideo;"
+        )
+        with self.assertRaises(Exception):
+            execute_query_fetch_all(self.evadb, "ANALYZE TABLE MyVideo;")
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyVideo;")
+        file_remove("dummy.avi")
@@ -64,6 +64,7 @@ class StatementBinderTests(unittest.TestCase):
             binder = StatementBinder(StatementBinderContext(catalog))
             tableref = MagicMock()
             tableref.is_table_atom.return_value = True
+            tableref.frame_size = None
             binder._bind_tableref(tableref)
             mock.assert_called_with(
                 tableref.alias.alias_name,
@@ -55,4 +55,37 @@ class BatchMemSizeTest(unittest.TestCase):
         with patch.object(SQLStorageEngine, "read") as mock_read:
             mock_read.__iter__.return_value = []
             execute_query_fetch_all(self.evadb, select_table_query)
-            mock_read.assert_called_with(ANY, test_batch_mem_size)
+            mock_read.assert_called_with(
+                ANY,
+                test_batch_mem_size,
+                columns=ANY,
+                predicate=None,
+                batch_size=None,
+            )
+
+    def test_batch_size_for_sqlite_storage_engine(self):
+        """
+            This testcase make sure that the `batch_size` is correctly passed to
+        the storage engine.
+        """
+        test_batch_size = 10
+        execute_query_fetch_all(self.evadb, f"SET batch_size={test_batch_size}")
+        create_table_query = """
+            CREATE TABLE IF NOT EXISTS MyCSV (
+                id INTEGER UNIQUE,
+                label TEXT(30)
+            );"""
+        execute_query_fetch_all(self.evadb, create_table_query)
+
+        select_table_query = "SELECT * FROM MyCSV;"
+        with patch.object(SQLStorageEngine, "read") as mock_read:
+            mock_read.__iter__.return_value = []
+            execute_query_fetch_all(self.evadb, select_table_query)
+            mock_read.assert_called_with(
+                ANY,
+                ANY,
+                columns=ANY,
+                predicate=None,
+                batch_size=test_batch_size,
+            )
+        self.evadb.catalog().upsert_configuration_catalog_entry("batch_size", None)
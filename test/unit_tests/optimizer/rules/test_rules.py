@@ -18,8 +18,15 @@ from test.util import create_sample_video, get_evadb_for_testing
 import pytest
 from mock import MagicMock, patch
 
-from evadb.catalog.catalog_type import TableType
+from evadb.catalog.catalog_type import ColumnType, TableType, VectorStoreType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.models.utils import IndexCatalogEntry
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.optimizer.operators import (
     LogicalFilter,
     LogicalGet,
@@ -32,7 +39,9 @@ from evadb.optimizer.rules.rules import (
     CacheFunctionExpressionInProject,
     CombineSimilarityOrderByAndLimitToVectorIndexScan,
     EmbedFilterIntoGet,
+    EmbedIndexIntoGet,
     EmbedSampleIntoGet,
+    LogicalAnalyzeToPhysical,
     LogicalApplyAndMergeToPhysical,
     LogicalApplyAndMergeToRayPhysical,
     LogicalCreateFromSelectToPhysical,
@@ -74,6 +83,7 @@ from evadb.optimizer.rules.rules import (
     XformLateralJoinToLinearFlow,
 )
 from evadb.optimizer.rules.rules_manager import RulesManager, disable_rules
+from evadb.parser.alias import Alias
 from evadb.parser.types import JoinType
 from evadb.server.command_handler import execute_query_fetch_all
 from evadb.utils.generic_utils import is_ray_enabled_and_installed
@@ -100,6 +110,7 @@ class RulesTest(unittest.TestCase):
             Promise.LOGICAL_INNER_JOIN_COMMUTATIVITY,
             Promise.EMBED_FILTER_INTO_GET,
             Promise.EMBED_SAMPLE_INTO_GET,
+            Promise.EMBED_INDEX_INTO_GET,
             Promise.XFORM_LATERAL_JOIN_TO_LINEAR_FLOW,
             Promise.PUSHDOWN_FILTER_THROUGH_JOIN,
             Promise.PUSHDOWN_FILTER_THROUGH_APPLY_AND_MERGE,
@@ -121,6 +132,7 @@ class RulesTest(unittest.TestCase):
             Promise.LOGICAL_INSERT_TO_PHYSICAL,
             Promise.LOGICAL_DELETE_TO_PHYSICAL,
             Promise.LOGICAL_RENAME_TO_PHYSICAL,
+            Promise.LOGICAL_ANALYZE_TO_PHYSICAL,
             Promise.LOGICAL_DROP_OBJECT_TO_PHYSICAL,
             Promise.LOGICAL_LOAD_TO_PHYSICAL,
             Promise.LOGICAL_CREATE_TO_PHYSICAL,
@@ -160,6 +172,7 @@ class RulesTest(unittest.TestCase):
             EmbedFilterIntoGet(),
             #    EmbedFilterIntoDerivedGet(),
             EmbedSampleIntoGet(),
+            EmbedIndexIntoGet(),
             XformLateralJoinToLinearFlow(),
             PushDownFilterThroughApplyAndMerge(),
             PushDownFilterThroughJoin(),
@@ -207,6 +220,7 @@ class RulesTest(unittest.TestCase):
             LogicalCreateToPhysical(),
             LogicalCreateFromSelectToPhysical(),
             LogicalRenameToPhysical(),
+            LogicalAnalyzeToPhysical(),
             LogicalCreateFunctionToPhysical(),
             LogicalCreateFunctionFromSelectToPhysical(),
             LogicalDropObjectToPhysical(),
@@ -264,6 +278,98 @@ class RulesTest(unittest.TestCase):
         self.assertFalse(rewrite_opr is logi_get)
         self.assertEqual(rewrite_opr.predicate, predicate)
 
+    def test_embed_seconds_filter_into_video_get(self):
+        def column(name):
+            return TupleValueExpression(
+                name, table_alias="myvideo", col_alias=f"myvideo.{name}"
+            )
+
+        rule = EmbedFilterIntoGet()
+        seconds_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GEQ, column("seconds"), ConstantValueExpression(120)
+        )
+        label_pred = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            column("label"),
+            ConstantValueExpression("car"),
+        )
+        id_pred = ComparisonExpression(
+            ExpressionType.COMPARE_LESSER, column("id"), ConstantValueExpression(100)
+        )
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            LogicalExpression(ExpressionType.LOGICAL_AND, seconds_pred, label_pred),
+            id_pred,
+        )
+        video = MagicMock(alias=Alias("myvideo"), get_audio=False)
+        logi_get = LogicalGet(video, MagicMock(), MagicMock())
+        logi_filter = LogicalFilter(predicate, [logi_get])
+
+        rewrite_opr = next(rule.apply(logi_filter, MagicMock()))
+        self.assertIsInstance(rewrite_opr, LogicalFilter)
+        self.assertEqual(rewrite_opr.predicate, label_pred)
+        self.assertEqual(
+            rewrite_opr.children[0].predicate,
+            LogicalExpression(ExpressionType.LOGICAL_AND, id_pred, seconds_pred),
+        )
+
+        # timestamps of audio frames are not stored
+        video.get_audio = True
+        rewrite_opr = next(rule.apply(logi_filter, MagicMock()))
+        self.assertEqual(rewrite_opr.children[0].predicate, id_pred)
+
+    def test_embed_index_into_get_prefers_equality_lookup(self):
+        rule = EmbedIndexIntoGet()
+        id_column = ColumnCatalogEntry("id", ColumnType.INTEGER)
+        name_column = ColumnCatalogEntry("name", ColumnType.TEXT)
+        table_obj = TableCatalogEntry(
+            name="foo",
+            table_type=TableType.STRUCTURED_DATA,
+            file_url=MagicMock(),
+            columns=[id_column, name_column],
+        )
+        id_index = IndexCatalogEntry(
+            "id_index", "", VectorStoreType.BTREE, feat_column=id_column
+        )
+        name_index = IndexCatalogEntry(
+            "name_index", "", VectorStoreType.BTREE, feat_column=name_column
+        )
+        context = MagicMock()
+        context.db.catalog().get_all_index_catalog_entries.return_value = [
+            id_index,
+            name_index,
+        ]
+
+        id_range = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression(name="id"),
+            ConstantValueExpression(5),
+        )
+        name_lookup = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            ConstantValueExpression("a", ColumnType.TEXT),
+            TupleValueExpression(name="name"),
+        )
+        logi_get = LogicalGet(
+            MagicMock(),
+            table_obj,
+            MagicMock(),
+            predicate=LogicalExpression(
+                ExpressionType.LOGICAL_AND, id_range, name_lookup
+            ),
+        )
+        self.assertTrue(rule.check(logi_get, context))
+        rewrite_opr = next(rule.apply(logi_get, context))
+        self.assertEqual(rewrite_opr.index, name_index)
+        self.assertFalse(rule.check(rewrite_opr, context))
+
+        # the index cannot be used if the predicate does not restrict the column
+        logi_get = LogicalGet(MagicMock(), table_obj, MagicMock(), predicate=id_range)
+        context.db.catalog().get_all_index_catalog_entries.return_value = [
+            name_index
+        ]
+        self.assertEqual(list(rule.apply(logi_get, context)), [])
+
     def test_embed_sample_into_get_does_not_work_with_structured_data(self):
         rule = EmbedSampleIntoGet()
 
@@ -0,0 +1,120 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from mock import MagicMock
+
+from evadb.catalog.catalog_type import ColumnType, TableType
+from evadb.catalog.models.utils import (
+    ColumnCatalogEntry,
+    ColumnStatisticsCatalogEntry,
+    TableCatalogEntry,
+)
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.optimizer.cardinality_estimator import (
+    DEFAULT_EQUALITY_SELECTIVITY,
+    CardinalityEstimator,
+)
+from evadb.optimizer.cost_model import CostModel
+from evadb.optimizer.operators import LogicalGet, LogicalJoin
+from evadb.optimizer.optimizer_context import OptimizerContext
+from evadb.parser.types import JoinType
+
+
+class CardinalityEstimatorTest(unittest.TestCase):
+    def setUp(self):
+        self.statistics = {}
+        self.db = MagicMock()
+        self.db.catalog().get_column_statistics_catalog_entry.side_effect = (
+            lambda column: self.statistics.get(column.row_id)
+        )
+        self.context = OptimizerContext(self.db, CostModel())
+        self.row_id = 0
+
+    def _create_table(self, name, num_rows, column_stats):
+        columns = []
+        for column_name, stats in [("_row_id", (None, []))] + column_stats:
+            self.row_id += 1
+            columns.append(
+                ColumnCatalogEntry(column_name, ColumnType.INTEGER, row_id=self.row_id)
+            )
+            if num_rows is not None:
+                num_distinct, bounds = stats
+                self.statistics[self.row_id] = ColumnStatisticsCatalogEntry(
+                    self.row_id, num_rows, 0.0, num_distinct, bounds
+                )
+        return TableCatalogEntry(
+            name, "", TableType.STRUCTURED_DATA, columns=columns, row_id=self.row_id
+        )
+
+    def _column(self, table, name):
+        column = [col for col in table.columns if col.name == name][0]
+        return TupleValueExpression(name, table.name, col_object=column)
+
+    def test_should_estimate_filter_selectivity(self):
+        table = self._create_table(
+            "t", 1000, [("a", (100, [])), ("b", (1000, [0.0, 250.0, 500.0, 1000.0]))]
+        )
+        estimator = CardinalityEstimator(self.context)
+        equal = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            self._column(table, "a"),
+            ConstantValueExpression(5),
+        )
+        self.assertAlmostEqual(estimator.selectivity(equal), 0.01)
+
+        # constant on the left hand side: 250 >= b
+        range_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GEQ,
+            ConstantValueExpression(250),
+            self._column(table, "b"),
+        )
+        self.assertAlmostEqual(estimator.selectivity(range_pred), 1 / 3)
+
+        conjunction = LogicalExpression(ExpressionType.LOGICAL_AND, equal, range_pred)
+        self.assertAlmostEqual(estimator.selectivity(conjunction), 0.01 / 3)
+        get = LogicalGet(MagicMock(), table, "t", predicate=conjunction)
+        expr = self.context.add_opr_to_group(get)
+        self.assertAlmostEqual(estimator.group_cardinality(expr.group_id), 10 / 3)
+
+        # columns without statistics fall back to the defaults
+        unknown = self._create_table("u", None, [("a", None)])
+        self.assertIsNone(estimator.table_cardinality(unknown))
+        equal = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            self._column(unknown, "a"),
+            ConstantValueExpression(5),
+        )
+        self.assertEqual(estimator.selectivity(equal), DEFAULT_EQUALITY_SELECTIVITY)
+
+    def test_should_estimate_equi_join_cardinality(self):
+        orders = self._create_table("orders", 10000, [("customer", (500, []))])
+        customers = self._create_table("customers", 1000, [("id", (1000, []))])
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            self._column(orders, "customer"),
+            self._column(customers, "id"),
+        )
+        join = LogicalJoin(JoinType.INNER_JOIN, predicate)
+        join.append_child(LogicalGet(MagicMock(), orders, "orders"))
+        join.append_child(LogicalGet(MagicMock(), customers, "customers"))
+        expr = self.context.add_opr_to_group(join)
+
+        estimator = CardinalityEstimator(self.context)
+        self.assertAlmostEqual(estimator.group_cardinality(expr.group_id), 10000)
@@ -15,7 +15,17 @@
 import unittest
 
 from evadb.catalog.catalog_type import ColumnType, NdArrayType
-from evadb.optimizer.optimizer_utils import column_definition_to_function_io
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.expression_utils import to_conjunction_list
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.optimizer.optimizer_utils import (
+    column_definition_to_function_io,
+    extract_storage_pushdown_predicate,
+)
 from evadb.parser.create_statement import ColumnDefinition
 
 
@@ -45,3 +55,58 @@ class OptimizerUtilsTest(unittest.TestCase):
             self.assertEqual(io.array_dimensions, (None, None, None))
             self.assertEqual(io.is_input, True)
             self.assertEqual(io.function_id, None)
+
+    def test_extract_storage_pushdown_predicate(self):
+        def _column(name, col_type):
+            return TupleValueExpression(
+                name=name,
+                table_alias="t",
+                col_object=ColumnCatalogEntry(name, col_type),
+            )
+
+        id_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            ConstantValueExpression(5),
+            _column("id", ColumnType.INTEGER),
+        )
+        like_pred = ComparisonExpression(
+            ExpressionType.COMPARE_LIKE,
+            _column("name", ColumnType.TEXT),
+            ConstantValueExpression("a.*"),
+        )
+        neq_pred = ComparisonExpression(
+            ExpressionType.COMPARE_NEQ,
+            _column("id", ColumnType.INTEGER),
+            ConstantValueExpression(2),
+        )
+        # comparing a TEXT column with a number is left to the executor
+        type_mismatch_pred = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            _column("name", ColumnType.TEXT),
+            ConstantValueExpression(1),
+        )
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            LogicalExpression(ExpressionType.LOGICAL_AND, id_pred, like_pred),
+            LogicalExpression(ExpressionType.LOGICAL_AND, neq_pred, type_mismatch_pred),
+        )
+
+        pushdown_pred, rem_pred = extract_storage_pushdown_predicate(predicate, "t")
+        self.assertEqual(
+            pushdown_pred,
+            LogicalExpression(ExpressionType.LOGICAL_AND, id_pred, like_pred),
+        )
+        # LIKE is evaluated by the storage engine and again by the executor
+        self.assertEqual(
+            rem_pred,
+            LogicalExpression(
+                ExpressionType.LOGICAL_AND,
+                LogicalExpression(ExpressionType.LOGICAL_AND, like_pred, neq_pred),
+                type_mismatch_pred,
+            ),
+        )
+
+        pushdown_pred, rem_pred = extract_storage_pushdown_predicate(predicate, "u")
+        self.assertIsNone(pushdown_pred)
+        self.assertEqual(to_conjunction_list(rem_pred), to_conjunction_list(predicate))
+        self.assertEqual(extract_storage_pushdown_predicate(None, "t"), (None, None))
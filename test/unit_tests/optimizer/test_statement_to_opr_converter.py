@@ -18,8 +18,13 @@ from test.util import get_all_subclasses
 
 from mock import MagicMock, patch
 
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.optimizer.operators import (
     Dummy,
+    LogicalAnalyze,
     LogicalApplyAndMerge,
     LogicalCreate,
     LogicalCreateFunction,
@@ -48,6 +53,7 @@ from evadb.optimizer.operators import (
     Operator,
 )
 from evadb.optimizer.statement_to_opr_converter import StatementToPlanConverter
+from evadb.parser.alias import Alias
 from evadb.parser.create_function_statement import CreateFunctionStatement
 from evadb.parser.create_index_statement import CreateIndexStatement
 from evadb.parser.create_statement import CreateTableStatement
@@ -63,15 +69,18 @@ class StatementToOprTest(unittest.TestCase):
     @patch("evadb.optimizer.statement_to_opr_converter.LogicalGet")
     def test_visit_table_ref_should_create_logical_get_opr(self, mock_lget):
         converter = StatementToPlanConverter()
-        table_ref = MagicMock(spec=TableRef, alias="alias", chunk_params={})
+        table_ref = MagicMock(spec=TableRef, alias=Alias("alias"), chunk_params={})
         table_ref.is_select.return_value = False
         table_ref.sample_freq = None
+        table_ref.frame_size = None
         converter.visit_table_ref(table_ref)
         mock_lget.assert_called_with(
             table_ref,
             table_ref.table.table_obj,
-            "alias",
+            Alias("alias"),
             chunk_params=table_ref.chunk_params,
+            columns=None,
+            frame_size=None,
         )
         self.assertEqual(mock_lget.return_value, converter._plan)
 
@@ -278,6 +287,42 @@ statement_to_opr_converter.metadata_definition_to_function_metadata"
         mock.assert_called_once()
         mock.assert_called_with(stmt)
 
+    def test_should_derive_frame_size_from_function_inputs(self):
+        def data_column():
+            return TupleValueExpression(
+                name="data",
+                table_alias="myvideo",
+                col_object=ColumnCatalogEntry("data", ColumnType.NDARRAY),
+            )
+
+        def function(dimensions):
+            func_expr = FunctionExpression(None, name="Detector")
+            func_expr.function_obj = MagicMock(
+                args=[MagicMock(is_input=True, array_dimensions=dimensions)]
+            )
+            func_expr.append_child(data_column())
+            return func_expr
+
+        converter = StatementToPlanConverter()
+        stmt = SelectStatement([function((1, 3, 540, 960))])
+        self.assertEqual(
+            converter._get_input_frame_sizes(stmt), {"myvideo": (960, 540)}
+        )
+        stmt = SelectStatement([function((540, 960, 3)), function((1, 3, 540, 960))])
+        self.assertEqual(
+            converter._get_input_frame_sizes(stmt), {"myvideo": (960, 540)}
+        )
+
+        # the frames are decoded at their native size if the functions disagree,
+        # do not declare a fixed size, or the frames are also used directly
+        for target_list in [
+            [function((1, 3, 540, 960)), function((1, 3, 224, 224))],
+            [function((None, None, 3))],
+            [function((1, 3, 540, 960)), data_column()],
+        ]:
+            stmt = SelectStatement(target_list)
+            self.assertEqual(converter._get_input_frame_sizes(stmt), {"myvideo": None})
+
     def test_inequality_in_operator(self):
         dummy_plan = Dummy(MagicMock(), MagicMock())
         object = MagicMock()
@@ -307,6 +352,7 @@ statement_to_opr_converter.metadata_definition_to_function_metadata"
         load_plan = LogicalLoadData(MagicMock(), MagicMock(), MagicMock(), MagicMock())
         limit_plan = LogicalLimit(MagicMock())
         rename_plan = LogicalRename(MagicMock(), MagicMock())
+        analyze_plan = LogicalAnalyze(MagicMock())
 
         explain_plan = LogicalExplain([MagicMock()])
         exchange_plan = LogicalExchange(MagicMock())
@@ -341,6 +387,7 @@ statement_to_opr_converter.metadata_definition_to_function_metadata"
         plans.append(load_plan)
         plans.append(limit_plan)
         plans.append(rename_plan)
+        plans.append(analyze_plan)
         plans.append(drop_plan)
         plans.append(get_plan)
         plans.append(sample_plan)
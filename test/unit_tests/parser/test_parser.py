@@ -24,6 +24,7 @@ from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.logical_expression import LogicalExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.alias import Alias
+from evadb.parser.analyze_statement import AnalyzeTableStatement
 from evadb.parser.create_function_statement import CreateFunctionStatement
 from evadb.parser.create_index_statement import CreateIndexStatement
 from evadb.parser.create_statement import (
@@ -170,6 +171,23 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(actual_stmt, expected_stmt)
         self.assertEqual(actual_stmt.index_def, create_index_query)
 
+        # create scalar index
+        create_index_query = "CREATE INDEX testindex ON MyTable (id) USING BTREE;"
+        evadb_stmt_list = parser.parse(create_index_query)
+        expected_stmt = CreateIndexStatement(
+            "testindex",
+            False,
+            TableRef(TableInfo("MyTable")),
+            [
+                ColumnDefinition("id", None, None, None),
+            ],
+            VectorStoreType.BTREE,
+            [TupleValueExpression(name="id")],
+        )
+        actual_stmt = evadb_stmt_list[0]
+        self.assertEqual(actual_stmt, expected_stmt)
+        self.assertEqual(actual_stmt.index_def, create_index_query)
+
     @unittest.skip("Skip parser exception handling testcase, moved to binder")
     def test_create_index_exception_statement(self):
         parser = Parser()
@@ -367,6 +385,22 @@ class ParserTests(unittest.TestCase):
         rename_stmt = evadb_statement_list[0]
         self.assertEqual(rename_stmt, expected_stmt)
 
+    def test_analyze_table_statement(self):
+        parser = Parser()
+        analyze_query = "ANALYZE TABLE student"
+        expected_stmt = AnalyzeTableStatement(TableRef(TableInfo("student")))
+        evadb_statement_list = parser.parse(analyze_query)
+        self.assertIsInstance(evadb_statement_list, list)
+        self.assertEqual(len(evadb_statement_list), 1)
+        self.assertEqual(evadb_statement_list[0].stmt_type, StatementType.ANALYZE)
+        self.assertEqual(evadb_statement_list[0], expected_stmt)
+        self.assertEqual(str(expected_stmt), "ANALYZE TABLE student")
+
+        # the TABLE keyword is optional
+        evadb_statement_list = parser.parse("ANALYZE student;")
+        self.assertEqual(len(evadb_statement_list), 1)
+        self.assertEqual(evadb_statement_list[0], expected_stmt)
+
     def test_drop_table_statement(self):
         parser = Parser()
         drop_queries = "DROP TABLE student_info"
@@ -603,6 +637,36 @@ class ParserTests(unittest.TestCase):
             parser.parse(select_query)
         self.assertEqual(str(cm.exception), "Unsupported logical operator: XOR")
 
+    def test_select_statement_where_in_class(self):
+        parser = Parser()
+        select_query = "SELECT CLASS FROM TAIPAI WHERE CLASS IN ('VAN', 'CAR', 'BUS');"
+        where_clause = parser.parse(select_query)[0].where_clause
+
+        def _equal(value):
+            return ComparisonExpression(
+                ExpressionType.COMPARE_EQUAL,
+                TupleValueExpression("CLASS"),
+                ConstantValueExpression(value, ColumnType.TEXT),
+            )
+
+        expected = LogicalExpression(
+            ExpressionType.LOGICAL_OR,
+            _equal("VAN"),
+            LogicalExpression(ExpressionType.LOGICAL_OR, _equal("CAR"), _equal("BUS")),
+        )
+        self.assertEqual(where_clause, expected)
+
+        select_query = "SELECT CLASS FROM TAIPAI WHERE CLASS NOT IN ('VAN');"
+        where_clause = parser.parse(select_query)[0].where_clause
+        self.assertEqual(
+            where_clause,
+            LogicalExpression(ExpressionType.LOGICAL_NOT, _equal("VAN"), None),
+        )
+
+        select_query = "SELECT CLASS FROM TAIPAI WHERE CLASS IN (SELECT CLASS FROM T);"
+        with self.assertRaises(NotImplementedError):
+            parser.parse(select_query)
+
     def test_select_statement_groupby_class(self):
         """Testing sample frequency"""
 
@@ -746,6 +810,33 @@ class ParserTests(unittest.TestCase):
         # sample_freq
         self.assertEqual(select_stmt.from_table.sample_freq, ConstantValueExpression(5))
 
+    def test_select_statement_sample_diff_class(self):
+        parser = Parser()
+
+        select_query = "SELECT id, data FROM MyVideo SAMPLE DIFF 10;"
+        select_stmt = parser.parse(select_query)[0]
+        self.assertEqual(select_stmt.from_table.sample_type.value, "DIFF")
+        self.assertEqual(
+            select_stmt.from_table.sample_freq, ConstantValueExpression(10)
+        )
+
+    def test_select_statement_resize_class(self):
+        parser = Parser()
+
+        select_query = "SELECT id, data FROM MyVideo SAMPLE 5 RESIZE 320 240;"
+        select_stmt = parser.parse(select_query)[0]
+        self.assertEqual(select_stmt.from_table.table.table_name, "MyVideo")
+        self.assertEqual(select_stmt.from_table.sample_freq, ConstantValueExpression(5))
+        self.assertEqual(select_stmt.from_table.frame_size, (320, 240))
+
+        select_query = "SELECT id, data FROM MyVideo RESIZE 320 240;"
+        select_stmt = parser.parse(select_query)[0]
+        self.assertEqual(select_stmt.from_table.frame_size, (320, 240))
+        self.assertIsNone(select_stmt.from_table.sample_freq)
+
+        select_stmt = parser.parse("SELECT id, data FROM MyVideo;")[0]
+        self.assertIsNone(select_stmt.from_table.frame_size)
+
     def test_select_function_star(self):
         parser = Parser()
 
@@ -1018,6 +1109,18 @@ class ParserTests(unittest.TestCase):
         load_data_stmt = evadb_statement_list[0]
         self.assertEqual(load_data_stmt, expected_stmt)
 
+    def test_load_video_data_statement_with_replace(self):
+        parser = Parser()
+        load_data_query = """LOAD VIDEO 'data/*.mp4' REPLACE INTO MyVideo;"""
+        expected_stmt = LoadDataStatement(
+            TableInfo("MyVideo"),
+            Path("data/*.mp4"),
+            None,
+            {"file_format": FileFormatType.VIDEO, "replace": True},
+        )
+        evadb_statement_list = parser.parse(load_data_query)
+        self.assertEqual(evadb_statement_list[0], expected_stmt)
+
     def test_load_csv_data_statement(self):
         parser = Parser()
         load_data_query = """LOAD CSV 'data/meta.csv'
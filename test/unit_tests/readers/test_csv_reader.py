@@ -12,9 +12,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 import unittest
-from test.util import create_dummy_csv_batches, create_sample_csv, file_remove
+from test.util import (
+    create_dummy_csv_batches,
+    create_sample_csv,
+    file_remove,
+    get_tmp_dir,
+)
 
+import numpy as np
+import pandas as pd
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.readers.csv_reader import CSVReader
 
@@ -47,3 +58,59 @@ class CSVLoaderTest(unittest.TestCase):
 
         # assert batches are equal
         self.assertEqual(batches, expected)
+
+    def test_should_parse_ndarray_columns_in_batches(self):
+        bbox_column = ColumnCatalogEntry(
+            "bbox", ColumnType.NDARRAY, False, NdArrayType.FLOAT32, [4]
+        )
+        column_list = [
+            TupleValueExpression(name="id", table_alias="dummy"),
+            TupleValueExpression(
+                name="bbox", table_alias="dummy", col_object=bbox_column
+            ),
+        ]
+        csv_loader = CSVReader(
+            file_url=self.csv_file_path, column_list=column_list, batch_size=7
+        )
+        batches = list(csv_loader.read())
+        expected = list(create_dummy_csv_batches(target_columns=["id", "bbox"]))[0]
+
+        self.assertEqual(len(batches), -(-len(expected) // 7))
+        actual = pd.concat([batch.frames for batch in batches])
+        self.assertEqual(list(actual["id"]), list(expected.frames["id"]))
+        for bbox, expected_bbox in zip(actual["bbox"], expected.frames["bbox"]):
+            self.assertEqual(bbox.dtype, np.float32)
+            self.assertTrue(np.array_equal(bbox, expected_bbox))
+
+    def test_should_read_columns_with_their_catalog_types(self):
+        # the first blocks of the file only hold whole numbers in the float
+        # column
+        csv_file_path = os.path.join(get_tmp_dir(), "dummy_types.csv")
+        values = list(range(1000)) + [2.5]
+        with open(csv_file_path, "w") as csv_file:
+            csv_file.write("id,score,flag\n")
+            for i, value in enumerate(values):
+                csv_file.write(f"{i},{value},{i % 2 == 0}\n")
+        column_list = [
+            TupleValueExpression(
+                name=name,
+                table_alias="dummy",
+                col_object=ColumnCatalogEntry(name, column_type),
+            )
+            for name, column_type in [
+                ("id", ColumnType.INTEGER),
+                ("score", ColumnType.FLOAT),
+                ("flag", ColumnType.BOOLEAN),
+            ]
+        ]
+        csv_loader = CSVReader(
+            file_url=csv_file_path, column_list=column_list, batch_mem_size=1024
+        )
+        batches = list(csv_loader.read())
+        file_remove("dummy_types.csv")
+
+        self.assertGreater(len(batches), 1)
+        actual = pd.concat([batch.frames for batch in batches])
+        self.assertEqual(list(actual["score"]), values)
+        self.assertEqual(list(actual["id"]), list(range(len(values))))
+        self.assertEqual(actual["flag"].dtype, bool)
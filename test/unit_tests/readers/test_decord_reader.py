@@ -12,26 +12,35 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 import unittest
+import wave
 from test.util import (
     FRAME_SIZE,
     NUM_FRAMES,
     create_dummy_batches,
     create_sample_video,
     file_remove,
+    get_tmp_dir,
 )
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
 from evadb.configuration.constants import EvaDB_ROOT_DIR
-from evadb.constants import AUDIORATE, IFRAMES
+from evadb.constants import AUDIORATE, DIFF, IFRAMES
 from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.logical_expression import LogicalExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
-from evadb.readers.decord_reader import DecordReader
+from evadb.readers.decord_reader import (
+    DIFF_LAST_ID_COLUMN,
+    DecordReader,
+    read_video_metadata,
+)
+from evadb.utils.frame_cache import FrameCache
 from evadb.utils.generic_utils import try_to_import_decord
 
 
@@ -79,6 +88,29 @@ class DecordLoaderTest(unittest.TestCase):
 
             self.assertEqual(batches, expected)
 
+    def test_should_sample_changed_frames(self):
+        # the intensity of the i-th frame of the sample video is i
+        for k in range(1, 4):
+            video_loader = DecordReader(
+                file_url=self.video_file_url,
+                sampling_type=DIFF,
+                sampling_rate=k + 0.5,
+            )
+            batches = list(video_loader.read())
+
+            expected = self._batches_to_reader_convertor(
+                create_dummy_batches(
+                    filters=[i for i in range(0, NUM_FRAMES, k + 1)],
+                    is_from_storage=True,
+                )
+            )
+            # every returned frame stands in for the k frames skipped after it
+            for batch in expected:
+                batch.frames[DIFF_LAST_ID_COLUMN] = np.minimum(
+                    batch.frames["id"] + k, NUM_FRAMES - 1
+                )
+            self.assertEqual(batches, expected)
+
     def test_should_sample_every_k_frame_with_predicate(self):
         col = TupleValueExpression("id")
         val = ConstantValueExpression(NUM_FRAMES // 2)
@@ -131,6 +163,46 @@ class DecordLoaderTest(unittest.TestCase):
             )
         self.assertEqual(batches, expected)
 
+    def test_should_push_down_predicate_on_seconds(self):
+        seconds = [
+            second
+            for batch in DecordReader(file_url=self.video_file_url).read()
+            for second in batch.frames["seconds"]
+        ]
+        # seconds >= seconds[2] AND seconds[7] > seconds AND id != 4
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            LogicalExpression(
+                ExpressionType.LOGICAL_AND,
+                ComparisonExpression(
+                    ExpressionType.COMPARE_GEQ,
+                    left=TupleValueExpression("seconds"),
+                    right=ConstantValueExpression(seconds[2]),
+                ),
+                ComparisonExpression(
+                    ExpressionType.COMPARE_GREATER,
+                    left=ConstantValueExpression(seconds[7]),
+                    right=TupleValueExpression("seconds"),
+                ),
+            ),
+            ComparisonExpression(
+                ExpressionType.COMPARE_NEQ,
+                left=TupleValueExpression("id"),
+                right=ConstantValueExpression(4),
+            ),
+        )
+        video_loader = DecordReader(file_url=self.video_file_url, predicate=predicate)
+        self.assertEqual(video_loader._get_range_list(NUM_FRAMES), [(2, 3), (5, 6)])
+        batches = list(video_loader.read())
+        self.assertEqual(
+            [frame_id for batch in batches for frame_id in batch.frames["id"]],
+            [2, 3, 5, 6],
+        )
+        self.assertEqual(
+            [second for batch in batches for second in batch.frames["seconds"]],
+            [seconds[2], seconds[3], seconds[5], seconds[6]],
+        )
+
     def test_should_return_one_batch(self):
         video_loader = DecordReader(
             file_url=self.video_file_url,
@@ -141,6 +213,127 @@ class DecordLoaderTest(unittest.TestCase):
         )
         self.assertEqual(batches, expected)
 
+    def test_should_fetch_frames_of_a_batch_at_once(self):
+        # the batches are sized from the frame size of the stored metadata
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            batch_size=4,
+            metadata=read_video_metadata(self.video_file_url),
+        )
+        reader = video_loader._get_video_reader()
+        with patch.object(reader, "get_batch", wraps=reader.get_batch) as get_batch:
+            batches = list(video_loader.read())
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertEqual(
+            [list(call.args[0]) for call in get_batch.call_args_list],
+            [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]],
+        )
+        # the frames of a batch are views of one stacked array
+        frames = batches[0].frames["data"]
+        self.assertIsNotNone(frames[0].base)
+        self.assertIs(frames[0].base, frames[1].base)
+
+        # without metadata, the first frame is decoded alone to size the
+        # batches and is not decoded again
+        video_loader = DecordReader(file_url=self.video_file_url, batch_size=4)
+        reader = video_loader._reader
+        with patch.object(reader, "get_batch", wraps=reader.get_batch) as get_batch:
+            self.assertEqual(list(video_loader.read()), batches)
+        self.assertEqual(
+            [list(call.args[0]) for call in get_batch.call_args_list],
+            [[0], [1, 2, 3], [4, 5, 6, 7], [8, 9]],
+        )
+
+    def test_should_read_cached_frames(self):
+        frame_cache = FrameCache(memory_size=2**20)
+        expected = list(DecordReader(file_url=self.video_file_url).read())
+        batches = list(
+            DecordReader(file_url=self.video_file_url, frame_cache=frame_cache).read()
+        )
+        self.assertEqual(batches, expected)
+        self.assertEqual(frame_cache.misses, NUM_FRAMES)
+
+        video_loader = DecordReader(
+            file_url=self.video_file_url, frame_cache=frame_cache
+        )
+        with patch.object(video_loader._reader, "get_batch") as get_batch:
+            batches = list(video_loader.read())
+            get_batch.assert_not_called()
+        self.assertEqual(batches, expected)
+        self.assertEqual(frame_cache.misses, NUM_FRAMES)
+        self.assertEqual(frame_cache.memory_hits, NUM_FRAMES)
+
+    def test_should_not_decode_frames_if_video_is_not_read(self):
+        video_loader = DecordReader(file_url=self.video_file_url, read_video=False)
+        with patch.object(video_loader._reader, "get_batch") as get_batch:
+            batches = list(video_loader.read())
+            get_batch.assert_not_called()
+
+        expected = self._batches_to_reader_convertor(
+            create_dummy_batches(is_from_storage=True)
+        )
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(
+            batches[0].project(["id", "seconds", "_row_number"]),
+            expected[0].project(["id", "seconds", "_row_number"]),
+        )
+        for frame in batches[0].frames["data"]:
+            self.assertEqual(frame.shape, (0,))
+
+    def test_should_read_frames_using_stored_metadata(self):
+        metadata = read_video_metadata(self.video_file_url)
+        self.assertEqual(metadata.num_frames, NUM_FRAMES)
+        self.assertEqual(metadata.height, FRAME_SIZE[1])
+        self.assertEqual(metadata.width, FRAME_SIZE[0])
+        self.assertEqual(metadata.timestamps.shape, (NUM_FRAMES, 2))
+        self.assertEqual(list(metadata.keyframes), list(range(NUM_FRAMES)))
+
+        expected = self._batches_to_reader_convertor(
+            create_dummy_batches(is_from_storage=True)
+        )
+        video_loader = DecordReader(file_url=self.video_file_url, metadata=metadata)
+        # the file is only opened to decode the frames
+        self.assertIsNone(video_loader._reader)
+        self.assertEqual(list(video_loader.read()), expected)
+
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            sampling_type=IFRAMES,
+            sampling_rate=2,
+            read_video=False,
+            metadata=metadata,
+        )
+        batches = list(video_loader.read())
+        self.assertIsNone(video_loader._reader)
+        self.assertEqual(list(batches[0].frames["id"]), list(range(0, NUM_FRAMES, 2)))
+
+    def test_should_decode_frames_at_frame_size(self):
+        frame_size = (20, 10)
+        frame_cache = FrameCache(memory_size=2**20)
+        list(DecordReader(file_url=self.video_file_url, frame_cache=frame_cache).read())
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            frame_size=frame_size,
+            frame_cache=frame_cache,
+        )
+        batches = list(video_loader.read())
+        frames = [frame for batch in batches for frame in batch.frames["data"]]
+        self.assertEqual(len(frames), NUM_FRAMES)
+        for frame in frames:
+            self.assertEqual(frame.shape, (frame_size[1], frame_size[0], 3))
+        # the native size frames in the cache are not returned
+        self.assertEqual(frame_cache.misses, 2 * NUM_FRAMES)
+
+    def test_should_resize_frames_if_decord_can_not_scale_them(self):
+        # decord fails to scale the sample video to this size
+        frame_size = (FRAME_SIZE[0] // 2, FRAME_SIZE[1] // 4)
+        video_loader = DecordReader(file_url=self.video_file_url, frame_size=frame_size)
+        batches = list(video_loader.read())
+        frames = [frame for batch in batches for frame in batch.frames["data"]]
+        self.assertEqual(len(frames), NUM_FRAMES)
+        for frame in frames:
+            self.assertEqual(frame.shape, (frame_size[1], frame_size[0], 3))
+
     def test_should_return_batches_equivalent_to_number_of_frames(self):
         video_loader = DecordReader(
             file_url=self.video_file_url,
@@ -204,6 +397,58 @@ class DecordLoaderTest(unittest.TestCase):
             "Cannot use AUDIORATE with video streams", error_context.exception.args[0]
         )
 
+    def test_should_stream_audio_in_windows(self):
+        video_loader = DecordReader(
+            file_url=self.video_with_audio_file_url,
+            read_audio=True,
+            read_video=False,
+            audio_window=1,
+            audio_window_overlap=0.25,
+        )
+        batches = list(video_loader.read())
+        self.assertGreater(len(batches), 2)
+        for batch in batches:
+            self.assertEqual(len(batch), 1)
+        windows = [batch.frames["audio"][0] for batch in batches]
+        for window in windows[:-1]:
+            self.assertEqual(len(window), 16000)
+        self.assertEqual(
+            [batch.frames["seconds"][0] for batch in batches[:3]], [0.0, 0.75, 1.5]
+        )
+        # consecutive windows share a quarter of a second of audio
+        np.testing.assert_array_equal(windows[0][12000:], windows[1][:4000])
+
+    def test_should_stream_all_the_windows_of_an_audio_track(self):
+        # 5 seconds of 16 kHz mono audio
+        samples = (np.sin(np.arange(5 * 16000) / 10) * 10000).astype(np.int16)
+        file_url = os.path.join(get_tmp_dir(), "audio_windows.wav")
+        with wave.open(file_url, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(samples.tobytes())
+
+        video_loader = DecordReader(
+            file_url=file_url,
+            read_audio=True,
+            read_video=False,
+            audio_window=1,
+            audio_window_overlap=0.25,
+        )
+        batches = list(video_loader.read())
+        file_remove("audio_windows.wav")
+
+        # windows start every 0.75 seconds, the last one is the first one
+        # reaching the end of the track
+        self.assertEqual(len(batches), 7)
+        self.assertEqual(
+            [batch.frames["seconds"][0] for batch in batches],
+            [0.0, 0.75, 1.5, 2.25, 3.0, 3.75, 4.5],
+        )
+        windows = [batch.frames["audio"][0] for batch in batches]
+        self.assertEqual([len(window) for window in windows], [16000] * 6 + [8000])
+        np.testing.assert_allclose(windows[-1], samples[-8000:] / 32768, atol=1e-4)
+
     def test_should_return_audio_frames(self):
         video_loader = DecordReader(
             file_url=self.video_with_audio_file_url,
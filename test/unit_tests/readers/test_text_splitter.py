@@ -0,0 +1,49 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from evadb.readers.document.text_splitter import TextSplitter
+
+
+class TextSplitterTests(unittest.TestCase):
+    def test_should_split_on_coarsest_separator(self):
+        text = "first paragraph\n\nsecond paragraph\n\nthird"
+        splitter = TextSplitter(chunk_size=20, chunk_overlap=0)
+        self.assertEqual(
+            splitter.split_text(text),
+            ["first paragraph", "second paragraph", "third"],
+        )
+
+    def test_should_split_long_pieces_on_finer_separators(self):
+        text = "aaaa bbbb cccc\n\ndd"
+        splitter = TextSplitter(chunk_size=10, chunk_overlap=0)
+        self.assertEqual(splitter.split_text(text), ["aaaa bbbb", "cccc", "dd"])
+
+        splitter = TextSplitter(chunk_size=3, chunk_overlap=0)
+        self.assertEqual(splitter.split_text("abcdefg"), ["abc", "def", "g"])
+
+    def test_should_overlap_consecutive_chunks(self):
+        text = "one two three four five"
+        splitter = TextSplitter(chunk_size=10, chunk_overlap=5)
+        self.assertEqual(
+            splitter.split_text(text),
+            ["one two", "two three", "four five"],
+        )
+        for chunk in splitter.split_text(text * 10):
+            self.assertLessEqual(len(chunk), 10)
+
+    def test_should_reject_overlap_larger_than_chunk(self):
+        with self.assertRaises(AssertionError):
+            TextSplitter(chunk_size=10, chunk_overlap=20)
@@ -0,0 +1,172 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import shutil
+import unittest
+from test.util import (
+    create_dummy_batches,
+    get_evadb_for_testing,
+    suffix_pytest_xdist_worker_id_to_dir,
+)
+
+import numpy as np
+import pytest
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.storage.arrow_storage_engine import ArrowStorageEngine
+from evadb.storage.sqlite_storage_engine import SQLStorageEngine
+from evadb.storage.storage_engine import StorageEngine
+from evadb.utils.generic_utils import is_pyarrow_available
+
+
+@pytest.mark.notparallel
+@pytest.mark.skipif(not is_pyarrow_available(), reason="requires pyarrow")
+class ArrowStorageEngineTest(unittest.TestCase):
+    def create_sample_table(self):
+        table_info = TableCatalogEntry(
+            "dataset",
+            str(suffix_pytest_xdist_worker_id_to_dir("arrow_dataset")),
+            table_type=TableType.STRUCTURED_DATA,
+        )
+        column_pk = ColumnCatalogEntry(
+            IDENTIFIER_COLUMN, ColumnType.INTEGER, is_nullable=False
+        )
+        column_0 = ColumnCatalogEntry("name", ColumnType.TEXT, is_nullable=False)
+        column_1 = ColumnCatalogEntry("id", ColumnType.INTEGER, is_nullable=False)
+        column_2 = ColumnCatalogEntry(
+            "data", ColumnType.NDARRAY, False, NdArrayType.UINT8, [32, 32, 3]
+        )
+        table_info.columns = [column_pk, column_0, column_1, column_2]
+        return table_info
+
+    def write_dummy_batches(self, engine):
+        dummy_batches = list(create_dummy_batches(batch_size=5))
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            engine.write(self.table, batch.project(["name", "id", "data"]))
+        return dummy_batches
+
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        self.table = self.create_sample_table()
+
+    def tearDown(self):
+        shutil.rmtree(self.table.file_url, ignore_errors=True)
+
+    def test_should_create_empty_table(self):
+        engine = ArrowStorageEngine(self.evadb)
+        engine.create(self.table)
+        self.assertTrue(ArrowStorageEngine.exists(self.table))
+        records = list(engine.read(self.table, batch_mem_size=3000))
+        self.assertEqual(len(records), 0)
+        engine.drop(self.table)
+        self.assertFalse(ArrowStorageEngine.exists(self.table))
+
+    def test_should_write_and_read_rows(self):
+        engine = ArrowStorageEngine(self.evadb)
+        engine.create(self.table)
+        dummy_batches = self.write_dummy_batches(engine)
+
+        read_batch = Batch.concat(engine.read(self.table), copy=False)
+        expected = Batch.concat(dummy_batches, copy=False)
+        self.assertEqual(len(read_batch), len(expected))
+        self.assertEqual(list(read_batch.frames[IDENTIFIER_COLUMN]), list(range(1, 11)))
+        self.assertEqual(
+            list(read_batch.frames[ROW_NUM_COLUMN]),
+            list(read_batch.frames[IDENTIFIER_COLUMN]),
+        )
+        self.assertEqual(list(read_batch.frames["id"]), list(expected.frames["id"]))
+        for actual, expected_data in zip(
+            read_batch.frames["data"], expected.frames["data"]
+        ):
+            np.testing.assert_array_equal(actual, expected_data)
+
+        # small batch_mem_size splits the table into multiple batches
+        self.assertTrue(len(list(engine.read(self.table, batch_mem_size=3000))) > 1)
+
+    def test_should_read_projected_columns(self):
+        engine = ArrowStorageEngine(self.evadb)
+        engine.create(self.table)
+        self.write_dummy_batches(engine)
+
+        read_batch = Batch.concat(engine.read(self.table, columns=["id"]), copy=False)
+        self.assertEqual(
+            list(read_batch.columns), [IDENTIFIER_COLUMN, "id", ROW_NUM_COLUMN]
+        )
+
+    def test_should_delete_rows(self):
+        engine = ArrowStorageEngine(self.evadb)
+        engine.create(self.table)
+        self.write_dummy_batches(engine)
+
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_LESSER,
+            TupleValueExpression(name="id"),
+            ConstantValueExpression(7),
+        )
+        engine.delete(self.table, predicate)
+        read_batch = Batch.concat(engine.read(self.table), copy=False)
+        self.assertEqual(list(read_batch.frames["id"]), [7, 8, 9])
+
+        # row ids are not reused while the last data file is alive
+        self.write_dummy_batches(engine)
+        read_batch = Batch.concat(engine.read(self.table), copy=False)
+        self.assertEqual(read_batch.frames[IDENTIFIER_COLUMN].is_unique, True)
+
+    def test_rename(self):
+        engine = ArrowStorageEngine(self.evadb)
+        with pytest.raises(Exception):
+            engine.rename(self.table, None)
+
+    def test_arrow_storage_engine_exceptions(self):
+        engine = ArrowStorageEngine(self.evadb)
+
+        with self.assertRaises(Exception):
+            engine.drop(self.table)
+
+        with self.assertRaises(Exception):
+            engine.write(self.table, None)
+
+        with self.assertRaises(Exception):
+            list(engine.read(self.table))
+
+    def test_factory_should_follow_configuration(self):
+        catalog = self.evadb.catalog()
+        self.assertIsInstance(
+            StorageEngine.factory(self.evadb, self.table), SQLStorageEngine
+        )
+
+        catalog.upsert_configuration_catalog_entry("structured_storage_engine", "arrow")
+        try:
+            self.assertIsInstance(
+                StorageEngine.factory(self.evadb, self.table), ArrowStorageEngine
+            )
+        finally:
+            catalog.upsert_configuration_catalog_entry(
+                "structured_storage_engine", "sqlite"
+            )
+
+        # existing arrow tables ignore the configuration
+        ArrowStorageEngine(self.evadb).create(self.table)
+        self.assertIsInstance(
+            StorageEngine.factory(self.evadb, self.table), ArrowStorageEngine
+        )
@@ -0,0 +1,81 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+import unittest
+from pathlib import Path
+from test.util import get_evadb_for_testing
+
+import pytest
+from mock import patch
+
+from evadb.readers.document.text_splitter import TextSplitter
+from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.document_storage_engine import DocumentStorageEngine
+
+
+@pytest.mark.notparallel
+class DocumentStorageEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        self.evadb.catalog().reset()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.texts = [
+            "first document\n\nwith two paragraphs",
+            "second document " * 10,
+        ]
+        for i, text in enumerate(self.texts):
+            (Path(self.tmp_dir.name) / f"doc{i}.txt").write_text(text)
+        execute_query_fetch_all(
+            self.evadb, f"LOAD DOCUMENT '{self.tmp_dir.name}/*.txt' INTO MyDocs;"
+        )
+        self.table = self.evadb.catalog().get_table_catalog_entry("MyDocs")
+
+    def tearDown(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyDocs;")
+        self.tmp_dir.cleanup()
+
+    def _read_chunks(self, **kwargs):
+        engine = DocumentStorageEngine(self.evadb)
+        batches = list(engine.read(self.table, **kwargs))
+        return [
+            (row["name"], row["chunk_id"], row["data"])
+            for batch in batches
+            for _, row in batch.frames.iterrows()
+        ]
+
+    def test_should_read_chunks_computed_when_loading(self):
+        with patch("evadb.storage.document_storage_engine.chunk_document") as chunk:
+            chunk.side_effect = AssertionError("documents chunked again")
+            chunks = self._read_chunks(batch_size=2)
+        self.assertEqual(
+            [chunk[2] for chunk in chunks], [text.strip() for text in self.texts]
+        )
+
+    def test_should_chunk_documents_in_parallel_once(self):
+        chunk_params = {"chunk_size": 20, "chunk_overlap": 5}
+        chunks = self._read_chunks(chunk_params=chunk_params, num_workers=2)
+
+        splitter = TextSplitter(chunk_size=20, chunk_overlap=5)
+        expected = [
+            (str(Path(self.tmp_dir.name) / f"doc{i}.txt"), chunk_id, chunk)
+            for i, text in enumerate(self.texts)
+            for chunk_id, chunk in enumerate(splitter.split_text(text))
+        ]
+        self.assertEqual(chunks, expected)
+
+        # the chunks are read from the chunk store by the next scans
+        with patch("evadb.storage.document_storage_engine.chunk_document") as chunk:
+            chunk.side_effect = AssertionError("documents chunked again")
+            self.assertEqual(self._read_chunks(chunk_params=chunk_params), expected)
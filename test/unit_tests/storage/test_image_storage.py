@@ -0,0 +1,64 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import glob
+import unittest
+from test.util import get_evadb_for_testing
+
+import numpy as np
+import pytest
+
+from evadb.catalog.sql_config import ROW_NUM_COLUMN
+from evadb.configuration.constants import EvaDB_ROOT_DIR
+from evadb.readers.image.opencv_image_reader import read_image
+from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.image_storage_engine import ImageStorageEngine
+
+
+@pytest.mark.notparallel
+class ImageStorageEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        self.evadb.catalog().reset()
+        self.image_files_path = (
+            f"{EvaDB_ROOT_DIR}/test/data/uadetrac/small-data/MVI_20011/*.jpg"
+        )
+        execute_query_fetch_all(
+            self.evadb, f"LOAD IMAGE '{self.image_files_path}' INTO MyImages;"
+        )
+        self.table = self.evadb.catalog().get_table_catalog_entry("MyImages")
+
+    def tearDown(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyImages;")
+
+    def test_should_decode_images_in_parallel_into_batches(self):
+        num_files = len(glob.glob(self.image_files_path))
+        engine = ImageStorageEngine(self.evadb)
+        batches = list(engine.read(self.table, batch_size=3, num_workers=4))
+
+        self.assertEqual(len(batches), -(-num_files // 3))
+        rows = [row for batch in batches for _, row in batch.frames.iterrows()]
+        self.assertEqual(len(rows), num_files)
+        # images are returned in load order
+        row_ids = [row[ROW_NUM_COLUMN] for row in rows]
+        self.assertEqual(row_ids, sorted(row_ids))
+
+        serial_batches = list(engine.read(self.table, batch_size=3, num_workers=1))
+        serial_rows = [
+            row for batch in serial_batches for _, row in batch.frames.iterrows()
+        ]
+        for row, serial_row in zip(rows, serial_rows):
+            self.assertEqual(row["name"], serial_row["name"])
+            self.assertTrue(np.array_equal(row["data"], serial_row["data"]))
+        self.assertTrue(np.array_equal(rows[0]["data"], read_image(rows[0]["name"])))
@@ -0,0 +1,69 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+import unittest
+from test.util import get_evadb_for_testing
+
+import pytest
+from mock import MagicMock, patch
+
+from evadb.configuration.constants import EvaDB_ROOT_DIR
+from evadb.readers.pdf_reader import PDFReader, extract_pages, get_num_pages
+from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.pdf_storage_engine import PDFFile, PDFStorageEngine
+
+
+@pytest.mark.notparallel
+class PDFStorageEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        self.evadb.catalog().reset()
+        self.pdf_path = f"{EvaDB_ROOT_DIR}/data/documents/pdf_sample1.pdf"
+        execute_query_fetch_all(self.evadb, f"LOAD PDF '{self.pdf_path}' INTO MyPDFs;")
+        self.table = self.evadb.catalog().get_table_catalog_entry("MyPDFs")
+
+    def tearDown(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyPDFs;")
+
+    def _read_paragraphs(self, **kwargs):
+        engine = PDFStorageEngine(self.evadb)
+        return [
+            (row["page"], row["paragraph"], row["data"])
+            for batch in engine.read(self.table, **kwargs)
+            for _, row in batch.frames.iterrows()
+        ]
+
+    def test_should_read_paragraphs_extracted_when_loading(self):
+        expected = [
+            (row["page"], row["paragraph"], row["data"])
+            for batch in PDFReader(self.pdf_path).read()
+            for _, row in batch.frames.iterrows()
+        ]
+        with patch("evadb.storage.pdf_storage_engine.extract_pages") as extract:
+            extract.side_effect = AssertionError("pages extracted again")
+            self.assertEqual(self._read_paragraphs(batch_size=4), expected)
+
+    def test_should_extract_pages_in_parallel(self):
+        num_pages = get_num_pages(self.pdf_path)
+        pdf = PDFFile(0, self.pdf_path, self.pdf_path, "hash", num_pages)
+        with tempfile.TemporaryDirectory() as tmp_dir, patch(
+            "evadb.storage.pdf_storage_engine.PAGES_PER_TASK", 1
+        ):
+            engine = PDFStorageEngine(self.evadb)
+            page_store = engine._extract_pages(
+                MagicMock(file_url=tmp_dir), [pdf], num_workers=2
+            )
+            pages = [page_store.get(("hash", page_no)) for page_no in range(num_pages)]
+        self.assertEqual(pages, extract_pages(self.pdf_path, 0, num_pages))
@@ -14,19 +14,40 @@
 # limitations under the License.
 import shutil
 import unittest
+from pathlib import Path
 from test.util import (
     create_dummy_batches,
     get_evadb_for_testing,
     suffix_pytest_xdist_worker_id_to_dir,
 )
+from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
+from sqlalchemy import inspect
 
-from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
+from evadb.catalog.catalog_type import (
+    ColumnType,
+    NdArrayType,
+    TableType,
+    VectorStoreType,
+)
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import IDENTIFIER_COLUMN
-from evadb.storage.sqlite_storage_engine import SQLStorageEngine
+from evadb.catalog.models.utils import IndexCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.storage.sqlite_storage_engine import (
+    EMBEDDING_DIR_SUFFIX,
+    INDEX_PREFIX,
+    SQLStorageEngine,
+)
 
 
 @pytest.mark.notparallel
@@ -60,6 +81,9 @@ class SQLStorageEngineTest(unittest.TestCase):
             shutil.rmtree(
                 suffix_pytest_xdist_worker_id_to_dir("dataset"), ignore_errors=True
             )
+            shutil.rmtree(
+                f"{self.table.file_url}{EMBEDDING_DIR_SUFFIX}", ignore_errors=True
+            )
         except ValueError:
             pass
 
@@ -88,6 +112,261 @@ class SQLStorageEngineTest(unittest.TestCase):
         # clean up
         sqlengine.drop(self.table)
 
+    def test_should_stream_rows_in_batches(self):
+        dummy_batches = list(create_dummy_batches(num_frames=50, batch_size=10))
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        read_iter = sqlengine.read(self.table, batch_mem_size=3000)
+        first_batch = next(read_iter)
+        self.assertLess(len(first_batch), 50)
+
+        # rows written while the table is being read are not returned
+        sqlengine.write(self.table, dummy_batches[0])
+        read_batch = Batch.concat([first_batch, *read_iter], copy=False)
+        self.assertEqual(list(read_batch.frames["id"]), list(range(50)))
+        self.assertEqual(len(Batch.concat(sqlengine.read(self.table), copy=False)), 60)
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_bulk_write_batches(self):
+        dummy_batches = list(create_dummy_batches(num_frames=50, batch_size=10))
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+
+        with patch.object(
+            sqlengine._sql_session, "commit", wraps=sqlengine._sql_session.commit
+        ) as mock_commit:
+            num_rows = sqlengine.bulk_write(
+                self.table, iter(dummy_batches), commit_rows=20
+            )
+        self.assertEqual(num_rows, 50)
+        # one commit every 20 rows and a final one for the remaining rows
+        self.assertEqual(mock_commit.call_count, 3)
+
+        read_batch = Batch.concat(sqlengine.read(self.table), copy=False)
+        self.assertEqual(list(read_batch.frames["id"]), list(range(50)))
+        self.assertTrue(
+            all(
+                (frame == expected).all()
+                for frame, expected in zip(
+                    read_batch.frames["data"],
+                    Batch.concat(dummy_batches, copy=False).frames["data"],
+                )
+            )
+        )
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_push_down_columns_and_predicate(self):
+        dummy_batches = list(create_dummy_batches(num_frames=20, batch_size=10))
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        id_col = TupleValueExpression(name="id")
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_OR,
+            ComparisonExpression(
+                ExpressionType.COMPARE_LESSER, id_col, ConstantValueExpression(3)
+            ),
+            ComparisonExpression(
+                ExpressionType.COMPARE_EQUAL, id_col, ConstantValueExpression(15)
+            ),
+        )
+        read_batch = Batch.concat(
+            sqlengine.read(self.table, columns=["id"], predicate=predicate),
+            copy=False,
+        )
+        self.assertEqual(list(read_batch.frames["id"]), [0, 1, 2, 15])
+        # the NDARRAY column is not read, the row number is derived from the
+        # row id
+        self.assertEqual(
+            sorted(read_batch.columns),
+            sorted([IDENTIFIER_COLUMN, ROW_NUM_COLUMN, "id"]),
+        )
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_skip_chunks_using_zone_maps(self):
+        dummy_batches = list(create_dummy_batches(num_frames=50, batch_size=10))
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        # every write is a chunk, holding 10 consecutive ids
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GEQ,
+            TupleValueExpression(name="id"),
+            ConstantValueExpression(35),
+        )
+        self.assertEqual(sqlengine.zone_map_pruning(self.table, predicate), (3, 5))
+        read_batch = Batch.concat(
+            sqlengine.read(self.table, predicate=predicate), copy=False
+        )
+        self.assertEqual(list(read_batch.frames["id"]), list(range(35, 50)))
+
+        # rows written after a delete reuse the row ids of the deleted rows, so
+        # the stale zone maps are dropped
+        sql_table = sqlengine._try_loading_table_via_reflection(self.table.name)
+        sqlengine.delete(self.table, sql_table.c["id"] >= 40)
+        sqlengine.write(self.table, dummy_batches[0])
+        read_batch = Batch.concat(
+            sqlengine.read(self.table, predicate=predicate), copy=False
+        )
+        self.assertEqual(list(read_batch.frames["id"]), list(range(35, 40)))
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_read_rows_using_index(self):
+        dummy_batches = list(create_dummy_batches(num_frames=50, batch_size=10))
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in reversed(dummy_batches):
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        sqlengine.create_index(self.table, "id_index", "id")
+        index_names = [
+            index["name"]
+            for index in inspect(sqlengine._sql_engine).get_indexes(self.table.name)
+        ]
+        self.assertIn(f"{INDEX_PREFIX}id_index", index_names)
+
+        index = IndexCatalogEntry(
+            "id_index", "", VectorStoreType.BTREE, feat_column=self.table.columns[2]
+        )
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            ComparisonExpression(
+                ExpressionType.COMPARE_GEQ,
+                TupleValueExpression(name="id"),
+                ConstantValueExpression(8),
+            ),
+            ComparisonExpression(
+                ExpressionType.COMPARE_LESSER,
+                TupleValueExpression(name="id"),
+                ConstantValueExpression(13),
+            ),
+        )
+        with patch(
+            "evadb.storage.sqlite_storage_engine.MAX_ROW_IDS_PER_QUERY", 2
+        ), patch.object(
+            sqlengine, "_read_rows", wraps=sqlengine._read_rows
+        ) as read_rows:
+            read_batch = Batch.concat(
+                sqlengine.read(self.table, predicate=predicate, index=index),
+                copy=False,
+            )
+            read_rows.assert_not_called()
+        # rows are returned in the order they were written
+        self.assertEqual(list(read_batch.frames["id"]), [10, 11, 12, 8, 9])
+
+        sqlengine.drop_index(self.table, "id_index")
+        index_names = [
+            index["name"]
+            for index in inspect(sqlengine._sql_engine).get_indexes(self.table.name)
+        ]
+        self.assertNotIn(f"{INDEX_PREFIX}id_index", index_names)
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_store_fixed_shape_arrays_as_matrix(self):
+        dummy_batches = list(create_dummy_batches(num_frames=20, batch_size=10))
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        matrix_path = Path(f"{self.table.file_url}{EMBEDDING_DIR_SUFFIX}") / "data.npy"
+        self.assertTrue(matrix_path.exists())
+
+        row_ids, matrix = sqlengine.read_embedding_matrix(self.table, "data")
+        expected = np.stack(
+            [value for batch in dummy_batches for value in batch.frames["data"]]
+        )
+        self.assertEqual(list(row_ids), list(range(1, 21)))
+        self.assertTrue(np.array_equal(matrix, expected))
+
+        read_batch = Batch.concat(sqlengine.read(self.table), copy=False)
+        for value, expected_value in zip(read_batch.frames["data"], expected):
+            self.assertTrue(np.array_equal(value, expected_value))
+            # scans hand out views of the memory-mapped matrix
+            self.assertFalse(value.flags.owndata)
+
+        # deleted rows are skipped when reading the matrix
+        sql_table = sqlengine._try_loading_table_via_reflection(self.table.name)
+        sqlengine.delete(self.table, sql_table.c["id"] < 5)
+        row_ids, matrix = sqlengine.read_embedding_matrix(self.table, "data")
+        self.assertEqual(list(row_ids), list(range(6, 21)))
+        self.assertTrue(np.array_equal(matrix, expected[5:]))
+
+        # a value with another shape moves the column back to the blobs
+        odd_batch = Batch(
+            pd.DataFrame(
+                [{"name": "odd", "id": 100, "data": np.ones((3, 3), dtype=np.uint8)}]
+            )
+        )
+        sqlengine.write(self.table, odd_batch)
+        self.assertFalse(matrix_path.exists())
+        self.assertIsNone(sqlengine.read_embedding_matrix(self.table, "data"))
+        read_batch = Batch.concat(sqlengine.read(self.table), copy=False)
+        self.assertEqual(len(read_batch), 16)
+        for value, expected_value in zip(read_batch.frames["data"], expected[5:]):
+            self.assertTrue(np.array_equal(value, expected_value))
+        self.assertEqual(read_batch.frames["data"].iloc[-1].shape, (3, 3))
+
+        sqlengine.drop(self.table)
+        self.assertFalse(matrix_path.parent.exists())
+
+    def test_should_not_truncate_values_stored_as_matrix(self):
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        matrix_path = Path(f"{self.table.file_url}{EMBEDDING_DIR_SUFFIX}") / "data.npy"
+
+        # whole numbers fit in the uint8 matrix
+        whole = np.full((2, 2, 3), 7, dtype=np.float32)
+        sqlengine.write(
+            self.table, Batch(pd.DataFrame([{"name": "a", "id": 0, "data": whole}]))
+        )
+        self.assertTrue(matrix_path.exists())
+
+        # fractions would be truncated, the column is moved to the blobs
+        fraction = np.full((2, 2, 3), 2.5, dtype=np.float32)
+        sqlengine.write(
+            self.table,
+            Batch(pd.DataFrame([{"name": "b", "id": 1, "data": fraction}])),
+        )
+        self.assertFalse(matrix_path.exists())
+        read_batch = Batch.concat(sqlengine.read(self.table), copy=False)
+        self.assertTrue(np.array_equal(read_batch.frames["data"].iloc[0], whole))
+        self.assertTrue(np.array_equal(read_batch.frames["data"].iloc[1], fraction))
+
+        sqlengine.drop(self.table)
+
     def test_rename(self):
         table_info = TableCatalogEntry(
             "new_name", "new_name", table_type=TableType.VIDEO_DATA
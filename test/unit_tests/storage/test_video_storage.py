@@ -12,6 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import pickle
+import queue
+import shutil
+import tempfile
 import unittest
 from test.util import (
     create_sample_video,
@@ -27,8 +32,21 @@ import pytest
 from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import ROW_NUM_COLUMN, ROW_NUM_MAGIC
+from evadb.configuration.constants import EvaDB_ROOT_DIR
 from evadb.models.storage.batch import Batch
+from evadb.server.command_handler import execute_query_fetch_all
 from evadb.storage.storage_engine import StorageEngine
+from evadb.storage.video_storage_engine import VideoFile, _decode_video
+from evadb.utils.errors import VideoDecodeError
+from evadb.utils.frame_cache import FrameCache
+
+
+def _decode_video_or_crash(video_index, video, reader_kwargs, queue):
+    # the worker of the second video dies without telling the consumer
+    if video_index == 1:
+        os._exit(1)
+    _decode_video(video_index, video, reader_kwargs, queue)
 
 
 @pytest.mark.notparallel
@@ -52,6 +70,7 @@ class VideoStorageEngineTest(unittest.TestCase):
 
     def setUp(self):
         evadb = get_evadb_for_testing()
+        self.evadb = evadb
         mock.table_type = TableType.VIDEO_DATA
         self.video_engine = StorageEngine.factory(evadb, mock)
         self.table = self.create_sample_table()
@@ -93,6 +112,115 @@ class VideoStorageEngineTest(unittest.TestCase):
 
         self.video_engine.drop(self.table)
 
+    def test_should_decode_videos_in_parallel(self):
+        path = f"{EvaDB_ROOT_DIR}/data/sample_videos/1/*.mp4"
+        execute_query_fetch_all(self.evadb, f"LOAD VIDEO '{path}' INTO MyVideos;")
+        table = self.evadb.catalog().get_table_catalog_entry("MyVideos")
+
+        def read_row_nums(**kwargs):
+            batches = self.video_engine.read(table, 30000000, batch_size=5, **kwargs)
+            return [list(batch.frames[ROW_NUM_COLUMN]) for batch in batches]
+
+        expected = read_row_nums(num_workers=1)
+        # the videos are returned in load order
+        self.assertEqual(read_row_nums(num_workers=2, preserve_order=True), expected)
+
+        # the batches of the videos are interleaved, but each video is
+        # returned in order with the same row numbers
+        actual = read_row_nums(num_workers=2, preserve_order=False)
+        self.assertCountEqual(actual, expected)
+        for row_id in (1, 2):
+            self.assertEqual(
+                [rows for rows in actual if rows[0] // ROW_NUM_MAGIC == row_id],
+                [rows for rows in expected if rows[0] // ROW_NUM_MAGIC == row_id],
+            )
+
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyVideos;")
+
+    def test_should_count_the_frame_cache_lookups_of_the_workers(self):
+        path = f"{EvaDB_ROOT_DIR}/data/sample_videos/1/*.mp4"
+        execute_query_fetch_all(self.evadb, f"LOAD VIDEO '{path}' INTO MyVideos;")
+        table = self.evadb.catalog().get_table_catalog_entry("MyVideos")
+        num_frames = self.video_engine.get_num_frames(table)
+
+        disk_path = tempfile.mkdtemp()
+        try:
+            frame_cache = FrameCache(2**30, disk_path=disk_path, disk_size=2**30)
+            with mock.patch.object(
+                self.video_engine, "_get_frame_cache", return_value=frame_cache
+            ):
+                for _ in range(2):
+                    list(self.video_engine.read(table, 30000000, num_workers=2))
+            # the workers fill the disk tier, which the second scan hits, the
+            # disk cache drops the writes of workers contending for a shard
+            stats = frame_cache.stats()
+            self.assertEqual(stats["misses"] + stats["disk_hits"], 2 * num_frames)
+            self.assertGreaterEqual(stats["misses"], num_frames)
+            self.assertGreater(stats["hit_rate"], 0.0)
+            self.assertEqual(stats["memory_hits"], 0)
+        finally:
+            shutil.rmtree(disk_path, ignore_errors=True)
+
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyVideos;")
+
+    def test_should_raise_if_a_decoding_worker_dies(self):
+        path = f"{EvaDB_ROOT_DIR}/data/sample_videos/1/*.mp4"
+        execute_query_fetch_all(self.evadb, f"LOAD VIDEO '{path}' INTO MyVideos;")
+        table = self.evadb.catalog().get_table_catalog_entry("MyVideos")
+
+        with mock.patch(
+            "evadb.storage.video_storage_engine._decode_video",
+            _decode_video_or_crash,
+        ):
+            for preserve_order in (True, False):
+                with self.assertRaises(VideoDecodeError):
+                    list(
+                        self.video_engine.read(
+                            table,
+                            30000000,
+                            batch_size=5,
+                            num_workers=2,
+                            preserve_order=preserve_order,
+                        )
+                    )
+
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyVideos;")
+
+    def test_should_send_decoding_errors_as_picklable_messages(self):
+        decoded = queue.Queue()
+        video = VideoFile(0, "missing.mp4", "missing.mp4", None)
+        _decode_video(0, video, {"batch_mem_size": 30000000}, decoded)
+
+        _, error = decoded.get_nowait()
+        error = pickle.loads(pickle.dumps(error))
+        self.assertEqual(error.error_type, "DatasetFileNotFoundError")
+        self.assertIn("DatasetFileNotFoundError", error.traceback)
+        self.assertEqual(decoded.get_nowait(), (0, None))
+
+    def test_should_store_video_metadata_on_load(self):
+        path = f"{EvaDB_ROOT_DIR}/data/sample_videos/1/*.mp4"
+        execute_query_fetch_all(self.evadb, f"LOAD VIDEO '{path}' INTO MyVideos;")
+        table = self.evadb.catalog().get_table_catalog_entry("MyVideos")
+
+        videos = self.video_engine._get_videos(table)
+        self.assertEqual(len(videos), 2)
+        for video in videos:
+            self.assertIsNotNone(video.metadata)
+            self.assertEqual(
+                video.metadata.timestamps.shape, (video.metadata.num_frames, 2)
+            )
+
+        num_frames = sum(
+            len(batch) for batch in self.video_engine.read(table, 30000000)
+        )
+        self.assertEqual(self.video_engine.get_num_frames(table), num_frames)
+        self.assertEqual(
+            self.video_engine.get_num_frames(table, keyframes_only=True),
+            sum(len(video.metadata.keyframes) for video in videos),
+        )
+
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyVideos;")
+
     def test_rename(self):
         table_info = TableCatalogEntry(
             "new_name", "new_name", table_type=TableType.VIDEO_DATA
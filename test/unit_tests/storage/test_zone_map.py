@@ -0,0 +1,113 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.storage.zone_map import (
+    ColumnZoneMap,
+    compute_column_zone_map,
+    predicate_may_match,
+)
+
+
+def _compare(etype, left, right):
+    return ComparisonExpression(etype, left, right)
+
+
+class ZoneMapTest(unittest.TestCase):
+    def test_compute_column_zone_map(self):
+        zone_map = compute_column_zone_map(pd.Series([3, np.nan, 1, 7]))
+        self.assertEqual(zone_map, ColumnZoneMap(1, 7, 1))
+        self.assertIsInstance(zone_map.min_value, float)
+
+        zone_map = compute_column_zone_map(pd.Series(["b", None, "a"]))
+        self.assertEqual(zone_map, ColumnZoneMap("a", "b", 1))
+
+        zone_map = compute_column_zone_map(pd.Series([None, None]))
+        self.assertEqual(zone_map, ColumnZoneMap(None, None, 2))
+
+    def test_predicate_may_match(self):
+        ts = TupleValueExpression(name="ts")
+        zone_maps = {"ts": ColumnZoneMap(10, 20, 0)}
+
+        def _may_match(etype, value, constant_on_left=False):
+            constant = ConstantValueExpression(value)
+            if constant_on_left:
+                predicate = _compare(etype, constant, ts)
+            else:
+                predicate = _compare(etype, ts, constant)
+            return predicate_may_match(predicate, zone_maps, 5)
+
+        self.assertTrue(_may_match(ExpressionType.COMPARE_GREATER, 15))
+        self.assertFalse(_may_match(ExpressionType.COMPARE_GREATER, 20))
+        self.assertTrue(_may_match(ExpressionType.COMPARE_GEQ, 20))
+        self.assertFalse(_may_match(ExpressionType.COMPARE_LESSER, 10))
+        self.assertTrue(_may_match(ExpressionType.COMPARE_LEQ, 10))
+        self.assertFalse(_may_match(ExpressionType.COMPARE_EQUAL, 21))
+        # 25 < ts
+        self.assertFalse(_may_match(ExpressionType.COMPARE_LESSER, 25, True))
+        # NEQ and LIKE are never used to skip chunks
+        self.assertTrue(_may_match(ExpressionType.COMPARE_NEQ, 15))
+
+        greater = _compare(
+            ExpressionType.COMPARE_GREATER, ts, ConstantValueExpression(30)
+        )
+        lesser = _compare(ExpressionType.COMPARE_LESSER, ts, ConstantValueExpression(5))
+        in_range = _compare(
+            ExpressionType.COMPARE_LESSER, ts, ConstantValueExpression(15)
+        )
+        self.assertFalse(
+            predicate_may_match(
+                LogicalExpression(ExpressionType.LOGICAL_OR, greater, lesser),
+                zone_maps,
+                5,
+            )
+        )
+        self.assertFalse(
+            predicate_may_match(
+                LogicalExpression(ExpressionType.LOGICAL_AND, in_range, greater),
+                zone_maps,
+                5,
+            )
+        )
+        self.assertTrue(
+            predicate_may_match(
+                LogicalExpression(ExpressionType.LOGICAL_OR, in_range, greater),
+                zone_maps,
+                5,
+            )
+        )
+
+        # columns without zone maps and incomparable values are not pruned
+        self.assertTrue(predicate_may_match(greater, {}, 5))
+        self.assertTrue(
+            predicate_may_match(
+                _compare(
+                    ExpressionType.COMPARE_EQUAL, ts, ConstantValueExpression("a")
+                ),
+                zone_maps,
+                5,
+            )
+        )
+        # a chunk holding only nulls never satisfies a comparison
+        null_zone_maps = {"ts": ColumnZoneMap(None, None, 5)}
+        self.assertFalse(predicate_may_match(greater, null_zone_maps, 5))
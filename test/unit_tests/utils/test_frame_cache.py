@@ -0,0 +1,100 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from evadb.utils.frame_cache import FrameCache, get_frame_cache
+
+
+class FrameCacheTests(unittest.TestCase):
+    def _frame(self, value):
+        return np.full((2, 2, 3), value, dtype=np.uint8)
+
+    def test_should_evict_least_recently_used_frames(self):
+        # room for two frames of 12 bytes
+        cache = FrameCache(memory_size=24)
+        cache.put("a", self._frame(1))
+        cache.put("b", self._frame(2))
+        self.assertTrue(np.array_equal(cache.get("a"), self._frame(1)))
+        cache.put("c", self._frame(3))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertTrue(np.array_equal(cache.get("a"), self._frame(1)))
+        self.assertTrue(np.array_equal(cache.get("c"), self._frame(3)))
+        self.assertEqual(cache.memory_hits, 3)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_rate, 0.75)
+        self.assertEqual(cache.stats()["memory_size"], 24)
+
+    def test_should_copy_cached_frames(self):
+        cache = FrameCache(memory_size=1024)
+        frames = np.stack([self._frame(1), self._frame(2)])
+        cache.put("a", frames[0])
+        frames[0] = 5
+        cached = cache.get("a")
+        self.assertTrue(np.array_equal(cached, self._frame(1)))
+        self.assertFalse(cached.flags.writeable)
+
+    def test_should_read_evicted_frames_from_disk(self):
+        disk_path = tempfile.mkdtemp()
+        try:
+            cache = FrameCache(memory_size=12, disk_path=disk_path, disk_size=2**20)
+            cache.put("a", self._frame(1))
+            cache.put("b", self._frame(2))
+            self.assertTrue(np.array_equal(cache.get("a"), self._frame(1)))
+            self.assertEqual(cache.disk_hits, 1)
+            self.assertEqual(cache.memory_hits, 0)
+        finally:
+            shutil.rmtree(disk_path, ignore_errors=True)
+
+    def test_should_only_fill_the_disk_tier_if_memory_is_not_filled(self):
+        disk_path = tempfile.mkdtemp()
+        try:
+            cache = FrameCache(memory_size=1024, disk_path=disk_path, disk_size=2**20)
+            cache.fill_memory = False
+            cache.put("a", self._frame(1))
+            self.assertEqual(cache.stats()["memory_size"], 0)
+            self.assertTrue(np.array_equal(cache.get("a"), self._frame(1)))
+            self.assertTrue(np.array_equal(cache.get("a"), self._frame(1)))
+            self.assertEqual(cache.disk_hits, 2)
+            self.assertEqual(cache.stats()["memory_size"], 0)
+        finally:
+            shutil.rmtree(disk_path, ignore_errors=True)
+
+    def test_should_merge_the_stats_of_another_cache(self):
+        cache = FrameCache(memory_size=1024)
+        cache.put("a", self._frame(1))
+        cache.get("a")
+        worker_cache = FrameCache(memory_size=1024)
+        worker_cache.get("a")
+        worker_cache.get("b")
+
+        cache.merge_stats(worker_cache.stats())
+        self.assertEqual(cache.memory_hits, 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertAlmostEqual(cache.hit_rate, 1 / 3)
+
+        worker_cache.reset_stats()
+        self.assertEqual(worker_cache.misses, 0)
+
+    def test_should_share_the_cache_of_the_process(self):
+        cache = get_frame_cache(1024)
+        self.assertIs(get_frame_cache(1024), cache)
+        self.assertIs(pickle.loads(pickle.dumps(cache)), cache)
+        self.assertIsNot(get_frame_cache(2048), cache)
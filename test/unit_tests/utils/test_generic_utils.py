@@ -14,7 +14,16 @@
 # limitations under the License.
 import unittest
 
-from evadb.utils.generic_utils import string_comparison_case_insensitive
+import numpy as np
+
+from evadb.utils.generic_utils import (
+    BatchSizer,
+    NdArraySerializer,
+    PickleSerializer,
+    get_row_size,
+    rebatch,
+    string_comparison_case_insensitive,
+)
 
 
 class GenericUtilsTests(unittest.TestCase):
@@ -44,3 +53,62 @@ class GenericUtilsTests(unittest.TestCase):
         self.assertFalse(test_string_no_match)
         self.assertFalse(test_one_string_null)
         self.assertFalse(test_both_strings_null)
+
+    def test_ndarray_serializer(self):
+        arrays = [
+            np.arange(24, dtype=np.float32).reshape(2, 3, 4),
+            np.arange(24, dtype=np.int64).reshape(4, 6)[:, ::2],
+            np.zeros((0, 3), dtype=np.uint8),
+            np.array(5, dtype=np.int16),
+            np.array(["a", "bc"]),
+        ]
+        for array in arrays:
+            data = NdArraySerializer.serialize(array)
+            self.assertTrue(data.startswith(NdArraySerializer.MAGIC))
+            result = NdArraySerializer.deserialize(data)
+            self.assertEqual(result.dtype, array.dtype)
+            np.testing.assert_array_equal(result, array)
+            # decoded arrays are read-only views over the serialized buffer
+            self.assertFalse(result.flags.writeable)
+
+        # values that cannot be encoded natively fall back to pickle
+        object_array = np.array([1, "a", None], dtype=object)
+        data = NdArraySerializer.serialize(object_array)
+        self.assertFalse(data.startswith(NdArraySerializer.MAGIC))
+        np.testing.assert_array_equal(NdArraySerializer.deserialize(data), object_array)
+        self.assertEqual(
+            NdArraySerializer.deserialize(NdArraySerializer.serialize([1, 2])), [1, 2]
+        )
+
+        # blobs written by PickleSerializer are still readable
+        array = np.ones((2, 2))
+        np.testing.assert_array_equal(
+            NdArraySerializer.deserialize(PickleSerializer.serialize(array)), array
+        )
+
+    def test_get_row_size(self):
+        row = {
+            "id": 1,
+            "name": "abcd",
+            "data": np.zeros((10, 10), dtype=np.uint8),
+            "score": np.float32(1.0),
+        }
+        self.assertEqual(get_row_size(row), 8 + 4 + 100 + 4)
+
+    def test_batch_sizer_reestimates_row_size(self):
+        # rows whose arrays grow while being read
+        rows = [{"data": np.zeros(size, dtype=np.uint8)} for size in [10] * 5]
+        rows += [{"data": np.zeros(size, dtype=np.uint8)} for size in [100] * 5]
+        batches = list(rebatch(iter(rows), batch_mem_size=200))
+        self.assertEqual([len(batch) for batch in batches], [7, 2, 1])
+
+        batch_sizer = BatchSizer(batch_mem_size=1000)
+        for row in rows:
+            batch_sizer.add(row)
+        self.assertEqual(batch_sizer.row_size, 55)
+        self.assertEqual(batch_sizer.rows_per_batch(), 18)
+
+        # the number of rows requested is honored as well
+        batches = list(rebatch(iter(rows), batch_mem_size=10**9, batch_size=3))
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 3, 1])
+        self.assertEqual(BatchSizer(10**9, batch_size=3).rows_per_batch(), 3)
@@ -0,0 +1,73 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import unittest
+
+from evadb.utils.prefetch import PrefetchIterator, prefetch
+
+
+class PrefetchTests(unittest.TestCase):
+    def test_should_return_items_in_order(self):
+        items = PrefetchIterator(range(100), depth=4)
+        self.assertEqual(list(items), list(range(100)))
+        self.assertEqual(items.num_items, 100)
+        self.assertLessEqual(items.starvation_rate, 1.0)
+
+    def test_should_not_prefetch_if_depth_is_zero(self):
+        items = [1, 2, 3]
+        self.assertIs(prefetch(items, 0), items)
+
+    def test_should_produce_items_in_background_thread(self):
+        threads = []
+
+        def produce():
+            for i in range(3):
+                threads.append(threading.current_thread())
+                yield i
+
+        self.assertEqual(list(prefetch(produce(), 2)), [0, 1, 2])
+        self.assertTrue(all(t is not threading.current_thread() for t in threads))
+
+    def test_should_raise_producer_errors(self):
+        def produce():
+            yield 1
+            raise ValueError("decoding failed")
+
+        items = prefetch(produce(), 2)
+        self.assertEqual(next(items), 1)
+        with self.assertRaises(ValueError):
+            next(items)
+
+    def test_should_stop_producer_when_consumer_stops(self):
+        produced = []
+        closed = threading.Event()
+
+        def produce():
+            try:
+                for i in range(1000):
+                    produced.append(i)
+                    yield i
+            finally:
+                closed.set()
+
+        items = PrefetchIterator(produce(), depth=2)
+        iterator = iter(items)
+        self.assertEqual(next(iterator), 0)
+        iterator.close()
+
+        self.assertTrue(closed.is_set())
+        # the producer never runs further ahead than the queue depth
+        self.assertLessEqual(len(produced), 1 + 2 + 1)
+        self.assertEqual(items.stats()["num_items"], 1)
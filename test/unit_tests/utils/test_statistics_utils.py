@@ -0,0 +1,75 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from evadb.utils.statistics_utils import (
+    ColumnStatisticsCollector,
+    HyperLogLog,
+    histogram_selectivity,
+)
+
+
+class StatisticsUtilsTests(unittest.TestCase):
+    def test_hyperloglog_should_estimate_distinct_values(self):
+        for num_distinct in [10, 1000, 100000]:
+            hll = HyperLogLog()
+            values = pd.Series(np.arange(num_distinct))
+            # duplicates should not change the estimate
+            hll.add(values)
+            hll.add(values[: num_distinct // 2])
+            self.assertAlmostEqual(hll.count() / num_distinct, 1.0, delta=0.05)
+
+        hll = HyperLogLog()
+        hll.add(pd.Series([f"name_{i % 500}" for i in range(10000)]))
+        self.assertAlmostEqual(hll.count() / 500, 1.0, delta=0.05)
+
+    def test_collector_should_track_nulls_and_histogram(self):
+        collector = ColumnStatisticsCollector(track_histogram=True, sample_size=1000)
+        for start in range(0, 10000, 2500):
+            values = pd.Series(np.arange(start, start + 2500), dtype="float")
+            values[values % 10 == 0] = np.nan
+            collector.update(values)
+
+        self.assertEqual(collector.num_rows, 10000)
+        self.assertAlmostEqual(collector.null_fraction, 0.1)
+        self.assertAlmostEqual(collector.num_distinct / 9000, 1.0, delta=0.05)
+
+        bounds = collector.histogram_bounds(num_buckets=10)
+        self.assertEqual(len(bounds), 11)
+        self.assertEqual(bounds, sorted(bounds))
+        # the sample is uniform, so the bounds are close to the deciles
+        for idx, bound in enumerate(bounds[1:-1], start=1):
+            self.assertAlmostEqual(bound, idx * 1000, delta=500)
+
+    def test_collector_without_values(self):
+        collector = ColumnStatisticsCollector(track_distinct=False)
+        collector.update(pd.Series([None, None]))
+        self.assertEqual(collector.num_rows, 2)
+        self.assertEqual(collector.null_fraction, 1.0)
+        self.assertIsNone(collector.num_distinct)
+        self.assertEqual(collector.histogram_bounds(), [])
+
+    def test_histogram_selectivity(self):
+        bounds = [0.0, 10.0, 20.0, 40.0]
+        self.assertEqual(histogram_selectivity(bounds, -1, inclusive=True), 0.0)
+        self.assertEqual(histogram_selectivity(bounds, 0, inclusive=False), 0.0)
+        self.assertEqual(histogram_selectivity(bounds, 40, inclusive=True), 1.0)
+        self.assertEqual(histogram_selectivity(bounds, 50, inclusive=False), 1.0)
+        self.assertAlmostEqual(histogram_selectivity(bounds, 5, True), 1 / 6)
+        self.assertAlmostEqual(histogram_selectivity(bounds, 30, False), 5 / 6)
+        self.assertIsNone(histogram_selectivity([], 30, False))
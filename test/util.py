@@ -123,101 +123,8 @@ def get_all_subclasses(cls):
 
 
 def get_mock_object(class_type, number_of_args):
-    if number_of_args == 1:
-        return class_type()
-    elif number_of_args == 2:
-        return class_type(MagicMock())
-    elif number_of_args == 3:
-        return class_type(MagicMock(), MagicMock())
-    elif number_of_args == 4:
-        return class_type(MagicMock(), MagicMock(), MagicMock())
-    elif number_of_args == 5:
-        return class_type(MagicMock(), MagicMock(), MagicMock(), MagicMock())
-    elif number_of_args == 6:
-        return class_type(
-            MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock()
-        )
-    elif number_of_args == 7:
-        return class_type(
-            MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock()
-        )
-    elif number_of_args == 8:
-        return class_type(
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-        )
-    elif number_of_args == 9:
-        return class_type(
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-        )
-    elif number_of_args == 10:
-        return class_type(
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-        )
-    elif number_of_args == 11:
-        return class_type(
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-        )
-    elif number_of_args == 12:
-        return class_type(
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-        )
-    elif number_of_args == 13:
-        return class_type(
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-        )
-    else:
-        raise Exception("Too many args")
+    # the first argument is self
+    return class_type(*[MagicMock() for _ in range(number_of_args - 1)])
 
 
 def find_free_port():